@@ -0,0 +1,5 @@
+"""
+benchmarks
+
+Performance benchmarks for Upwind. See benchmarks/run.py.
+"""
@@ -0,0 +1,549 @@
+"""
+benchmarks/run.py
+
+Benchmark harness for the app's hot paths.
+
+Headless scenarios cover building the question pool, sampling a quiz (start_quiz),
+grading and building a full-pool answer review (show_results), parsing the study
+topics' markup, compiling and drawing the logo (draw_svg_elements_on_tkinter)
+and recording and rasterizing the airspace chart. Scenarios that need Tk cover the real
+screens: show_results, _create_airspace_graphic, navigation cycles through
+show_main_menu/show_study_page, and app startup.
+
+Every scenario is seeded and runs against a throwaway home directory, so the journal,
+review history and caches start out empty and the user's own files are never touched.
+A scenario is timed as several samples. Each sample repeats the call until it lasts at
+least MIN_SAMPLE_MS, and the time per call is reported. Results are written as JSON.
+--compare checks them against a baseline. It exits with status 1 when a scenario's
+median time is more than --threshold percent slower.
+
+Tk scenarios need a display. Without one, an Xvfb virtual display is started when Xvfb
+is installed; otherwise those scenarios are reported as skipped.
+
+Usage:
+python -m benchmarks.run --output baseline.json
+python -m benchmarks.run --compare baseline.json [--threshold 10] [--output current.json]
+python -m benchmarks.run --compare baseline.json --input current.json
+python -m benchmarks.run --list
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+from upwind import content_lint, diagrams, question_bank
+from upwind.artwork import svg_elements_data
+from upwind.exam_composer import ExamComposer
+from upwind.exam_forms import assemble_forms
+from upwind.near_duplicates import find_store_clusters
+from upwind.question_store import ListQuestionStore
+from upwind.quiz_session import QuizSession
+from upwind.results_review import build_review
+from upwind.study_content import get_study_topics
+from upwind.study_markup import parse_study_markup, study_text_sections
+from upwind.vector_art import RecordingCanvas, compile_svg_elements, draw_svg_elements_on_tkinter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "Upwind-103_Prep.py")
+RESULTS_VERSION = 1
+DEFAULT_SEED = 103
+DEFAULT_SAMPLES = 7
+DEFAULT_THRESHOLD = 10.0  # Percent
+MIN_SAMPLE_MS = 20.0
+MAX_CALLS_PER_SAMPLE = 1 << 16
+MIN_DELTA_MS = 0.005  # Differences smaller than this are timer noise, whatever the ratio
+METRIC = "median_ms"
+
+
+class ScenarioSkipped(Exception):
+    """ Raised by a scenario's setup when it can't run here (e.g. an optional dependency is missing). """
+
+
+class Scenario:
+    def __init__(self, name, description, setup, needs_display=False, self_timed=False):
+        self.name = name
+        self.description = description
+        self.setup = setup
+        self.needs_display = needs_display
+        self.self_timed = self_timed  # The callable returns its own measurement in ms
+
+
+SCENARIOS = []
+
+
+def scenario(name, description, needs_display=False, self_timed=False):
+    def register(setup):
+        SCENARIOS.append(Scenario(name, description, setup, needs_display, self_timed))
+        return setup
+    return register
+
+
+class BenchmarkContext:
+    """ State shared by the scenarios: the seed, a scratch directory and, on a display, one Tk root and app. """
+
+    def __init__(self, seed, work_dir, root=None):
+        self.seed = seed
+        self.work_dir = work_dir
+        self.root = root
+        self.cleanups = []
+        self._store = None
+        self._app = None
+
+    def rng(self):
+        return random.Random(self.seed)
+
+    @property
+    def store(self):
+        if self._store is None:
+            self._store = ListQuestionStore(question_bank.get_question_pool())
+        return self._store
+
+    @property
+    def app(self):
+        if self._app is None:
+            self._app = load_app_module().UltralightGroundSchoolApp(self.root)
+            self.root.update_idletasks()
+        return self._app
+
+    def window(self):
+        """ A fresh top-level window, destroyed after the scenario. """
+        window = tk.Toplevel(self.root)
+        self.cleanups.append(window.destroy)
+        return window
+
+    def run_cleanups(self):
+        while self.cleanups:
+            self.cleanups.pop()()
+
+
+def load_app_module():
+    """ Imports Upwind-103_Prep.py (not a valid module name) without running its __main__ block. """
+    module = sys.modules.get("upwind_app")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("upwind_app", APP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["upwind_app"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def _answered_session(context, num_questions=20, accuracy=0.7):
+    """ A finished, seeded quiz in which about accuracy of the answers are correct. """
+    rng = context.rng()
+    store = context.store
+    session = QuizSession.start(store, num_questions, composer=ExamComposer(store, rng), rng=rng)
+    while not session.is_finished():
+        question = session.current_question()
+        if rng.random() < accuracy:
+            session.answer(question['correct_answer'])
+        else:
+            session.answer(rng.choice([option for option in question['options'] if option != question['correct_answer']]))
+        session.advance()
+    return session
+
+
+# --- Headless scenarios ---
+@scenario("question_pool", "Build the built-in question pool and index it in a ListQuestionStore")
+def _question_pool(context):
+    return lambda: ListQuestionStore(question_bank.get_question_pool())
+
+
+@scenario("quiz_sampling", "Sample a balanced 20-question quiz, as start_quiz does")
+def _quiz_sampling(context):
+    store, rng = context.store, context.rng()
+    composer = ExamComposer(store, rng)
+    return lambda: QuizSession.start(store, num_questions=20, composer=composer, rng=rng)
+
+
+@scenario("results_grading", "Grade a finished 20-question quiz and load its explanations")
+def _results_grading(context):
+    return _answered_session(context).grade
+
+
+@scenario("results_review", "Grade a quiz over the whole pool and build its answer review")
+def _results_review(context):
+    session = _answered_session(context, len(context.store))
+    return lambda: build_review(session.grade())
+
+
+@scenario("exam_forms", "Assemble 10 disjoint, difficulty-balanced 20-question forms in-process (random difficulties)")
+def _exam_forms(context):
+    store, rng = ListQuestionStore(question_bank.get_question_pool()), context.rng()
+    store.set_item_parameters({question_id: {"difficulty": rng.gauss(0.0, 1.0)} for question_id in store.question_ids()})
+    return lambda: assemble_forms(store, 10, 20, seed=context.seed, workers=1)
+
+
+@scenario("near_duplicates", "MinHash/LSH near-duplicate clustering of the built-in pool")
+def _near_duplicates(context):
+    return lambda: find_store_clusters(context.store, seed=context.seed)
+
+
+@scenario("content_lint", "Re-lint a 20k-question JSONL bank after one question was edited (warm lint cache)")
+def _content_lint(context):
+    pool, rng = question_bank.get_question_pool(), context.rng()
+    lines = [json.dumps(dict(rng.choice(pool), question_text=f"Question {number}")) for number in range(20000)]
+    path, cache_dir = os.path.join(context.work_dir, "lint_bank.jsonl"), os.path.join(context.work_dir, "lint_cache")
+    edits = iter(range(1 << 30))
+
+    def write_bank():
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    write_bank()
+    content_lint.lint(path, study=False, cache_dir=cache_dir)
+
+    def run():
+        lines[1000] = json.dumps(dict(pool[0], question_text=f"Edited question {next(edits)}"))
+        write_bank()
+        return content_lint.lint(path, study=False, cache_dir=cache_dir)
+    return run
+
+
+@scenario("study_markup", "Parse every study topic's markup into tagged Text sections (uncached)")
+def _study_markup(context):
+    topics = list(get_study_topics("en").values())
+
+    def run():
+        parse_study_markup.cache_clear()
+        study_text_sections.cache_clear()
+        for text in topics:
+            study_text_sections(text)
+    return run
+
+
+@scenario("logo_compile", "Compile the logo's SVG elements into a display list (the first draw)")
+def _logo_compile(context):
+    return lambda: compile_svg_elements(svg_elements_data, 6, 6)
+
+
+@scenario("logo_draw", "draw_svg_elements_on_tkinter for the logo with a warm cache, onto a recording canvas")
+def _logo_draw(context):
+    return lambda: draw_svg_elements_on_tkinter(RecordingCanvas(), svg_elements_data, 6, 6)
+
+
+@scenario("airspace_record", "Record the airspace chart's drawing code into a display list")
+def _airspace_record(context):
+    return lambda: diagrams.draw_airspace_chart(RecordingCanvas(), diagrams.AIRSPACE_COLORS, diagrams.AIRSPACE_FONTS)
+
+
+@scenario("airspace_rasterize", "Rasterize the airspace chart with Pillow (a raster-cache miss)")
+def _airspace_rasterize(context):
+    if diagrams.Image is None:
+        raise ScenarioSkipped("Pillow is not installed")
+    diagram = diagrams.DIAGRAMS["airspace"]
+    display_list = diagram.display_list()
+    return lambda: diagrams.rasterize(display_list, diagram.width, diagram.height, 1.0, diagram.background())
+
+
+# --- Tk scenarios ---
+@scenario("logo_draw_tk", "Draw the logo onto a Tk canvas and flush it to the display", needs_display=True)
+def _logo_draw_tk(context):
+    canvas = tk.Canvas(context.window(), width=140, height=140, highlightthickness=0)
+    canvas.pack()
+
+    def run():
+        canvas.delete("all")
+        draw_svg_elements_on_tkinter(canvas, svg_elements_data, 6, 6)
+        canvas.update_idletasks()
+    return run
+
+
+@scenario("airspace_graphic", "_create_airspace_graphic on a study page frame, with a warm raster cache", needs_display=True)
+def _airspace_graphic(context):
+    app = context.app
+    window = context.window()
+
+    def run():
+        frame = tk.Frame(window)
+        frame.pack()
+        app._create_airspace_graphic(frame)
+        window.update_idletasks()
+        frame.destroy()
+    return run
+
+
+@scenario("show_results", "show_results for a finished 20-question quiz, including the journal and review updates",
+          needs_display=True)
+def _show_results(context):
+    app = context.app
+    session = _answered_session(context)
+
+    def run():
+        app.quiz_session = session
+        app.show_results()
+        app.master.update_idletasks()
+    context.cleanups.append(app.show_main_menu)
+    return run
+
+
+def _navigation_cycle(app):
+    """ Main menu, then every category and each of its study pages, back to the menu in between. """
+    app.show_main_menu()
+    for category, topics in app.study_categories.items():
+        app.show_main_menu(category)
+        app.master.update_idletasks()
+        for topic in topics:
+            app.show_study_page(topic)
+            app.master.update_idletasks()
+            app.show_main_menu(category)
+            app.master.update_idletasks()
+    app.show_main_menu()
+    app.master.update_idletasks()
+
+
+@scenario("navigation_cold", "Navigation cycle through every menu and study page, building each screen",
+          needs_display=True)
+def _navigation_cold(context):
+    app = context.app
+
+    def run():
+        app.views.invalidate()
+        _navigation_cycle(app)
+    return run
+
+
+@scenario("navigation_warm", "Navigation cycle through every menu and study page, reusing retained screens",
+          needs_display=True)
+def _navigation_warm(context):
+    app = context.app
+    return lambda: _navigation_cycle(app)
+
+
+@scenario("app_startup", "Launch the app until the main menu is interactive (from its startup report)",
+          needs_display=True, self_timed=True)
+def _app_startup(context):
+    report_path = os.path.join(context.work_dir, "startup.json")
+    command = [sys.executable, APP_PATH, "--exit-after-startup", "--startup-report", report_path]
+
+    def run():
+        subprocess.run(command, check=True, cwd=REPO_ROOT, stderr=subprocess.DEVNULL)
+        with open(report_path, encoding="utf-8") as f:
+            return json.load(f)["marks_ms"]["interactive"]
+    return run
+
+
+# --- Harness ---
+def open_display():
+    """
+    Returns (Tk root, description, Xvfb process or None), starting Xvfb when there is no
+    display. Returns (None, reason, None) when Tk can't be used.
+    """
+    try:
+        return tk.Tk(), os.environ.get("DISPLAY", "native"), None
+    except tk.TclError as error:
+        if shutil.which("Xvfb") is None:
+            return None, f"no display ({error}) and Xvfb is not installed", None
+    read_fd, write_fd = os.pipe()
+    xvfb = subprocess.Popen(["Xvfb", "-displayfd", str(write_fd), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        number = pipe.readline().strip()
+    if not number:
+        xvfb.terminate()
+        return None, "Xvfb failed to start", None
+    os.environ["DISPLAY"] = f":{number}"
+    try:
+        return tk.Tk(), f"Xvfb :{number}", xvfb
+    except tk.TclError as error:
+        xvfb.terminate()
+        return None, f"can't open the Xvfb display ({error})", None
+
+
+def measure(run, samples, self_timed=False):
+    """ Returns (milliseconds per call for each sample, calls per sample), after one warm-up call. """
+    run()
+    number = 1
+    if not self_timed:
+        while number < MAX_CALLS_PER_SAMPLE:
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            if (time.perf_counter() - start) * 1000 >= MIN_SAMPLE_MS:
+                break
+            number *= 2
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # Like timeit: collections triggered by earlier scenarios shouldn't land in this one's samples
+    try:
+        for _ in range(samples):
+            if self_timed:
+                times.append(float(run()))
+                continue
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            times.append((time.perf_counter() - start) * 1000 / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return times, number
+
+
+def summarize(times, number):
+    return {"median_ms": round(statistics.median(times), 4), "min_ms": round(min(times), 4),
+            "max_ms": round(max(times), 4), "mean_ms": round(statistics.fmean(times), 4),
+            "stdev_ms": round(statistics.stdev(times), 4) if len(times) > 1 else 0.0,
+            "samples": len(times), "calls_per_sample": number}
+
+
+def run_benchmarks(names=None, samples=DEFAULT_SAMPLES, seed=DEFAULT_SEED, use_display=True, log=sys.stderr):
+    """ Runs the selected scenarios (all by default) and returns the results document. """
+    selected = [s for s in SCENARIOS if names is None or s.name in names]
+    results = {"version": RESULTS_VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+               "python": platform.python_version(), "platform": platform.platform(), "seed": seed,
+               "samples": samples, "display": None, "scenarios": {}, "skipped": {}}
+    saved_env = {name: os.environ.get(name) for name in ("HOME", "USERPROFILE", "DISPLAY")}
+    root = xvfb = None
+    with tempfile.TemporaryDirectory(prefix="upwind-bench-") as work_dir:
+        home = os.path.join(work_dir, "home")
+        os.makedirs(home)
+        os.environ["HOME"] = os.environ["USERPROFILE"] = home
+        try:
+            if use_display and any(s.needs_display for s in selected):
+                root, results["display"], xvfb = open_display()
+                if root is None:
+                    display_problem, results["display"] = results["display"], None
+            else:
+                display_problem = "disabled with --no-display"
+            context = BenchmarkContext(seed, work_dir, root)
+            for s in selected:
+                if s.needs_display and root is None:
+                    results["skipped"][s.name] = display_problem
+                    continue
+                random.seed(seed)  # Code that uses the global generator (the app's quizzes) sees the same draws every run
+                try:
+                    run = s.setup(context)
+                    times, number = measure(run, samples, s.self_timed)
+                except ScenarioSkipped as reason:
+                    results["skipped"][s.name] = str(reason)
+                    continue
+                finally:
+                    context.run_cleanups()
+                results["scenarios"][s.name] = summary = summarize(times, number)
+                print(f"{s.name:<20} {summary['median_ms']:>10.3f} ms  (min {summary['min_ms']:.3f}, "
+                      f"{number} call(s) x {samples})", file=log)
+        finally:
+            if root is not None:
+                root.destroy()
+            if xvfb is not None:
+                xvfb.terminate()
+                xvfb.wait()
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+    for name, reason in results["skipped"].items():
+        print(f"{name:<20} skipped: {reason}", file=log)
+    return results
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, metric=METRIC):
+    """
+    Compares two results documents. Returns (rows, regressions), where each row is
+    (scenario, baseline ms, current ms, percent change or None, status).
+    """
+    rows, regressions = [], []
+    before, after = baseline["scenarios"], current["scenarios"]
+    for name in list(before) + [name for name in after if name not in before]:
+        if name not in after:
+            rows.append((name, before[name][metric], None, None, "missing"))
+            continue
+        if name not in before:
+            rows.append((name, None, after[name][metric], None, "new"))
+            continue
+        old, new = before[name][metric], after[name][metric]
+        change = (new - old) / old * 100 if old > 0 else 0.0
+        if change > threshold and new - old > MIN_DELTA_MS:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold and old - new > MIN_DELTA_MS:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, old, new, change, status))
+    return rows, regressions
+
+
+def format_comparison(rows, threshold, metric=METRIC):
+    def cell(value):
+        return f"{value:.3f}" if value is not None else "-"
+    lines = [f"{'scenario':<20} {'baseline':>10} {'current':>10} {'change':>8}  ({metric}, threshold {threshold:g}%)"]
+    for name, old, new, change, status in rows:
+        change_text = f"{change:+.1f}%" if change is not None else "-"
+        lines.append(f"{name:<20} {cell(old):>10} {cell(new):>10} {change_text:>8}  {status}")
+    return "\n".join(lines)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} benchmark results file.")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run",
+                                     description="Run the Upwind benchmarks and compare them against a baseline.")
+    parser.add_argument("--output", metavar="JSON", help="write the results to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against these results; exit 1 on a regression")
+    parser.add_argument("--input", metavar="JSON", help="with --compare: compare these saved results instead of running")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"percent slowdown of the median that counts as a regression (default {DEFAULT_THRESHOLD:g})")
+    parser.add_argument("--scenario", action="append", metavar="NAME", help="run only this scenario (repeatable)")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="timed samples per scenario")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--no-display", action="store_true", help="skip the scenarios that need Tk")
+    parser.add_argument("--list", action="store_true", help="list the scenarios and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for s in SCENARIOS:
+            print(f"{s.name:<20} {s.description}{' [display]' if s.needs_display else ''}")
+        return
+    known = {s.name for s in SCENARIOS}
+    unknown = [name for name in args.scenario or () if name not in known]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (see --list)")
+    if args.input and not args.compare:
+        parser.error("--input needs --compare")
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+
+    try:
+        baseline = load_results(args.compare) if args.compare else None
+        if args.input:
+            results = load_results(args.input)
+        else:
+            results = run_benchmarks(args.scenario, args.samples, args.seed, not args.no_display)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+        print(f"Wrote {args.output}.", file=sys.stderr)
+    if baseline is None:
+        return
+    rows, regressions = compare(baseline, results, args.threshold)
+    print(format_comparison(rows, args.threshold))
+    if regressions:
+        print(f"{len(regressions)} scenario(s) regressed by more than {args.threshold:g}%: {', '.join(regressions)}",
+              file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+upwind
+
+Support package for Upwind-103_Prep.py. Everything here except the GUI helpers runs
+without Tkinter, so the question bank and quiz tools can be used headless.
+"""
@@ -0,0 +1,272 @@
+"""
+upwind/adaptive_quiz.py
+
+Computerized adaptive testing (CAT) on top of the calibrated question bank.
+
+After every answer the learner's ability is re-estimated (EAP on a fixed theta grid with
+a standard normal prior) and the next question is the unanswered one with the highest
+Fisher information at that ability. The quiz stops once the standard error of the
+estimate drops below a threshold, which reaches the same pass/fail confidence as a
+fixed quiz in far fewer questions.
+
+Selection never scans the bank: ItemInformationTable precomputes, for every grid point,
+the few items with the most information there. A quiz never administers more than
+max_questions items, so the top max_questions + randomesque items per grid point are
+always enough, and picking the next item is a short walk down one precomputed list.
+
+Items with the same parameters are interchangeable, so the table ranks groups of items
+that share (a, b) and the session draws at random within a group. Items without
+calibration data use a = 1, b = 0 and so form one group: on an uncalibrated bank every
+question is equally likely, instead of ties always going to the same few items.
+"""
+
+import heapq
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from upwind.quiz_session import QuizSession
+
+THETA_GRID = [i / 10.0 for i in range(-40, 41)]
+DEFAULT_SE_THRESHOLD = 0.35
+DEFAULT_MIN_QUESTIONS = 5
+DEFAULT_MAX_QUESTIONS = 30
+# Pick at random among this many of the most informative items, so the same
+# handful of questions is not shown to every learner.
+DEFAULT_RANDOMESQUE = 3
+# Pass mark used to place the cut score, as the expected percentage correct over the whole bank.
+DEFAULT_PASSING_PERCENTAGE = 70.0
+
+
+def _probability(a, b, theta):
+    z = a * (theta - b)
+    if z < -30.0:
+        return 1e-13
+    if z > 30.0:
+        return 1.0 - 1e-13
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+class ItemInformationTable:
+    """
+    Per-grid-point lists of the most informative item groups, built once per bank. A group
+    holds the items that share one (discrimination, difficulty) pair.
+    """
+
+    def __init__(self, question_ids, item_parameters, depth):
+        self.question_ids = list(question_ids)
+        self.discrimination, self.difficulty = [], []
+        self.calibrated = 0  # Items with calibration data
+        group_of = {}
+        self.group_items = []
+        for item, question_id in enumerate(self.question_ids):
+            record = item_parameters.get(question_id) or {}
+            if record.get("difficulty") is not None:
+                self.calibrated += 1
+            a, b = record.get("discrimination") or 1.0, record.get("difficulty") or 0.0
+            self.discrimination.append(a)
+            self.difficulty.append(b)
+            group = group_of.setdefault((a, b), len(group_of))
+            if group == len(self.group_items):
+                self.group_items.append([])
+            self.group_items[group].append(item)
+        self.group_discrimination = [self.discrimination[items[0]] for items in self.group_items]
+        self.group_difficulty = [self.difficulty[items[0]] for items in self.group_items]
+        self.depth = min(depth, len(self.group_items))
+        self.top_groups = self._build()
+        self._cut_scores = {}
+
+    @classmethod
+    def from_store(cls, question_store, max_questions=DEFAULT_MAX_QUESTIONS, randomesque=DEFAULT_RANDOMESQUE):
+        return cls(question_store.question_ids(), question_store.get_item_parameters(), max_questions + randomesque)
+
+    def _build(self):
+        if not self.depth:
+            return [[] for _ in THETA_GRID]
+        if np is not None:
+            a = np.asarray(self.group_discrimination, dtype=np.float64)
+            b = np.asarray(self.group_difficulty, dtype=np.float64)
+            theta = np.asarray(THETA_GRID)[:, None]
+            p = 1.0 / (1.0 + np.exp(-np.clip(a * (theta - b), -30.0, 30.0)))
+            information = a * a * p * (1.0 - p)
+            depth = self.depth
+            top = np.argpartition(-information, depth - 1, axis=1)[:, :depth]
+            order = np.argsort(-np.take_along_axis(information, top, axis=1), axis=1, kind="stable")
+            return np.take_along_axis(top, order, axis=1).tolist()
+        top_groups = []
+        groups = range(len(self.group_items))
+        for theta in THETA_GRID:
+            information = [self._group_information(group, theta) for group in groups]
+            top_groups.append(heapq.nlargest(self.depth, groups, key=information.__getitem__))
+        return top_groups
+
+    def _group_information(self, group, theta):
+        a = self.group_discrimination[group]
+        p = _probability(a, self.group_difficulty[group], theta)
+        return a * a * p * (1.0 - p)
+
+    def information(self, item, theta):
+        a = self.discrimination[item]
+        p = _probability(a, self.difficulty[item], theta)
+        return a * a * p * (1.0 - p)
+
+    def expected_percentage(self, theta):
+        """ Expected percentage correct over the whole bank for a learner of ability theta. """
+        if np is not None:
+            a = np.asarray(self.discrimination)
+            p = 1.0 / (1.0 + np.exp(-np.clip(a * (theta - np.asarray(self.difficulty)), -30.0, 30.0)))
+            return float(p.mean()) * 100
+        return sum(_probability(a, b, theta) for a, b in zip(self.discrimination, self.difficulty)) \
+            / len(self.question_ids) * 100
+
+    def cut_score(self, passing_percentage=DEFAULT_PASSING_PERCENTAGE):
+        """ Ability at which the expected bank score equals passing_percentage (found by bisection). """
+        if passing_percentage not in self._cut_scores:
+            low, high = THETA_GRID[0], THETA_GRID[-1]
+            for _ in range(30):
+                middle = (low + high) / 2
+                if self.expected_percentage(middle) < passing_percentage:
+                    low = middle
+                else:
+                    high = middle
+            self._cut_scores[passing_percentage] = (low + high) / 2
+        return self._cut_scores[passing_percentage]
+
+    def candidates(self, theta):
+        """ Item groups in decreasing order of information at the grid point nearest theta. """
+        index = int(round((theta - THETA_GRID[0]) * 10))
+        return self.top_groups[min(max(index, 0), len(THETA_GRID) - 1)]
+
+
+class AbilityEstimate:
+    """ EAP ability estimate on THETA_GRID, updated in O(grid size) per answer. """
+
+    def __init__(self):
+        self.log_posterior = [-0.5 * theta * theta for theta in THETA_GRID]
+        self.theta, self.standard_error = 0.0, 1.0
+
+    def update(self, a, b, correct):
+        for i, theta in enumerate(THETA_GRID):
+            p = _probability(a, b, theta)
+            self.log_posterior[i] += math.log(p if correct else 1.0 - p)
+        peak = max(self.log_posterior)
+        weights = [math.exp(value - peak) for value in self.log_posterior]
+        total = sum(weights)
+        mean = sum(w * theta for w, theta in zip(weights, THETA_GRID)) / total
+        variance = sum(w * (theta - mean) ** 2 for w, theta in zip(weights, THETA_GRID)) / total
+        self.theta, self.standard_error = mean, math.sqrt(variance)
+
+    def probability_above(self, cut_score):
+        peak = max(self.log_posterior)
+        weights = [math.exp(value - peak) for value in self.log_posterior]
+        return sum(w for w, theta in zip(weights, THETA_GRID) if theta >= cut_score) / sum(weights)
+
+
+class AdaptiveSession(QuizSession):
+    """
+    A QuizSession whose questions are chosen one at a time. The GUI drives it exactly like
+    a fixed quiz; advance() scores the answer, updates the ability estimate and selects the
+    next question (or finishes the quiz).
+    """
+
+    def __init__(self, question_store, information_table, se_threshold=DEFAULT_SE_THRESHOLD,
+                 min_questions=DEFAULT_MIN_QUESTIONS, max_questions=DEFAULT_MAX_QUESTIONS,
+                 randomesque=DEFAULT_RANDOMESQUE, passing_percentage=DEFAULT_PASSING_PERCENTAGE, rng=None):
+        super().__init__([], [], question_store, rng)
+        self.table = information_table
+        self.se_threshold = se_threshold
+        self.min_questions = min_questions
+        self.max_questions = min(max_questions, len(information_table.question_ids))
+        self.randomesque = randomesque
+        self.passing_percentage = passing_percentage
+        self.ability = AbilityEstimate()
+        self._items = []
+        self._administered = set()
+        self._finished = False
+        self._select_next()
+
+    def _draw_from_group(self, group, count):
+        """ Up to count random unanswered items of one item group. """
+        items = self.table.group_items[group]
+        if len(items) > 2 * len(self._administered) + count:
+            # A large group (e.g. every uncalibrated item) is sampled rather than scanned.
+            drawn = set()
+            while len(drawn) < count:
+                item = self.rng.choice(items)
+                if item not in self._administered:
+                    drawn.add(item)
+            return list(drawn)
+        remaining = [item for item in items if item not in self._administered]
+        return self.rng.sample(remaining, min(count, len(remaining)))
+
+    def _select_next(self):
+        """ Appends one of the most informative unanswered items at the current ability estimate. """
+        choices = []
+        for group in self.table.candidates(self.ability.theta):
+            choices.extend(self._draw_from_group(group, self.randomesque - len(choices)))
+            if len(choices) == self.randomesque:
+                break
+        if not choices:
+            self._finished = True
+            return
+        item = self.rng.choice(choices)
+        question_id = self.table.question_ids[item]
+        self._items.append(item)
+        self._administered.add(item)
+        self.question_ids.append(question_id)
+        self.questions.extend(self.question_store.get_questions([question_id]))
+
+    def is_finished(self):
+        return self._finished or self.current_index >= len(self.questions)
+
+    def progress_text(self):
+        return f"Adaptive Question {self.current_index + 1} (up to {self.max_questions})"
+
+    def is_last_question(self):
+        # The quiz length is only known once the stopping rule fires.
+        return False
+
+    def should_stop(self):
+        answered = self.current_index
+        if answered >= self.max_questions:
+            return True
+        return answered >= self.min_questions and self.ability.standard_error < self.se_threshold
+
+    def _score_current(self):
+        item = self._items[self.current_index]
+        self.ability.update(self.table.discrimination[item], self.table.difficulty[item],
+                            self.is_correct(self.current_index))
+        self.current_index += 1
+
+    def advance(self):
+        if self.is_finished():
+            return
+        self._score_current()
+        if self.should_stop():
+            self._finished = True
+        else:
+            self._select_next()
+
+    def grade(self, explanations=None):
+        """ Grades the questions answered so far; a session ended early drops its unanswered question. """
+        if not self.is_finished() and self.current_index in self.answers:
+            self._score_current()
+        self._finished = True
+        del self.questions[self.current_index:], self.question_ids[self.current_index:]
+        return super().grade(explanations)
+
+    def probability_passing(self):
+        """ Posterior probability that the learner's ability is above the cut score. """
+        return self.ability.probability_above(self.table.cut_score(self.passing_percentage))
+
+
+def start_adaptive_session(question_store, information_table=None, rng=None, **options):
+    if information_table is None:
+        information_table = ItemInformationTable.from_store(
+            question_store, options.get("max_questions", DEFAULT_MAX_QUESTIONS),
+            options.get("randomesque", DEFAULT_RANDOMESQUE))
+    return AdaptiveSession(question_store, information_table, rng=rng if rng is not None else random, **options)
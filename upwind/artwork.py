@@ -0,0 +1,36 @@
+"""
+upwind/artwork.py
+
+Vector art drawn on the app's canvases, as simplified SVG element data (see vector_art).
+"""
+
+from upwind.vector_art import VectorArt
+
+# Logo at the top of the main menu
+svg_elements_data = [
+    {'type':'circle','cx':'62.419357','cy':'65.758064','r':'7.5483871','style':'opacity:1;fill:#ffffff;stroke:none;stroke-width:0.514016'},
+    {'type':'ellipse','cx':'-1.1778357','cy':'86.117943','rx':'34.085022','ry':'6.1921449','transform':'matrix(0.89688675,-0.44226029,0.44546856,0.89529758,0,0)','style':'opacity:1;fill:#ffffff;stroke:none;stroke-width:0.656621'},
+    {'type':'ellipse','cx':'54.199963','cy':'87.045128','rx':'34.085022','ry':'6.1921449','transform':'matrix(0.89688675,-0.44226029,0.44546856,0.89529758,0,0)','style':'opacity:1;fill:#ffffff;stroke:none;stroke-width:0.656621'},
+    {'type':'path','d':'M 11.540323,99.798388 62.709678,126.72581','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 21.33871,97.983872 62.637098,126.50807','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 46.01613,110.54032 21.120968,97.838711','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 24.604839,95.588711 45.653226,110.54032','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 40.862904,101.54032 24.75,95.588711','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 30.629033,94.35484 10.08871,7.25806','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 41.153226,96.677421 -10.451613,-2.25','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 35.129033,91.959679 5.951613,4.862903','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 40.354839,92.685485 34.983871,91.741937','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 39.919355,89.564517 0.362904,3.266129','style':'opacity:1;fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 108.87097,31.336156 57.70161,4.408734','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 99.072579,33.150672 57.77419,4.626474','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 74.395159,20.594224 99.290321,33.295833','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 95.80645,35.545833 74.758063,20.594224','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 79.548385,29.594224 16.112904,5.951609','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 89.782256,36.779704 -10.08871,-7.25806','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 79.258063,34.457123 10.451613,2.25','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 85.282256,39.174865 79.330643,34.311962','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'m 80.05645,38.449059 5.370968,0.943548','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+    {'type':'path','d':'M 80.491934,41.570027 80.12903,38.303898','style':'fill:none;stroke:#ffffff;stroke-width:0.514016'},
+]
+
+LOGO = VectorArt(svg_elements_data)
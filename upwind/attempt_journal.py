@@ -0,0 +1,209 @@
+"""
+upwind/attempt_journal.py
+
+Persistent log of every graded answer.
+
+Attempts are appended to a JSONL journal, one compact JSON array per answer:
+    [session_id, question_id, chosen_option, correct (0/1), timestamp]
+Every so often the journal is compacted: the running aggregates are written to a
+snapshot and the active journal is rotated into a numbered archive segment. Opening
+the journal loads the snapshot and replays only the records appended since, so startup
+stays fast no matter how many answers have been recorded. Archive segments are kept so
+offline tools (e.g. IRT calibration) can still read the full history.
+
+Question IDs only mean something within one bank, so every bank has its own journal:
+~/.upwind/journal for the built-in pool and ~/.upwind/journal/banks/<path hash> for a
+bank file (see default_journal_dir).
+
+Directory layout:
+    snapshot.json            aggregates + number of archived segments
+    attempts.jsonl           active journal
+    attempts-000001.jsonl    archived segments, oldest first
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+
+SNAPSHOT_VERSION = 1
+DEFAULT_COMPACT_EVERY = 50000
+
+AttemptRecord = namedtuple("AttemptRecord", "session_id question_id chosen correct timestamp")
+
+
+def default_journal_dir(bank_path=None):
+    """ The journal directory of the built-in pool (bank_path None) or of the bank file at bank_path. """
+    directory = os.path.join(os.path.expanduser("~"), ".upwind", "journal")
+    if bank_path is None:
+        return directory
+    digest = hashlib.sha1(os.path.abspath(bank_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(directory, "banks", digest)
+
+
+def records_from_session(session, timestamp=None):
+    """ Returns one AttemptRecord per question of a graded QuizSession. """
+    timestamp = time.time() if timestamp is None else timestamp
+    return [AttemptRecord(session.session_id, question_id, session.chosen_option(i), session.is_correct(i), timestamp)
+            for i, question_id in enumerate(session.question_ids)]
+
+
+class AttemptAggregates:
+    """
+    In-memory totals rebuilt from the snapshot plus journal replay. Their size depends on
+    the number of questions, not the number of recorded answers.
+    """
+
+    def __init__(self):
+        self.total_attempts = 0
+        self.total_correct = 0
+        self.session_count = 0
+        self.last_session_id = None
+        self.last_timestamp = None
+        self.question_stats = {}  # question_id -> [attempts, correct]
+
+    def apply(self, session_id, question_id, correct, timestamp):
+        self.total_attempts += 1
+        # A session's answers are always appended together, so a new ID means a new session.
+        if session_id != self.last_session_id:
+            self.session_count += 1
+            self.last_session_id = session_id
+        self.last_timestamp = timestamp
+        stats = self.question_stats.get(question_id)
+        if stats is None:
+            stats = self.question_stats[question_id] = [0, 0]
+        stats[0] += 1
+        if correct:
+            self.total_correct += 1
+            stats[1] += 1
+
+    @property
+    def percentage(self):
+        return (self.total_correct / self.total_attempts) * 100 if self.total_attempts else 0.0
+
+    def to_dict(self):
+        return {"total_attempts": self.total_attempts, "total_correct": self.total_correct,
+                "session_count": self.session_count, "last_session_id": self.last_session_id,
+                "last_timestamp": self.last_timestamp,
+                "question_stats": {str(k): v for k, v in self.question_stats.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        aggregates = cls()
+        aggregates.total_attempts = data["total_attempts"]
+        aggregates.total_correct = data["total_correct"]
+        aggregates.session_count = data["session_count"]
+        aggregates.last_session_id = data["last_session_id"]
+        aggregates.last_timestamp = data["last_timestamp"]
+        aggregates.question_stats = {int(k): v for k, v in data["question_stats"].items()}
+        return aggregates
+
+
+class AttemptJournal:
+    """ Append-only attempt log with snapshot compaction. """
+
+    def __init__(self, directory=None, compact_every=DEFAULT_COMPACT_EVERY):
+        self.directory = directory or default_journal_dir()
+        self.compact_every = compact_every
+        self.journal_path = os.path.join(self.directory, "attempts.jsonl")
+        self.snapshot_path = os.path.join(self.directory, "snapshot.json")
+        self.archived_segments = 0
+        self.aggregates = AttemptAggregates()
+        self._records_since_snapshot = 0
+        self._file = None
+        os.makedirs(self.directory, exist_ok=True)
+        self._load()
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, f"attempts-{number:06d}.jsonl")
+
+    def _load(self):
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            snapshot = None
+        if snapshot is not None and snapshot.get("version") == SNAPSHOT_VERSION:
+            self.archived_segments = snapshot["archived_segments"]
+            self.aggregates = AttemptAggregates.from_dict(snapshot["aggregates"])
+            # A crash between writing the snapshot and rotating the journal leaves the
+            # already-counted records in the active file; finish the rotation now.
+            last_segment = self._segment_path(self.archived_segments)
+            if self.archived_segments and not os.path.exists(last_segment) and os.path.exists(self.journal_path):
+                os.replace(self.journal_path, last_segment)
+        self._replay_active()
+
+    def _replay_active(self):
+        """ Replays the active journal into the aggregates, dropping a torn final line if present. """
+        good_offset = 0
+        try:
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        session_id, question_id, _, correct, timestamp = json.loads(line)
+                    except ValueError:
+                        break
+                    self.aggregates.apply(session_id, question_id, correct, timestamp)
+                    self._records_since_snapshot += 1
+                    good_offset += len(line)
+        except FileNotFoundError:
+            return
+        if good_offset != os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_offset)
+
+    def append(self, records):
+        """ Appends AttemptRecords, updates the aggregates and compacts when the journal is due. """
+        if self._file is None:
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        lines = []
+        for record in records:
+            correct = 1 if record.correct else 0
+            lines.append(json.dumps([record.session_id, record.question_id, record.chosen, correct,
+                                     round(record.timestamp, 3)], ensure_ascii=False, separators=(",", ":")))
+            self.aggregates.apply(record.session_id, record.question_id, correct, record.timestamp)
+        if not lines:
+            return
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+        self._records_since_snapshot += len(lines)
+        if self._records_since_snapshot >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """ Writes a snapshot of the aggregates and rotates the active journal into an archive segment. """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if not os.path.exists(self.journal_path):
+            return
+        snapshot = {"version": SNAPSHOT_VERSION, "archived_segments": self.archived_segments + 1,
+                    "aggregates": self.aggregates.to_dict()}
+        with open(self.snapshot_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(self.snapshot_path + ".tmp", self.snapshot_path)
+        self.archived_segments += 1
+        os.replace(self.journal_path, self._segment_path(self.archived_segments))
+        self._records_since_snapshot = 0
+
+    def iter_records(self):
+        """ Yields every AttemptRecord ever written, oldest first (archived segments, then the active journal). """
+        paths = [self._segment_path(n) for n in range(1, self.archived_segments + 1)] + [self.journal_path]
+        if self._file is not None:
+            self._file.flush()
+        for path in paths:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.endswith("\n"):
+                            yield AttemptRecord(*json.loads(line))
+            except FileNotFoundError:
+                continue
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,295 @@
+"""
+upwind/bulk_grader.py
+
+Bulk grading for whole classes and archived exam batches.
+
+Submissions are streamed from CSV or JSONL in fixed-size chunks. Each chunk is encoded
+into a compact integer answer matrix in coordinate form (row, question column, chosen
+option index) and graded in one pass with array operations, so memory stays bounded
+by the chunk size and the number of distinct questions, however large the file is.
+NumPy is used when it is installed; otherwise the same arrays are graded in pure Python.
+
+Input formats:
+JSONL: {"learner_id": "s001", "answers": {"12": "254 pounds", "40": 2, ...}}
+       (answers are option text, or an option index into the bank's option order)
+CSV:   learner_id,question_id,answer   (one row per answer, rows of one learner together;
+       a learner whose rows are split up is an error rather than being graded twice)
+
+Usage:
+python -m upwind.bulk_grader submissions.jsonl --scores scores.csv --misses misses.csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from upwind.question_store import open_question_store
+from upwind.quiz_session import NO_ANSWER
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# Answer codes stored in the matrix alongside real option indices (0-3).
+BLANK_ANSWER = -1
+UNKNOWN_ANSWER = -2
+
+
+class AnswerKey:
+    """
+    Maps question IDs to dense column numbers and answer text to option indices.
+    Questions are fetched from the store the first time a submission mentions them.
+    IDs the bank doesn't contain get no column; they are collected in unknown_ids.
+    """
+
+    def __init__(self, question_store):
+        self.question_store = question_store
+        self.question_ids = []
+        self.column_of = {}
+        self.option_lookup = []
+        self.correct = array('b')
+        self.unknown_ids = set()
+        self._bank_ids = None
+
+    def __len__(self):
+        return len(self.question_ids)
+
+    def load(self, question_ids):
+        missing = [question_id for question_id in set(question_ids) if question_id not in self.column_of]
+        if not missing:
+            return
+        if self._bank_ids is None:
+            self._bank_ids = set(self.question_store.question_ids())
+        self.unknown_ids.update(question_id for question_id in missing if question_id not in self._bank_ids)
+        missing = [question_id for question_id in missing if question_id in self._bank_ids]
+        for question_id, question in zip(missing, self.question_store.get_questions(missing)):
+            options = question['options']
+            self.column_of[question_id] = len(self.question_ids)
+            self.question_ids.append(question_id)
+            self.option_lookup.append({option: i for i, option in enumerate(options)})
+            self.correct.append(question.correct_index)
+
+    def encode(self, column, answer):
+        if isinstance(answer, int):
+            return answer if 0 <= answer < len(self.option_lookup[column]) else UNKNOWN_ANSWER
+        if answer is None or answer == "" or answer == NO_ANSWER:
+            return BLANK_ANSWER
+        return self.option_lookup[column].get(answer, UNKNOWN_ANSWER)
+
+
+class AnswerChunk:
+    """
+    One chunk of submissions as coordinate arrays: answers[i] was given by learner rows[i]
+    to columns[i]. Answers to questions that aren't in the bank are only counted.
+    """
+
+    def __init__(self, learner_ids, rows, columns, answers, unknown_answers=0):
+        self.learner_ids = learner_ids
+        self.rows = rows
+        self.columns = columns
+        self.answers = answers
+        self.unknown_answers = unknown_answers
+
+
+class BulkGradeResult:
+    """ Aggregate outcome of a bulk grading run; per-learner scores are streamed, not kept. """
+
+    def __init__(self, answer_key, learners, presented, missed, unknown_answers=0):
+        self.answer_key = answer_key
+        self.learners = learners
+        self.presented = presented
+        self.missed = missed
+        self.unknown_answers = unknown_answers  # Answers to question IDs the bank doesn't contain
+
+    def question_misses(self):
+        """ Returns (question_id, presented, missed) tuples, most-missed first. """
+        rows = [(question_id, self.presented[column], self.missed[column])
+                for column, question_id in enumerate(self.answer_key.question_ids)]
+        rows.sort(key=lambda row: (-row[2], row[0]))
+        return rows
+
+
+def read_submissions(path, file_format=None):
+    """
+    Yields (learner_id, {question_id: answer}) pairs from a CSV or JSONL file. Raises
+    ValueError when a learner's CSV rows are not all together.
+    """
+    file_format = file_format or ("csv" if path.endswith(".csv") else "jsonl")
+    with open(path, newline="", encoding="utf-8") as f:
+        if file_format == "jsonl":
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield str(record["learner_id"]), {int(k): v for k, v in record["answers"].items()}
+        else:
+            learner_id, answers, finished = None, {}, set()
+            reader = csv.DictReader(f)
+            for row in reader:
+                if row["learner_id"] != learner_id:
+                    if learner_id is not None:
+                        finished.add(learner_id)
+                        yield learner_id, answers
+                    learner_id, answers = row["learner_id"], {}
+                    if learner_id in finished:
+                        raise ValueError(f"{path}, line {reader.line_num}: rows of learner {learner_id} are not "
+                                         "all together (sort the file by learner_id)")
+                answers[int(row["question_id"])] = row["answer"]
+            if learner_id is not None:
+                yield learner_id, answers
+
+
+def encode_chunks(submissions, answer_key, chunk_size=DEFAULT_CHUNK_SIZE):
+    """ Groups submissions into AnswerChunks of at most chunk_size learners. """
+    batch = []
+    for submission in submissions:
+        batch.append(submission)
+        if len(batch) == chunk_size:
+            yield _encode_batch(batch, answer_key)
+            batch = []
+    if batch:
+        yield _encode_batch(batch, answer_key)
+
+
+def _encode_batch(batch, answer_key):
+    answer_key.load(question_id for _, answers in batch for question_id in answers)
+    column_of = answer_key.column_of
+    learner_ids, rows, columns, codes = [], array('q'), array('q'), array('b')
+    unknown_answers = 0
+    for row, (learner_id, answers) in enumerate(batch):
+        learner_ids.append(learner_id)
+        for question_id, answer in answers.items():
+            column = column_of.get(question_id)
+            if column is None:
+                unknown_answers += 1
+                continue
+            rows.append(row)
+            columns.append(column)
+            codes.append(answer_key.encode(column, answer))
+    return AnswerChunk(learner_ids, rows, columns, codes, unknown_answers)
+
+
+def grade_chunk(chunk, answer_key, presented, missed):
+    """
+    Grades one chunk. Adds each question's counts into `presented` and `missed` (indexed
+    by column) and returns per-learner (answered, correct) count sequences.
+    """
+    num_rows = len(chunk.learner_ids)
+    if np is not None:
+        rows = np.frombuffer(chunk.rows, dtype=np.int64)
+        columns = np.frombuffer(chunk.columns, dtype=np.int64)
+        answers = np.frombuffer(chunk.answers, dtype=np.int8)
+        key = np.frombuffer(answer_key.correct, dtype=np.int8)
+        is_correct = answers == key[columns]
+        answered = np.bincount(rows, minlength=num_rows)
+        correct = np.bincount(rows[is_correct], minlength=num_rows)
+        chunk_presented = np.bincount(columns, minlength=len(answer_key))
+        chunk_missed = np.bincount(columns[~is_correct], minlength=len(answer_key))
+        presented += chunk_presented
+        missed += chunk_missed
+        return answered.tolist(), correct.tolist()
+
+    key = answer_key.correct
+    answered, correct = [0] * num_rows, [0] * num_rows
+    for row, column, answer in zip(chunk.rows, chunk.columns, chunk.answers):
+        answered[row] += 1
+        presented[column] += 1
+        if answer == key[column]:
+            correct[row] += 1
+        else:
+            missed[column] += 1
+    return answered, correct
+
+
+def grade_submissions(submissions, question_store, chunk_size=DEFAULT_CHUNK_SIZE, on_scores=None):
+    """
+    Grades an iterable of (learner_id, {question_id: answer}) submissions chunk by chunk.
+    on_scores(learner_ids, answered, correct) is called once per chunk with that chunk's
+    per-learner counts; the returned BulkGradeResult holds the per-question totals.
+    """
+    answer_key = AnswerKey(question_store)
+    presented, missed = _new_counts(0), _new_counts(0)
+    learners = unknown_answers = 0
+    for chunk in encode_chunks(submissions, answer_key, chunk_size):
+        # New questions seen in this chunk get fresh zeroed counters.
+        if len(answer_key) > len(missed):
+            presented = _grow_counts(presented, len(answer_key))
+            missed = _grow_counts(missed, len(answer_key))
+        answered, correct = grade_chunk(chunk, answer_key, presented, missed)
+        learners += len(chunk.learner_ids)
+        unknown_answers += chunk.unknown_answers
+        if on_scores is not None:
+            on_scores(chunk.learner_ids, answered, correct)
+    return BulkGradeResult(answer_key, learners, [int(n) for n in presented], [int(n) for n in missed],
+                           unknown_answers)
+
+
+def _new_counts(size):
+    return np.zeros(size, dtype=np.int64) if np is not None else [0] * size
+
+
+def _grow_counts(counts, size):
+    grown = _new_counts(size)
+    grown[:len(counts)] = counts
+    return grown
+
+
+def grade_file(path, question_store, scores_out=None, chunk_size=DEFAULT_CHUNK_SIZE, file_format=None):
+    """ Grades a CSV/JSONL submissions file, writing per-learner scores as CSV to scores_out if given. """
+    on_scores = None
+    if scores_out is not None:
+        writer = csv.writer(scores_out)
+        writer.writerow(["learner_id", "answered", "correct", "percentage"])
+
+        def on_scores(learner_ids, answered, correct):
+            writer.writerows((learner_id, total, right, f"{(right / total) * 100 if total else 0.0:.2f}")
+                             for learner_id, total, right in zip(learner_ids, answered, correct))
+
+    return grade_submissions(read_submissions(path, file_format), question_store, chunk_size, on_scores)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.bulk_grader",
+                                     description="Grade CSV/JSONL answer sheets in bulk.")
+    parser.add_argument("submissions", help="CSV or JSONL submissions file")
+    parser.add_argument("--question-bank", metavar="PATH", help="question bank (default: built-in pool)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: from file extension)")
+    parser.add_argument("--scores", metavar="CSV", help="write per-learner scores here")
+    parser.add_argument("--misses", metavar="CSV", help="write per-question miss counts here")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="learners graded per chunk")
+    args = parser.parse_args(argv)
+
+    store = open_question_store(args.question_bank)
+    scores_out = open(args.scores, "w", newline="", encoding="utf-8") if args.scores else None
+    try:
+        result = grade_file(args.submissions, store, scores_out, args.chunk_size, args.format)
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        if scores_out is not None:
+            scores_out.close()
+        store.close()
+
+    misses = result.question_misses()
+    if args.misses:
+        with open(args.misses, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["question_id", "presented", "missed", "miss_rate"])
+            writer.writerows((question_id, shown, missed, f"{missed / shown:.4f}" if shown else "0.0000")
+                             for question_id, shown, missed in misses)
+    print(f"Graded {result.learners} submissions covering {len(misses)} questions.", file=sys.stderr)
+    if result.unknown_answers:
+        unknown_ids = sorted(result.answer_key.unknown_ids)
+        examples = ", ".join(map(str, unknown_ids[:10])) + (", ..." if len(unknown_ids) > 10 else "")
+        print(f"Skipped {result.unknown_answers} answers to {len(unknown_ids)} question IDs that are not in the bank "
+              f"({examples}).", file=sys.stderr)
+    for question_id, shown, missed in misses[:5]:
+        print(f"  Question {question_id}: missed {missed} of {shown}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+upwind/content_pack.py
+
+Compiled study-content pack.
+
+The build step dedents every topic of every language in upwind/study_content.py once and
+writes a single pack file: a small JSON index followed by one zlib-compressed blob per
+topic. At runtime the pack is memory-mapped and only the index is parsed; a topic is
+decompressed the first time it is opened. Startup cost therefore does not grow with the
+number of topics or languages.
+
+File layout:
+    b"UPWNDPK1", u64 index length (little endian), JSON index, blobs
+    index = {"version": 1, "source_mtime_ns": ..., "languages": {language: [[title, offset, length], ...]}}
+
+The app builds the pack on demand (into ~/.upwind/cache/) when it is missing or older
+than study_content.py.
+
+Usage:
+python -m upwind.content_pack [--output study_content.pack]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+
+PACK_VERSION = 1
+PACK_MAGIC = b"UPWNDPK1"
+DECODED_CACHE_SIZE = 32
+_SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "study_content.py")
+
+
+def default_pack_path():
+    return os.path.join(os.path.expanduser("~"), ".upwind", "cache", "study_content.pack")
+
+
+def _source_mtime_ns():
+    try:
+        return os.stat(_SOURCE_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def build_pack(path, languages=None):
+    """ Compiles {language: {title: text}} (default: everything in study_content) into a pack at path. """
+    if languages is None:
+        from upwind.study_content import STUDY_TOPICS_BY_LANGUAGE
+        languages = {language: topics() for language, topics in STUDY_TOPICS_BY_LANGUAGE.items()}
+    index = {"version": PACK_VERSION, "source_mtime_ns": _source_mtime_ns(), "languages": {}}
+    blobs, offset = [], 0
+    for language, topics in languages.items():
+        entries = index["languages"][language] = []
+        for title, text in topics.items():
+            blob = zlib.compress(text.encode("utf-8"), 9)
+            entries.append([title, offset, len(blob)])
+            blobs.append(blob)
+            offset += len(blob)
+    header = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        f.write(PACK_MAGIC + struct.pack("<Q", len(header)) + header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(path + ".tmp", path)
+
+
+class ContentPack:
+    """ Read-only view of a pack file; topics are decompressed on first access. """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(PACK_MAGIC)] != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a study-content pack.")
+        offset = len(PACK_MAGIC) + 8
+        (header_length,) = struct.unpack_from("<Q", self._map, len(PACK_MAGIC))
+        self.index = json.loads(self._map[offset:offset + header_length])
+        if self.index.get("version") != PACK_VERSION:
+            self.close()
+            raise ValueError(f"{path} was built by an incompatible version.")
+        self._data_start = offset + header_length
+        self._entries = {language: OrderedDict((title, (start, length)) for title, start, length in entries)
+                         for language, entries in self.index["languages"].items()}
+        self._decoded = OrderedDict()
+
+    @property
+    def languages(self):
+        return list(self._entries)
+
+    def is_current(self):
+        """ False when study_content.py has changed since the pack was built. """
+        mtime = _source_mtime_ns()
+        return mtime is None or mtime == self.index.get("source_mtime_ns")
+
+    def titles(self, language="en"):
+        return list(self._entries[language])
+
+    def get_topic(self, title, language="en"):
+        key = (language, title)
+        text = self._decoded.get(key)
+        if text is None:
+            start, length = self._entries[language][title]
+            start += self._data_start
+            text = zlib.decompress(self._map[start:start + length]).decode("utf-8")
+            self._decoded[key] = text
+            if len(self._decoded) > DECODED_CACHE_SIZE:
+                self._decoded.popitem(last=False)
+        else:
+            self._decoded.move_to_end(key)
+        return text
+
+    def topics(self, language="en"):
+        return StudyContent(self, language)
+
+    def close(self):
+        self._map.close()
+
+
+class StudyContent(Mapping):
+    """ {title: text} for one language of a pack, decoding each topic on access. """
+
+    def __init__(self, pack, language):
+        self.pack = pack
+        self.language = language
+        self._entries = pack._entries[language]
+
+    def __getitem__(self, title):
+        if title not in self._entries:
+            raise KeyError(title)
+        return self.pack.get_topic(title, self.language)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, title):
+        return title in self._entries
+
+
+def load_study_content(language="en", path=None):
+    """
+    Returns the study topics for language from the pack at path, (re)building the pack
+    first when it is missing or stale. Falls back to the uncompiled source if the pack
+    can't be written.
+    """
+    path = path or default_pack_path()
+    try:
+        pack = ContentPack(path)
+        if pack.is_current():
+            return pack.topics(language)
+        pack.close()
+    except (OSError, ValueError):
+        pass
+    try:
+        build_pack(path)
+        return ContentPack(path).topics(language)
+    except OSError:
+        from upwind.study_content import get_study_topics
+        return get_study_topics(language)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.content_pack",
+                                     description="Compile the study topics into a content pack.")
+    parser.add_argument("--output", metavar="PATH", help=f"pack file to write (default: {default_pack_path()})")
+    args = parser.parse_args(argv)
+
+    path = args.output or default_pack_path()
+    build_pack(path)
+    pack = ContentPack(path)
+    counts = ", ".join(f"{language}: {len(pack.titles(language))} topics" for language in pack.languages)
+    print(f"Wrote {path} ({os.path.getsize(path):,} bytes; {counts}).", file=sys.stderr)
+    pack.close()
+
+
+if __name__ == "__main__":
+    main()
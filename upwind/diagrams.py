@@ -0,0 +1,377 @@
+"""
+upwind/diagrams.py
+
+Static diagrams shown in the study pages, with a raster cache and print export.
+
+Each diagram is ordinary canvas drawing code. It is recorded once per theme (colors and
+fonts) into a DisplayList, which can then be:
+    - replayed onto a Tk canvas,
+    - rasterized to a PNG with Pillow, cached under ~/.upwind/cache/diagrams/ and shown
+      as a single PhotoImage on later visits (file names carry the size, scale and a
+      fingerprint of the drawing, so a theme change never shows a stale image),
+    - exported as PostScript through a hidden Tk canvas.
+
+Pillow is optional; without it the app replays the display list instead.
+
+Usage:
+python -m upwind.diagrams --output handouts/ [--dpi 300] [--format png ps]
+"""
+
+import argparse
+import os
+import sys
+import tkinter as tk
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+from upwind.artwork import LOGO
+from upwind.vector_art import RecordingCanvas
+
+SCREEN_DPI = 96
+SUPERSAMPLE = 2  # Rasterize at twice the size and downsample, for anti-aliased edges and text
+AIRSPACE_WIDTH = 850
+AIRSPACE_HEIGHT = 650
+
+# Define colors and fonts for easy modification of Airspace Chart
+AIRSPACE_COLORS = {
+    "class_a": "#a92a34",
+    "class_e_main": "#2a623d",
+    "class_g": "#98c09f",
+    "class_b_dark": "#4a63a2",
+    "class_b_light": "#6c82c3",
+    "class_c_dark": "#8e477f",
+    "class_c_light": "#b06ca6",
+    "class_d_dark": "#2a83a2",
+    "class_d_light": "#4fa5c4",
+    "background": "#ffffff",
+    "text_light": "#ffffff",
+    "text_dark": "#000000",
+    "line_color": "#333333"
+}
+AIRSPACE_FONTS = {
+    "main_title": ("Helvetica", 18, "bold"),
+    "class_label": ("Helvetica", 14, "bold"),
+    "altitude_label": ("Helvetica", 10, "bold"),
+    "legend_label": ("Helvetica", 10, "normal"),
+    "legend_title": ("Helvetica", 10, "bold"),
+}
+
+
+def default_cache_dir():
+    return os.path.join(os.path.expanduser("~"), ".upwind", "cache", "diagrams")
+
+
+# --- Drawing code ---
+def _draw_cylinder(canvas, x_center, y_top, y_bottom, radius, dark_color, light_color, line_color):
+    """Helper function to draw a 3D cylinder with a highlight."""
+    # Main cylinder body
+    canvas.create_rectangle(x_center - radius, y_top, x_center + radius, y_bottom,
+                            fill=dark_color, outline="")
+    # Highlight/Sheen for 3D effect
+    canvas.create_rectangle(x_center - radius / 2, y_top, x_center + radius / 2, y_bottom,
+                            fill=light_color, outline="")
+    # Top cap of the cylinder
+    canvas.create_oval(x_center - radius, y_top - 8, x_center + radius, y_top + 8,
+                       fill=dark_color, outline=line_color)
+    canvas.create_oval(x_center - radius + 5, y_top - 5, x_center + radius - 5, y_top + 5,
+                       fill=light_color, outline="")
+
+def draw_airspace_chart(canvas, colors, fonts, canvas_width=AIRSPACE_WIDTH):
+    """
+    Draws a detailed profile view of US airspace classes.
+    """
+    # --- Y-Axis Altitude Coordinates ---
+    y_top_text = 30
+    y_fl600 = 60
+    y_180 = 90
+    y_145 = 130
+    y_class_b_shelf_1 = 250
+    y_class_b_shelf_2 = 350
+    y_1200_agl = 420
+    y_700_agl = 450
+    y_surface = 500
+
+    # --- Background Layers (A, E, G) ---
+    canvas.create_rectangle(0, y_fl600, canvas_width, y_180, fill=colors["class_a"], outline="")
+    canvas.create_rectangle(0, y_180, canvas_width, y_surface, fill=colors["class_e_main"], outline="")
+
+    # Class G floor (creates the stepped look for Class E's floor)
+    canvas.create_polygon(
+        0, y_surface,
+        200, y_surface,
+        200, y_700_agl,
+        380, y_700_agl,
+        380, y_surface,
+        550, y_surface,
+        550, y_1200_agl,
+        canvas_width, y_1200_agl,
+        canvas_width, y_surface,
+        fill=colors["class_g"], outline=""
+    )
+    canvas.create_line(0, y_surface, canvas_width, y_surface, width=2) # Ground line
+
+    # --- Class B Airspace (Blue Stacked Cylinders) ---
+    x_b_center = 290
+    # Tiers (top down)
+    _draw_cylinder(canvas, x_b_center, y_145, y_class_b_shelf_1, 100, colors["class_b_dark"], colors["class_b_light"], colors["line_color"])
+    _draw_cylinder(canvas, x_b_center, y_class_b_shelf_1, y_class_b_shelf_2, 70, colors["class_b_dark"], colors["class_b_light"], colors["line_color"])
+    _draw_cylinder(canvas, x_b_center, y_class_b_shelf_2, y_surface, 40, colors["class_b_dark"], colors["class_b_light"], colors["line_color"])
+    # Bottom dashed line for airport area
+    canvas.create_oval(x_b_center - 40, y_surface - 8, x_b_center + 40, y_surface + 8,
+                       outline=colors["text_light"], width=2, dash=(4, 4))
+    # Airport symbol
+    canvas.create_line(x_b_center - 12, y_surface - 12, x_b_center + 12, y_surface + 12, width=2, fill=colors["text_light"])
+    canvas.create_line(x_b_center - 12, y_surface + 12, x_b_center + 12, y_surface - 12, width=2, fill=colors["text_light"])
+
+    # --- Class C Airspace (Purple Stacked Cylinders) ---
+    x_c_center = 480
+    _draw_cylinder(canvas, x_c_center, 320, 380, 60, colors["class_c_dark"], colors["class_c_light"], colors["line_color"])
+    _draw_cylinder(canvas, x_c_center, 380, y_surface, 40, colors["class_c_dark"], colors["class_c_light"], colors["line_color"])
+    canvas.create_oval(x_c_center - 40, y_surface - 8, x_c_center + 40, y_surface + 8,
+                       outline=colors["text_light"], width=2, dash=(4, 4))
+    canvas.create_line(x_c_center - 12, y_surface - 12, x_c_center + 12, y_surface + 12, width=2, fill=colors["text_light"])
+    canvas.create_line(x_c_center - 12, y_surface + 12, x_c_center + 12, y_surface - 12, width=2, fill=colors["text_light"])
+
+    # --- Class D Airspace (Cyan Cylinder) ---
+    x_d_center = 650
+    _draw_cylinder(canvas, x_d_center, 350, y_surface, 50, colors["class_d_dark"], colors["class_d_light"], colors["line_color"])
+    canvas.create_oval(x_d_center - 50, y_surface - 8, x_d_center + 50, y_surface + 8,
+                       outline=colors["text_light"], width=2, dash=(4, 4))
+    canvas.create_line(x_d_center - 12, y_surface - 12, x_d_center + 12, y_surface + 12, width=2, fill=colors["text_light"])
+    canvas.create_line(x_d_center - 12, y_surface + 12, x_d_center + 12, y_surface - 12, width=2, fill=colors["text_light"])
+
+    # --- Text Labels ---
+    canvas.create_text(50, y_top_text, text="Upper Limit Undefined", font=fonts["altitude_label"], anchor="w")
+    canvas.create_text(425, y_fl600 + 15, text="CLASS A", font=fonts["class_label"], fill=colors["text_light"])
+    canvas.create_text(x_b_center, y_145 + 40, text="CLASS B", font=fonts["class_label"], fill=colors["text_light"])
+    canvas.create_text(x_c_center, 350, text="CLASS C", font=fonts["class_label"], fill=colors["text_light"])
+    canvas.create_text(x_d_center, 380, text="CLASS D", font=fonts["class_label"], fill=colors["text_light"])
+    canvas.create_text(420, y_700_agl + 15, text="CLASS G", font=fonts["legend_title"])
+    canvas.create_text(590, y_1200_agl + 15, text="CLASS G", font=fonts["legend_title"])
+
+    # --- Altitude Labels and Lines ---
+    canvas.create_text(40, y_fl600 + 15, text="FL 600\n18,000' MSL", font=fonts["altitude_label"], fill=colors["text_light"], anchor="w")
+    canvas.create_line(0, y_145, 100, y_145, fill=colors["text_light"])
+    canvas.create_text(105, y_145, text="14,500' MSL", font=fonts["altitude_label"], fill=colors["text_light"], anchor="w")
+    canvas.create_line(200, y_700_agl, 180, y_700_agl, fill=colors["text_dark"])
+    canvas.create_text(175, y_700_agl, text="700' AGL", font=fonts["altitude_label"], fill=colors["text_dark"], anchor="e")
+    canvas.create_line(550, y_1200_agl, 530, y_1200_agl, fill=colors["text_dark"])
+    canvas.create_text(525, y_1200_agl, text="1,200' AGL", font=fonts["altitude_label"], fill=colors["text_dark"], anchor="e")
+
+    # --- Legend at the bottom ---
+    legend_y_start = 550
+    legend_x_start = 50
+    canvas.create_text(legend_x_start, legend_y_start, text="AGL", font=fonts["legend_title"], anchor="w")
+    canvas.create_text(legend_x_start + 40, legend_y_start, text="Above Ground Level", font=fonts["legend_label"], anchor="w")
+    canvas.create_text(legend_x_start, legend_y_start + 20, text="FL", font=fonts["legend_title"], anchor="w")
+    canvas.create_text(legend_x_start + 40, legend_y_start + 20, text="Flight Level", font=fonts["legend_label"], anchor="w")
+    canvas.create_text(legend_x_start, legend_y_start + 40, text="MSL", font=fonts["legend_title"], anchor="w")
+    canvas.create_text(legend_x_start + 40, legend_y_start + 40, text="Mean Sea Level", font=fonts["legend_label"], anchor="w")
+
+    legend_x_start_2 = 400
+    canvas.create_text(legend_x_start_2, legend_y_start, text="*", font=fonts["legend_label"], anchor="w")
+    canvas.create_text(legend_x_start_2 + 20, legend_y_start, text="Airport in Class G without IAP", font=fonts["legend_label"], anchor="w")
+    canvas.create_text(legend_x_start_2, legend_y_start + 20, text="**", font=fonts["legend_label"], anchor="w")
+    canvas.create_text(legend_x_start_2 + 20, legend_y_start + 20, text="Airport in Class G with IAP", font=fonts["legend_label"], anchor="w")
+    canvas.create_text(legend_x_start_2, legend_y_start + 40, text="***", font=fonts["legend_label"], anchor="w")
+    canvas.create_text(legend_x_start_2 + 20, legend_y_start + 40, text="Airport in Class E with IAP", font=fonts["legend_label"], anchor="w")
+
+    canvas.create_text(canvas_width - 20, legend_y_start + 60, text="Airspace Volumes Not to Scale", font=fonts["legend_label"], anchor="e")
+
+
+def draw_logo(canvas, colors, fonts):
+    canvas.create_oval(2, 2, 138, 138, fill=colors["accent"], outline="")
+    LOGO.draw(canvas, x_offset=6, y_offset=6)
+
+
+# --- Diagram registry ---
+class Diagram:
+    def __init__(self, name, title, width, height, draw, colors, fonts, background_key="background"):
+        self.name = name
+        self.title = title
+        self.width = width
+        self.height = height
+        self.draw = draw
+        self.colors = colors
+        self.fonts = fonts
+        self.background_key = background_key
+        self._display_lists = {}
+
+    def display_list(self, colors=None, fonts=None):
+        """ The recorded drawing for this theme (the diagram's own colors and fonts by default). """
+        colors, fonts = colors or self.colors, fonts or self.fonts
+        key = (repr(sorted(colors.items())), repr(sorted(fonts.items())))
+        display_list = self._display_lists.get(key)
+        if display_list is None:
+            recorder = RecordingCanvas()
+            self.draw(recorder, colors, fonts)
+            display_list = self._display_lists[key] = recorder.display_list()
+        return display_list
+
+    def background(self, colors=None):
+        return (colors or self.colors)[self.background_key]
+
+
+DIAGRAMS = {
+    "airspace": Diagram("airspace", "U.S. Airspace Classes at a Glance", AIRSPACE_WIDTH, AIRSPACE_HEIGHT,
+                        draw_airspace_chart, AIRSPACE_COLORS, AIRSPACE_FONTS),
+    "logo": Diagram("logo", "Upwind", 140, 140, draw_logo,
+                    {"accent": "#7289da", "background": "#1e2124"}, {}),
+}
+
+
+# --- Rasterizing (Pillow) ---
+_TEXT_ANCHORS = {"center": "mm", "n": "ma", "s": "md", "e": "rm", "w": "lm",
+                 "ne": "ra", "nw": "la", "se": "rd", "sw": "ld"}
+_FONT_FILES = {False: ("DejaVuSans.ttf", "LiberationSans-Regular.ttf", "Arial.ttf", "arial.ttf", "Helvetica.ttc"),
+               True: ("DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf", "Arial Bold.ttf", "arialbd.ttf", "Helvetica.ttc")}
+_fonts = {}
+
+
+def _load_font(font, factor):
+    """ Pillow font for a Tk font tuple; Tk sizes are points, so they scale with the DPI factor. """
+    _, size, *style = font
+    pixels = max(1, round(abs(size) * SCREEN_DPI / 72 * factor)) if size > 0 else max(1, round(-size * factor))
+    bold = "bold" in " ".join(style)
+    key = (pixels, bold)
+    if key not in _fonts:
+        for file_name in _FONT_FILES[bold]:
+            try:
+                _fonts[key] = ImageFont.truetype(file_name, pixels)
+                break
+            except OSError:
+                continue
+        else:
+            try:
+                _fonts[key] = ImageFont.load_default(pixels)
+            except TypeError:  # Pillow < 10.1 has a single fixed-size default font
+                _fonts[key] = ImageFont.load_default()
+    return _fonts[key]
+
+
+def _dashed_ellipse(draw, box, outline, width, dash):
+    """ Pillow has no dashed outlines; approximate Tk's dash pattern with arcs. """
+    on, off = dash[0], dash[1] if len(dash) > 1 else dash[0]
+    rx, ry = (box[2] - box[0]) / 2, (box[3] - box[1]) / 2
+    perimeter = 3.14159 * (3 * (rx + ry) - ((3 * rx + ry) * (rx + 3 * ry)) ** 0.5)
+    count = max(1, round(perimeter / (on + off)))
+    step = 360.0 / count
+    for i in range(count):
+        draw.arc(box, i * step, i * step + step * on / (on + off), fill=outline, width=width)
+
+
+def rasterize(display_list, width, height, scale=1.0, background="#ffffff"):
+    """ Renders a DisplayList to a Pillow image of (width, height) pixels times scale. """
+    if Image is None:
+        raise RuntimeError("Rasterizing diagrams requires Pillow (pip install pillow).")
+    factor = scale * SUPERSAMPLE
+    image = Image.new("RGB", (round(width * factor), round(height * factor)), background)
+    draw = ImageDraw.Draw(image)
+    for method, coords, options in display_list.items:
+        points = [value * factor for value in coords]
+        line_width = max(1, round(float(options.get("width", 1)) * factor))
+        if method in ("create_rectangle", "create_oval"):
+            box = [min(points[0], points[2]), min(points[1], points[3]), max(points[0], points[2]), max(points[1], points[3])]
+            fill = options.get("fill") or None
+            outline = options.get("outline", "black") or None
+            if method == "create_rectangle":
+                draw.rectangle(box, fill=fill, outline=outline, width=line_width)
+            elif options.get("dash") and outline:
+                if fill:
+                    draw.ellipse(box, fill=fill)
+                _dashed_ellipse(draw, box, outline, line_width, [d * factor for d in options["dash"]])
+            else:
+                draw.ellipse(box, fill=fill, outline=outline, width=line_width)
+        elif method == "create_polygon":
+            draw.polygon(points, fill=options.get("fill", "black") or None,
+                         outline=options.get("outline") or None, width=line_width)
+        elif method == "create_line":
+            draw.line(points, fill=options.get("fill", "black") or None, width=line_width, joint="curve")
+        elif method == "create_text":
+            font = _load_font(options.get("font", ("Helvetica", 10)), factor)
+            anchor = _TEXT_ANCHORS[options.get("anchor", "center")]
+            draw.multiline_text(points[:2], str(options.get("text", "")), fill=options.get("fill", "black"),
+                                font=font, anchor=anchor, align=options.get("justify", "left"))
+    if SUPERSAMPLE > 1:
+        image = image.resize((round(width * scale), round(height * scale)), Image.LANCZOS)
+    return image
+
+
+def render_png(diagram, colors=None, fonts=None, scale=1.0, cache_dir=None):
+    """
+    Returns the path of a cached PNG of diagram at scale, rasterizing it on first use, or
+    None when Pillow is not installed.
+    """
+    if Image is None:
+        return None
+    display_list = diagram.display_list(colors, fonts)
+    file_name = f"{diagram.name}-{diagram.width}x{diagram.height}@{scale:g}x-{display_list.fingerprint()[:12]}.png"
+    path = os.path.join(cache_dir or default_cache_dir(), file_name)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        image = rasterize(display_list, diagram.width, diagram.height, scale, diagram.background(colors))
+        image.save(path + ".tmp", format="PNG", dpi=(SCREEN_DPI * scale, SCREEN_DPI * scale))
+        os.replace(path + ".tmp", path)
+    return path
+
+
+# --- PostScript (Tk) ---
+def export_postscript(diagram, path, colors=None, fonts=None, master=None):
+    """ Draws diagram on a hidden Tk canvas and saves it as (vector) PostScript. """
+    owns_root = master is None
+    root = tk.Tk() if owns_root else tk.Toplevel(master)
+    root.withdraw()
+    try:
+        canvas = tk.Canvas(root, width=diagram.width, height=diagram.height, highlightthickness=0)
+        # PostScript output leaves out the canvas background, so paint it as an item.
+        background = diagram.background(colors)
+        canvas.create_rectangle(0, 0, diagram.width, diagram.height, fill=background, outline=background)
+        diagram.display_list(colors, fonts).draw(canvas)
+        canvas.postscript(file=path, x=0, y=0, width=diagram.width, height=diagram.height, colormode="color")
+    finally:
+        root.destroy()
+
+
+def export_diagrams(directory, dpi=300, formats=("png", "ps"), names=None):
+    """ Writes every diagram (or those in names) to directory at print resolution. Returns the paths written. """
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    for name in names or DIAGRAMS:
+        diagram = DIAGRAMS[name]
+        if "png" in formats:
+            scale = dpi / SCREEN_DPI
+            path = os.path.join(directory, f"{name}.png")
+            rasterize(diagram.display_list(), diagram.width, diagram.height, scale,
+                      diagram.background()).save(path, format="PNG", dpi=(dpi, dpi))
+            written.append(path)
+        if "ps" in formats:
+            path = os.path.join(directory, f"{name}.ps")
+            export_postscript(diagram, path)
+            written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.diagrams",
+                                     description="Export the study diagrams for printed handouts.")
+    parser.add_argument("--output", metavar="DIR", required=True, help="directory to write the files to")
+    parser.add_argument("--dpi", type=int, default=300, help="PNG resolution (default: 300)")
+    parser.add_argument("--format", nargs="+", choices=("png", "ps"), default=["png", "ps"])
+    parser.add_argument("--diagram", nargs="+", choices=sorted(DIAGRAMS), help="diagrams to export (default: all)")
+    args = parser.parse_args(argv)
+
+    if "png" in args.format and Image is None:
+        parser.error("PNG export requires Pillow (pip install pillow); use --format ps for PostScript only.")
+    try:
+        written = export_diagrams(args.output, args.dpi, args.format, args.diagram)
+    except tk.TclError as error:
+        parser.error(f"PostScript export needs a display for Tk ({error}); use --format png on headless machines.")
+    for path in written:
+        print(path, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
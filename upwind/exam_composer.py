@@ -0,0 +1,155 @@
+"""
+upwind/exam_composer.py
+
+Blueprint-stratified exam composition.
+
+A blueprint maps category names to question counts, e.g.
+{"Airspace for Ultralights": 3, "Basic Weather for VFR Flight": 2, ...}.
+The composer samples each stratum straight out of the store's precomputed
+category -> question-ID index, so composing an exam costs O(k) for k questions
+no matter how large the bank grows.
+
+When the bank has near-duplicate clusters (see upwind/near_duplicates.py), an exam never
+gets two questions from the same cluster: a question whose cluster is already in the
+exam is replaced by a redraw from its stratum. Only if a stratum runs out of clusters
+are near-duplicates allowed again.
+
+Questions without a category form a stratum of their own, keyed UNCATEGORIZED in a
+blueprint, so a balanced exam can draw on the whole bank.
+"""
+
+import random
+
+MAX_REDRAWS_PER_QUESTION = 8
+UNCATEGORIZED = None  # Blueprint key of the questions without a category
+
+
+def sample_indices(population_size, k, rng=random):
+    """
+    Returns k distinct indices from range(population_size) in random order.
+    Uses Robert Floyd's algorithm: O(k) time and memory, never copies the population.
+    """
+    if not 0 <= k <= population_size:
+        raise ValueError(f"Cannot sample {k} items from a population of {population_size}.")
+    selected = set()
+    picks = []
+    for upper in range(population_size - k, population_size):
+        index = rng.randrange(upper + 1)
+        if index in selected:
+            index = upper
+        selected.add(index)
+        picks.append(index)
+    rng.shuffle(picks)
+    return picks
+
+
+def even_blueprint(category_sizes, num_questions):
+    """
+    Spreads num_questions as evenly as possible across the categories in
+    category_sizes ({category: available_count}), never asking a category for
+    more questions than it holds.
+    """
+    if num_questions > sum(category_sizes.values()):
+        raise ValueError(f"The bank only has {sum(category_sizes.values())} questions, {num_questions} requested.")
+    blueprint = {}
+    remaining = num_questions
+    # Smallest categories first, so any shortfall is picked up by the larger ones.
+    ordered = sorted(category_sizes.items(), key=lambda item: item[1])
+    for position, (category, size) in enumerate(ordered):
+        share = -(-remaining // (len(ordered) - position))
+        blueprint[category] = min(size, share)
+        remaining -= blueprint[category]
+    return {category: blueprint[category] for category in category_sizes if blueprint[category]}
+
+
+class ExamComposer:
+    """ Composes exams from a question store according to a category blueprint. """
+
+    def __init__(self, question_store, rng=None):
+        self.question_store = question_store
+        self.category_index = question_store.category_index()
+        self.rng = rng if rng is not None else random
+        self._clusters = None
+        self._uncategorized = None
+
+    @property
+    def clusters(self):
+        """ The bank's {question_id: cluster_id} near-duplicate map, read on first use. """
+        if self._clusters is None:
+            self._clusters = self.question_store.get_duplicate_clusters()
+        return self._clusters
+
+    def _sample(self, population, count, used_clusters):
+        """ count distinct IDs from population, avoiding (and then adding to) used_clusters where possible. """
+        picks = [population[i] for i in sample_indices(len(population), count, self.rng)]
+        clusters = self.clusters
+        if not clusters:
+            return picks
+        accepted, rejected = [], []
+        for question_id in picks:
+            cluster = clusters.get(question_id)
+            if cluster is None or cluster not in used_clusters:
+                accepted.append(question_id)
+                if cluster is not None:
+                    used_clusters.add(cluster)
+            else:
+                rejected.append(question_id)
+        if rejected:
+            # Redraw the rejected picks; a run of bad luck keeps them rather than looping forever.
+            chosen = set(picks)
+            for _ in range(MAX_REDRAWS_PER_QUESTION * len(rejected)):
+                if len(accepted) == count:
+                    break
+                question_id = population[self.rng.randrange(len(population))]
+                cluster = clusters.get(question_id)
+                if question_id in chosen or (cluster is not None and cluster in used_clusters):
+                    continue
+                chosen.add(question_id)
+                accepted.append(question_id)
+                if cluster is not None:
+                    used_clusters.add(cluster)
+            accepted.extend(rejected[:count - len(accepted)])
+        return accepted
+
+    def uncategorized_ids(self):
+        """ IDs of the questions without a category. The bank is only scanned when it has some. """
+        if self._uncategorized is None:
+            self._uncategorized = []
+            if sum(len(ids) for ids in self.category_index.values()) < len(self.question_store):
+                categorized = set().union(*self.category_index.values())
+                self._uncategorized = [question_id for question_id in self.question_store.question_ids()
+                                       if question_id not in categorized]
+        return self._uncategorized
+
+    def category_sizes(self):
+        """ {category: question count} of every stratum, UNCATEGORIZED included when the bank has such questions. """
+        sizes = {category: len(ids) for category, ids in self.category_index.items()}
+        if self.uncategorized_ids():
+            sizes[UNCATEGORIZED] = len(self.uncategorized_ids())
+        return sizes
+
+    def capacity(self):
+        """ The longest exam compose_balanced() can supply. """
+        return sum(self.category_sizes().values())
+
+    def compose(self, blueprint):
+        """ Returns a shuffled list of question IDs drawn per the blueprint. """
+        question_ids = []
+        used_clusters = set()
+        for category, count in blueprint.items():
+            stratum = self.uncategorized_ids() if category is UNCATEGORIZED else self.category_index.get(category)
+            if stratum is None:
+                raise ValueError(f"Unknown category in blueprint: {category}")
+            question_ids.extend(self._sample(stratum, count, used_clusters))
+        self.rng.shuffle(question_ids)
+        return question_ids
+
+    def compose_balanced(self, num_questions):
+        """
+        Returns num_questions IDs spread evenly over every category, questions without
+        one counting as a category of their own. Banks without category data fall back
+        to a flat random sample.
+        """
+        if not self.category_index:
+            return self._sample(self.question_store.question_ids(), num_questions, set())
+        return self.compose(even_blueprint(self.category_sizes(), num_questions))
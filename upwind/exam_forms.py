@@ -0,0 +1,323 @@
+"""
+upwind/exam_forms.py
+
+Printable exam forms for proctored checkrides.
+
+Every form follows the same category blueprint (even_blueprint over the bank, as for a
+normal quiz), no question appears on two forms of the same sitting, and the forms'
+average difficulties are balanced. Difficulty is the calibrated IRT difficulty from the
+question bank (see upwind/irt_calibration.py); uncalibrated questions count as 0.0, the
+same default the adaptive quiz uses.
+
+Since the forms of a sitting share no questions and the blueprint fixes each form's
+count per category, the problem splits into one independent job per (sitting,
+category): choose forms x count questions from the category and deal them into
+equal-sized groups whose difficulty sums are all as close as possible to count x the
+category's mean difficulty. Each job
+    1. samples the questions at random,
+    2. deals them greedily, hardest first, to the group furthest below its target,
+    3. improves the deal by local search: repeatedly take the group furthest from its
+       target and make the single best move, either swapping a question with the group
+       furthest the other way or replacing it with an unused question from the
+       category. Candidates are found by bisecting sorted difficulty lists, and every
+       move strictly reduces the total squared deviation, so the search ends.
+Jobs run in a process pool. Each is seeded from (seed, sitting, category) and each form's
+question and option order from (seed, form), so the output depends only on the seed and
+never on the number of workers.
+
+Usage:
+python -m upwind.exam_forms --forms 30 --length 50 --output-dir forms [--sittings 2] [--format both]
+"""
+
+import argparse
+import html
+import json
+import os
+import random
+import sys
+import time
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
+
+from upwind.exam_composer import even_blueprint, sample_indices
+from upwind.question_store import open_question_store
+
+DEFAULT_FORMS = 10
+DEFAULT_LENGTH = 50
+DEFAULT_SEED = 103
+MAX_SEARCH_MOVES = 100000  # Per job; the search normally stops long before this
+OPTION_LETTERS = "ABCDEFGH"
+TITLE = "Upwind: Part 103 Practice Exam"
+
+
+class ExamForm:
+    """ One assembled form: question IDs in printed order, each with its options in printed order. """
+
+    __slots__ = ("number", "sitting", "question_ids", "option_orders", "mean_difficulty")
+
+    def __init__(self, number, sitting, question_ids, option_orders, mean_difficulty):
+        self.number = number
+        self.sitting = sitting
+        self.question_ids = question_ids
+        self.option_orders = option_orders
+        self.mean_difficulty = mean_difficulty
+
+    @property
+    def name(self):
+        return f"form-{self.number:03d}"
+
+    def answer_key(self, questions):
+        """ Letter of the correct option for each question, in printed order. """
+        return [OPTION_LETTERS[options.index(questions[question_id].correct_answer)]
+                for question_id, options in zip(self.question_ids, self.option_orders)]
+
+    def to_dict(self, questions):
+        return {"form": self.number, "sitting": self.sitting, "question_ids": self.question_ids,
+                "options": self.option_orders, "answer_key": self.answer_key(questions),
+                "mean_difficulty": round(self.mean_difficulty, 4)}
+
+
+def _squared_change(deviation, change):
+    """ How much moving a group's deviation from deviation to deviation - change lowers its square. """
+    return deviation * deviation - (deviation - change) * (deviation - change)
+
+
+def _nearest(items, value):
+    """ The entries of a sorted (difficulty, id) list whose difficulty is nearest value (at most two). """
+    position = bisect_left(items, (value,))
+    return items[max(position - 1, 0):position + 1]
+
+
+def assign_stratum(question_ids, difficulties, num_forms, per_form, seed, max_moves=MAX_SEARCH_MOVES):
+    """
+    Chooses num_forms x per_form of question_ids and deals them into num_forms groups of
+    per_form questions with balanced difficulty sums. Returns the groups as lists of IDs.
+    """
+    rng = random.Random(seed)
+    pool = list(zip(difficulties, question_ids))
+    chosen = [pool[i] for i in sample_indices(len(pool), num_forms * per_form, rng)]
+    target = per_form * sum(difficulties) / len(difficulties)
+
+    # Greedy deal: hardest first, each to the open group with the lowest sum (ties in random order).
+    rng.shuffle(chosen)
+    chosen.sort(key=lambda item: -item[0])
+    groups = [[] for _ in range(num_forms)]
+    sums = [0.0] * num_forms
+    for item in chosen:
+        group = min((g for g in range(num_forms) if len(groups[g]) < per_form), key=sums.__getitem__)
+        groups[group].append(item)
+        sums[group] += item[0]
+    for group in groups:
+        group.sort()
+    chosen_ids = {question_id for _, question_id in chosen}
+    unused = sorted(item for item in pool if item[1] not in chosen_ids)
+
+    # Local search on the total squared deviation of the group sums from the target.
+    for _ in range(max_moves):
+        deviations = [total - target for total in sums]
+        worst = max(range(num_forms), key=lambda g: abs(deviations[g]))
+        deviation = deviations[worst]
+        if abs(deviation) < 1e-9:
+            break
+        partner = (min if deviation > 0 else max)(range(num_forms), key=deviations.__getitem__)
+        best_gain, best_move = 1e-12, None
+        for item in groups[worst]:
+            # Replacing item by an unused question lowers the group sum by item - other.
+            for other in _nearest(unused, item[0] - deviation):
+                gain = _squared_change(deviation, item[0] - other[0])
+                if gain > best_gain:
+                    best_gain, best_move = gain, (item, other, None)
+            if partner == worst:
+                continue
+            # Swapping with the partner group moves item - other from this group to that one.
+            half_gap = (deviation - deviations[partner]) / 2
+            for other in _nearest(groups[partner], item[0] - half_gap):
+                change = item[0] - other[0]
+                gain = _squared_change(deviation, change) + _squared_change(deviations[partner], -change)
+                if gain > best_gain:
+                    best_gain, best_move = gain, (item, other, partner)
+        if best_move is None:
+            break
+        item, other, partner = best_move
+        source = unused if partner is None else groups[partner]
+        groups[worst].remove(item)
+        source.remove(other)
+        insort(groups[worst], other)
+        insort(source, item)
+        sums[worst] += other[0] - item[0]
+        if partner is not None:
+            sums[partner] += item[0] - other[0]
+    return [[question_id for _, question_id in group] for group in groups]
+
+
+def _run_job(job):
+    return assign_stratum(*job)
+
+
+def assemble_forms(question_store, num_forms, length, sittings=1, seed=DEFAULT_SEED, workers=None):
+    """
+    Assembles num_forms forms of length questions for each sitting. Raises ValueError
+    when a category is too small to fill every form of a sitting without repeats.
+    workers=1 runs everything in this process; None uses every CPU.
+    """
+    category_index = question_store.category_index() or {"": list(question_store.question_ids())}
+    blueprint = even_blueprint({category: len(ids) for category, ids in category_index.items()}, length)
+    for category, count in blueprint.items():
+        if count * num_forms > len(category_index[category]):
+            raise ValueError(f"{category or 'The bank'} has {len(category_index[category])} questions, but "
+                             f"{num_forms} forms with {count} each need {count * num_forms}.")
+    parameters = question_store.get_item_parameters()
+
+    def difficulty(question_id):
+        return (parameters.get(question_id) or {}).get("difficulty") or 0.0
+
+    jobs = []
+    for sitting in range(sittings):
+        for category, count in blueprint.items():
+            ids = list(category_index[category])
+            jobs.append((ids, [difficulty(question_id) for question_id in ids], num_forms, count,
+                         f"{seed}:{sitting}:{category}"))
+    if workers == 1 or len(jobs) == 1:
+        results = [_run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_run_job, jobs, chunksize=max(1, len(jobs) // (4 * (os.cpu_count() or 1)))))
+
+    question_ids_by_form = [[] for _ in range(sittings * num_forms)]
+    for position, groups in enumerate(results):
+        sitting = position // len(blueprint)
+        for form, group in enumerate(groups):
+            question_ids_by_form[sitting * num_forms + form].extend(group)
+    questions = _questions_by_id(question_store, question_ids_by_form)
+    forms = []
+    for index, question_ids in enumerate(question_ids_by_form):
+        rng = random.Random(f"{seed}:form:{index + 1}")
+        rng.shuffle(question_ids)
+        option_orders = []
+        for question_id in question_ids:
+            options = list(questions[question_id].options)
+            rng.shuffle(options)
+            option_orders.append(options)
+        mean = sum(difficulty(question_id) for question_id in question_ids) / len(question_ids)
+        forms.append(ExamForm(index + 1, index // num_forms + 1, question_ids, option_orders, mean))
+    return forms, questions
+
+
+def _questions_by_id(question_store, question_ids_by_form):
+    question_ids = sorted({question_id for ids in question_ids_by_form for question_id in ids})
+    questions = dict(zip(question_ids, question_store.get_questions(question_ids)))
+    explanations = question_store.get_explanations(question_ids)
+    for question_id, question in questions.items():
+        if not question.explanation:
+            questions[question_id] = question._replace(explanation=explanations.get(question_id, ""))
+    return questions
+
+
+# --- Output ---
+def form_text(form, questions):
+    lines = [f"{TITLE}", f"Form {form.number} (sitting {form.sitting}), {len(form.question_ids)} questions", "",
+             "Name: ______________________________   Date: ______________", ""]
+    for number, (question_id, options) in enumerate(zip(form.question_ids, form.option_orders), 1):
+        lines.append(f"{number}. {questions[question_id]['question_text']}")
+        lines.extend(f"   {OPTION_LETTERS[i]}) {option}" for i, option in enumerate(options))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def key_text(form, questions):
+    lines = [f"{TITLE}: Answer Key", f"Form {form.number} (sitting {form.sitting})", ""]
+    for number, (question_id, letter) in enumerate(zip(form.question_ids, form.answer_key(questions)), 1):
+        lines.append(f"{number}. {letter}    {questions[question_id]['explanation']}")
+    return "\n".join(lines) + "\n"
+
+
+_HTML_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font: 11pt Helvetica, Arial, sans-serif; max-width: 7.5in; margin: 0.5in auto; }}
+h1 {{ font-size: 16pt; margin-bottom: 0; }} .meta {{ color: #555; margin-bottom: 1em; }}
+ol.questions > li {{ margin-bottom: 0.8em; break-inside: avoid; }} ol.options {{ list-style: upper-alpha; }}
+td {{ padding: 2px 8px; vertical-align: top; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def form_html(form, questions):
+    items = []
+    for question_id, options in zip(form.question_ids, form.option_orders):
+        choices = "".join(f"<li>{html.escape(option)}</li>" for option in options)
+        items.append(f"<li>{html.escape(questions[question_id]['question_text'])}<ol class=\"options\">{choices}</ol></li>")
+    body = (f"<h1>{TITLE}</h1><p class=\"meta\">Form {form.number} (sitting {form.sitting}), "
+            f"{len(form.question_ids)} questions<br>Name: ______________________ Date: __________</p>"
+            f"<ol class=\"questions\">{''.join(items)}</ol>")
+    return _HTML_PAGE.format(title=f"{TITLE}: Form {form.number}", body=body)
+
+
+def key_html(form, questions):
+    rows = "".join(f"<tr><td>{number}.</td><td><b>{letter}</b></td><td>{html.escape(questions[question_id]['explanation'])}</td></tr>"
+                   for number, (question_id, letter) in enumerate(zip(form.question_ids, form.answer_key(questions)), 1))
+    body = (f"<h1>{TITLE}: Answer Key</h1><p class=\"meta\">Form {form.number} (sitting {form.sitting})</p>"
+            f"<table>{rows}</table>")
+    return _HTML_PAGE.format(title=f"{TITLE}: Form {form.number} Key", body=body)
+
+
+def write_forms(forms, questions, directory, formats=("text", "html")):
+    """ Writes each form and its answer key in the given formats, plus forms.json listing every form. """
+    os.makedirs(directory, exist_ok=True)
+    writers = {"text": (".txt", form_text, key_text), "html": (".html", form_html, key_html)}
+    for form in forms:
+        for output_format in formats:
+            extension, render_form, render_key = writers[output_format]
+            _write_file(os.path.join(directory, form.name + extension), render_form(form, questions))
+            _write_file(os.path.join(directory, form.name + "-key" + extension), render_key(form, questions))
+    _write_file(os.path.join(directory, "forms.json"),
+                json.dumps({"forms": [form.to_dict(questions) for form in forms]}, indent=1))
+
+
+def _write_file(path, text):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(path + ".tmp", path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.exam_forms",
+                                     description="Assemble non-overlapping, difficulty-balanced printable exam forms.")
+    parser.add_argument("--forms", type=int, default=DEFAULT_FORMS, help=f"forms per sitting, sharing no questions (default: {DEFAULT_FORMS})")
+    parser.add_argument("--sittings", type=int, default=1, help="sittings; forms of different sittings may share questions (default: 1)")
+    parser.add_argument("--length", type=int, default=DEFAULT_LENGTH, help=f"questions per form (default: {DEFAULT_LENGTH})")
+    parser.add_argument("--question-bank", metavar="PATH", help="SQLite (.db) or JSON question bank (default: built-in pool)")
+    parser.add_argument("--output-dir", default="forms", metavar="DIR", help="where to write the forms (default: forms)")
+    parser.add_argument("--format", choices=("text", "html", "both"), default="both")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU; 1 runs in this process)")
+    args = parser.parse_args(argv)
+
+    if min(args.forms, args.sittings, args.length) < 1:
+        parser.error("--forms, --sittings and --length must be at least 1")
+    start = time.perf_counter()
+    store = open_question_store(args.question_bank)
+    try:
+        forms, questions = assemble_forms(store, args.forms, args.length, args.sittings, args.seed, args.workers)
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        store.close()
+    write_forms(forms, questions, args.output_dir, ("text", "html") if args.format == "both" else (args.format,))
+
+    means = [form.mean_difficulty for form in forms]
+    print(f"Wrote {len(forms)} forms of {args.length} questions to {args.output_dir} in "
+          f"{time.perf_counter() - start:.2f} s.", file=sys.stderr)
+    print(f"  Mean difficulty per form: {min(means):.3f} to {max(means):.3f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
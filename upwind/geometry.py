@@ -0,0 +1,98 @@
+"""
+upwind/geometry.py
+
+Batched 2D geometry for the canvas art: affine transforms applied to whole coordinate
+arrays in one pass, and ellipse tessellation whose segment count follows the on-screen
+radius instead of a fixed 100 segments.
+
+A curve drawn as n chords of a circle of radius r deviates from the true curve by at
+most r * (1 - cos(pi / n)), so the smallest n within a pixel tolerance is
+pi / acos(1 - tolerance / r). The 34-unit logo ellipses need 26 segments at 0.25 px.
+
+Coordinates are flat sequences (x0, y0, x1, y1, ...), the form the canvas create_* calls
+take, and results are rounded to COORD_PRECISION decimals to keep the Tk command strings
+short. NumPy is used for large arrays when available; otherwise array('d').
+
+Matrices use the SVG matrix(a, b, c, d, e, f) order: x' = a*x + c*y + e, y' = b*x + d*y + f.
+"""
+
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+DEFAULT_TOLERANCE = 0.25   # Maximum distance in pixels between a curve and its polygon
+MIN_SEGMENTS = 8
+MAX_SEGMENTS = 256
+COORD_PRECISION = 2
+# Below this many points the per-call overhead of NumPy outweighs the vectorized arithmetic.
+NUMPY_MIN_POINTS = 64
+
+
+def placement(x_offset=0.0, y_offset=0.0, scale=1.0):
+    """ Matrix that scales about the origin and then moves by (x_offset, y_offset). """
+    return (scale, 0.0, 0.0, scale, x_offset, y_offset)
+
+
+def compose(outer, inner):
+    """ Matrix applying inner first and then outer. """
+    a1, b1, c1, d1, e1, f1 = outer
+    a2, b2, c2, d2, e2, f2 = inner
+    return (a1 * a2 + c1 * b2, b1 * a2 + d1 * b2,
+            a1 * c2 + c1 * d2, b1 * c2 + d1 * d2,
+            a1 * e2 + c1 * f2 + e1, b1 * e2 + d1 * f2 + f1)
+
+
+def matrix_scale(matrix):
+    """ Largest factor by which matrix stretches any direction (its largest singular value). """
+    a, b, c, d = matrix[:4]
+    p, q, r = a * a + b * b, a * c + b * d, c * c + d * d
+    return math.sqrt((p + r) / 2 + math.sqrt(((p - r) / 2) ** 2 + q * q))
+
+
+def segments_for_radius(radius, tolerance=DEFAULT_TOLERANCE):
+    """ Number of chords needed to draw a circle of the given on-screen radius within tolerance pixels. """
+    if radius <= tolerance:
+        return MIN_SEGMENTS
+    segments = math.ceil(math.pi / math.acos(1.0 - tolerance / radius))
+    return min(max(segments, MIN_SEGMENTS), MAX_SEGMENTS)
+
+
+def transform_coords(coords, matrix=IDENTITY, precision=COORD_PRECISION):
+    """ Applies matrix to a flat coordinate sequence and returns a flat tuple ready for the canvas. """
+    a, b, c, d, e, f = matrix
+    if np is not None and len(coords) >= 2 * NUMPY_MIN_POINTS:
+        points = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        result = np.empty_like(points)
+        result[:, 0] = a * points[:, 0] + c * points[:, 1] + e
+        result[:, 1] = b * points[:, 0] + d * points[:, 1] + f
+        return tuple(np.round(result, precision).ravel().tolist())
+    result = []
+    for x, y in zip(coords[0::2], coords[1::2]):
+        result += (round(a * x + c * y + e, precision), round(b * x + d * y + f, precision))
+    return tuple(result)
+
+
+def ellipse_coords(cx, cy, rx, ry, matrix=IDENTITY, tolerance=DEFAULT_TOLERANCE):
+    """
+    Polygon approximating the ellipse (cx, cy, rx, ry) after matrix, as a flat tuple. The
+    segment count is chosen from the ellipse's largest on-screen radius.
+    """
+    segments = segments_for_radius(max(abs(rx), abs(ry)) * matrix_scale(matrix), tolerance)
+    # Fold the unit-circle mapping into the matrix, so each point is transformed exactly once.
+    full = compose(matrix, (rx, 0.0, 0.0, ry, cx, cy))
+    if np is not None and segments >= NUMPY_MIN_POINTS:
+        angles = np.linspace(0.0, 2.0 * math.pi, segments, endpoint=False)
+        unit = np.empty(2 * segments)
+        unit[0::2], unit[1::2] = np.cos(angles), np.sin(angles)
+        return transform_coords(unit, full)
+    unit = array('d')
+    step = 2.0 * math.pi / segments
+    for i in range(segments):
+        unit.append(math.cos(i * step))
+        unit.append(math.sin(i * step))
+    return transform_coords(unit, full)
@@ -0,0 +1,175 @@
+"""
+upwind/instrumentation.py
+
+Opt-in timing hooks for profiling the app on real machines.
+
+Instrumentation.install() replaces named methods or functions on a class or module with
+wrappers that time every call. Each duration goes into a fixed-bucket latency
+histogram per name, is optionally kept as a Chrome/Perfetto trace event, and is passed
+to any extra listeners. Nothing is installed unless instrumentation is switched on, so
+a normal run pays no cost at all.
+
+It is switched on with the app's --instrument / --trace PATH flags, or with the
+environment variables UPWIND_INSTRUMENT=1 and UPWIND_TRACE=PATH (handy on kiosks where
+the launch command is fixed). The histogram table is printed when the app exits. The
+trace file can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+Usage:
+    instrumentation = configure(args.instrument, args.trace)   # None when switched off
+    if instrumentation is not None:
+        instrumentation.install(SomeClass, ["method", ...])
+    ...
+    instrumentation.close()
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+ENABLE_VARIABLE = "UPWIND_INSTRUMENT"
+TRACE_VARIABLE = "UPWIND_TRACE"
+# Upper bucket bounds in milliseconds; one more bucket holds everything slower.
+BUCKET_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+MAX_TRACE_EVENTS = 200000  # Oldest events are dropped first, so a long kiosk session stays bounded
+
+
+class Histogram:
+    """ Call count and duration distribution for one instrumented name, in fixed buckets. """
+
+    __slots__ = ("counts", "count", "total_ms", "min_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def add(self, duration_ms):
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    @property
+    def mean_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """ Upper bound of the bucket holding the given fraction of calls (capped at the slowest call). """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min(BUCKET_BOUNDS_MS[bucket], self.max_ms) if bucket < len(BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        return {"count": self.count, "total_ms": round(self.total_ms, 3), "mean_ms": round(self.mean_ms, 3),
+                "min_ms": round(self.min_ms, 3) if self.count else 0.0, "max_ms": round(self.max_ms, 3),
+                "p50_ms": self.percentile(0.5), "p95_ms": self.percentile(0.95), "p99_ms": self.percentile(0.99),
+                "bucket_bounds_ms": list(BUCKET_BOUNDS_MS), "bucket_counts": list(self.counts)}
+
+
+class Instrumentation:
+    def __init__(self, trace_path=None, max_trace_events=MAX_TRACE_EVENTS):
+        self.trace_path = trace_path
+        self.histograms = {}
+        self.trace_events = deque(maxlen=max_trace_events) if trace_path else None
+        self.listeners = []  # Callables taking (name, start seconds, duration ms)
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def record(self, name, start, end):
+        """ Records one call of name that ran from start to end (time.perf_counter() seconds). """
+        duration_ms = (end - start) * 1000
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(duration_ms)
+        if self.trace_events is not None:
+            self.trace_events.append({"name": name, "cat": name.partition(".")[0], "ph": "X",
+                                      "ts": round((start - self._origin) * 1e6, 1), "dur": round(duration_ms * 1000, 1),
+                                      "pid": self._pid, "tid": threading.get_ident()})
+        for listener in self.listeners:
+            listener(name, start, duration_ms)
+
+    def wrap(self, function, name):
+        """ Returns function wrapped so every call is recorded under name. """
+        record, clock = self.record, time.perf_counter
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, start, clock())
+        return timed
+
+    def install(self, owner, names, prefix=None):
+        """ Replaces each named attribute of owner (a class or module) with a timed wrapper, as "prefix.name". """
+        prefix = prefix or getattr(owner, "__name__", type(owner).__name__)
+        for name in names:
+            setattr(owner, name, self.wrap(getattr(owner, name), f"{prefix}.{name}"))
+
+    def summary(self):
+        lines = [f"{'name':<40} {'calls':>7} {'mean ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>9}"]
+        for name, histogram in sorted(self.histograms.items(), key=lambda item: -item[1].total_ms):
+            lines.append(f"{name:<40} {histogram.count:>7} {histogram.mean_ms:>9.2f} {histogram.percentile(0.5):>8.2f} "
+                         f"{histogram.percentile(0.95):>8.2f} {histogram.max_ms:>9.2f}")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {name: histogram.to_dict() for name, histogram in self.histograms.items()}
+
+    def write_trace(self, path=None):
+        """ Writes the recorded calls as Chrome trace-event JSON, with the histograms as metadata. """
+        path = path or self.trace_path
+        events = [{"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "Upwind"}}]
+        events.extend(self.trace_events or ())
+        document = {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"histograms": self.to_dict()}}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+    def close(self, stream=None):
+        """ Prints the histogram table and writes the trace file, if one was requested. """
+        stream = stream or sys.stderr
+        if self.histograms:
+            print(self.summary(), file=stream)
+        if self.trace_path:
+            try:
+                self.write_trace()
+                print(f"Wrote trace to {self.trace_path}.", file=stream)
+            except OSError as error:
+                print(f"Could not write the trace ({error}).", file=stream)
+
+
+def configure(enabled=None, trace_path=None, environ=None):
+    """
+    Returns an Instrumentation when switched on by the arguments or, where they are not
+    given, the UPWIND_INSTRUMENT / UPWIND_TRACE environment variables; otherwise None.
+    """
+    environ = os.environ if environ is None else environ
+    trace_path = trace_path or environ.get(TRACE_VARIABLE) or None
+    if enabled is None:
+        enabled = environ.get(ENABLE_VARIABLE, "").strip().lower() not in ("", "0", "false", "no", "off")
+    if not (enabled or trace_path):
+        return None
+    return Instrumentation(trace_path)
@@ -0,0 +1,254 @@
+"""
+upwind/irt_calibration.py
+
+Offline item-response-theory calibration of the question bank.
+
+Reads the recorded attempts from the question bank's attempt journal (each quiz session
+is treated as one examinee) and fits a 1PL (Rasch) or 2PL logistic model:
+
+    P(correct) = 1 / (1 + exp(-a_j * (theta_i - b_j)))
+
+with b_j the question's difficulty and a_j its discrimination. Parameters are estimated
+by penalized joint maximum likelihood: weak normal priors keep the scale identified, and
+each iteration takes one diagonal Newton step for every ability, difficulty and
+discrimination at once. All sums over responses are NumPy bincounts, so an iteration is
+a handful of vectorized passes over the response arrays and millions of responses
+calibrate in seconds.
+
+Every question also gets its point-biserial correlation between answering it correctly
+and the examinee's score on the rest of the quiz. A negative correlation means strong
+learners miss the question more often than weak ones, which usually indicates a
+miskeyed or misleading question; those are flagged.
+
+Results are written back to the question bank (see QuestionStore.set_item_parameters).
+
+Usage:
+python -m upwind.irt_calibration [--model 2pl] [--question-bank bank.db] [--output params.json]
+"""
+
+import argparse
+import json
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from upwind.attempt_journal import AttemptJournal, default_journal_dir
+from upwind.question_store import open_question_store
+
+# Prior variances: abilities ~ N(0, 1), difficulties ~ N(0, 2^2), log discriminations ~ N(0, 0.5^2).
+THETA_PRIOR_VAR = 1.0
+DIFFICULTY_PRIOR_VAR = 4.0
+LOG_DISCRIMINATION_PRIOR_VAR = 0.25
+MAX_NEWTON_STEP = 1.0
+
+
+class ResponseData:
+    """ Responses as parallel integer arrays: examinee `persons[k]` answered question `item_ids[items[k]]`. """
+
+    def __init__(self, persons, items, correct, num_persons, item_ids):
+        self.persons = persons
+        self.items = items
+        self.correct = correct
+        self.num_persons = num_persons
+        self.item_ids = item_ids
+        self.skipped = 0  # Records left out by load_responses because the bank has no such question
+
+    def __len__(self):
+        return len(self.correct)
+
+
+class CalibrationResult:
+    def __init__(self, item_ids, difficulty, discrimination, point_biserial, responses, theta, iterations):
+        self.item_ids = item_ids
+        self.difficulty = difficulty
+        self.discrimination = discrimination
+        self.point_biserial = point_biserial
+        self.responses = responses
+        self.theta = theta
+        self.iterations = iterations
+
+    def item_parameters(self, min_responses=30):
+        """ Returns {question_id: record} in the format stored by QuestionStore.set_item_parameters. """
+        parameters = {}
+        for j, question_id in enumerate(self.item_ids):
+            responses = int(self.responses[j])
+            correlation = float(self.point_biserial[j])
+            parameters[question_id] = {
+                "difficulty": round(float(self.difficulty[j]), 4),
+                "discrimination": round(float(self.discrimination[j]), 4),
+                "point_biserial": round(correlation, 4),
+                "responses": responses,
+                "flagged": responses >= min_responses and correlation < 0,
+            }
+        return parameters
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("IRT calibration requires NumPy (pip install numpy).")
+
+
+def load_responses(records, question_ids=None):
+    """
+    Builds ResponseData from an iterable of AttemptRecords. With question_ids (a set),
+    records of other questions are left out; ResponseData.skipped counts them.
+    """
+    _require_numpy()
+    person_of, item_of, item_ids = {}, {}, []
+    persons, items, correct = array('q'), array('q'), array('b')
+    skipped = 0
+    for record in records:
+        if question_ids is not None and record.question_id not in question_ids:
+            skipped += 1
+            continue
+        person = person_of.get(record.session_id)
+        if person is None:
+            person = person_of[record.session_id] = len(person_of)
+        item = item_of.get(record.question_id)
+        if item is None:
+            item = item_of[record.question_id] = len(item_ids)
+            item_ids.append(record.question_id)
+        persons.append(person)
+        items.append(item)
+        correct.append(1 if record.correct else 0)
+    data = ResponseData(np.frombuffer(persons, dtype=np.int64), np.frombuffer(items, dtype=np.int64),
+                        np.frombuffer(correct, dtype=np.int8).astype(np.float64), len(person_of), item_ids)
+    data.skipped = skipped
+    return data
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30.0, 30.0)))
+
+
+def _newton_step(gradient, curvature):
+    return np.clip(gradient / curvature, -MAX_NEWTON_STEP, MAX_NEWTON_STEP)
+
+
+def point_biserial(data):
+    """ Per-item correlation between item correctness and the examinee's rest-of-quiz proportion correct. """
+    _require_numpy()
+    persons, items, y = data.persons, data.items, data.correct
+    num_items = len(data.item_ids)
+    person_total = np.bincount(persons, weights=y, minlength=data.num_persons)
+    person_count = np.bincount(persons, minlength=data.num_persons)
+    others = person_count[persons] - 1
+    usable = others > 0
+    rest = np.where(usable, (person_total[persons] - y) / np.maximum(others, 1), 0.0)
+    items, x, z = items[usable], y[usable], rest[usable]
+    n = np.bincount(items, minlength=num_items).astype(np.float64)
+    safe_n = np.maximum(n, 1)
+    mean_x = np.bincount(items, weights=x, minlength=num_items) / safe_n
+    mean_z = np.bincount(items, weights=z, minlength=num_items) / safe_n
+    cov = np.bincount(items, weights=x * z, minlength=num_items) / safe_n - mean_x * mean_z
+    var_x = np.bincount(items, weights=x * x, minlength=num_items) / safe_n - mean_x ** 2
+    var_z = np.bincount(items, weights=z * z, minlength=num_items) / safe_n - mean_z ** 2
+    denominator = np.sqrt(var_x * var_z)
+    return np.where(denominator > 1e-12, cov / np.where(denominator > 1e-12, denominator, 1.0), 0.0)
+
+
+def calibrate(data, model="2pl", max_iterations=50, tolerance=1e-3):
+    """ Fits a 1PL or 2PL model to ResponseData and returns a CalibrationResult. """
+    _require_numpy()
+    persons, items, y = data.persons, data.items, data.correct
+    num_persons, num_items = data.num_persons, len(data.item_ids)
+    responses = np.bincount(items, minlength=num_items)
+
+    # Start difficulties at the logit of each question's miss rate.
+    p_correct = (np.bincount(items, weights=y, minlength=num_items) + 0.5) / (responses + 1.0)
+    difficulty = np.log((1.0 - p_correct) / p_correct)
+    log_discrimination = np.zeros(num_items)
+    theta = np.zeros(num_persons)
+
+    iteration = 0
+    for iteration in range(1, max_iterations + 1):
+        a = np.exp(log_discrimination)
+        a_k = a[items]
+        b_k = difficulty[items]
+
+        # Abilities
+        p = _sigmoid(a_k * (theta[persons] - b_k))
+        gradient = np.bincount(persons, weights=a_k * (y - p), minlength=num_persons) - theta / THETA_PRIOR_VAR
+        curvature = np.bincount(persons, weights=a_k * a_k * p * (1.0 - p), minlength=num_persons) + 1.0 / THETA_PRIOR_VAR
+        theta_step = _newton_step(gradient, curvature)
+        theta += theta_step
+        theta_k = theta[persons]
+
+        # Difficulties
+        p = _sigmoid(a_k * (theta_k - b_k))
+        gradient = -np.bincount(items, weights=a_k * (y - p), minlength=num_items) - difficulty / DIFFICULTY_PRIOR_VAR
+        curvature = np.bincount(items, weights=a_k * a_k * p * (1.0 - p), minlength=num_items) + 1.0 / DIFFICULTY_PRIOR_VAR
+        difficulty_step = _newton_step(gradient, curvature)
+        difficulty += difficulty_step
+        largest_step = max(np.abs(theta_step).max(initial=0.0), np.abs(difficulty_step).max(initial=0.0))
+
+        # Discriminations are fitted on the log scale, so they stay positive.
+        if model == "2pl":
+            distance = theta_k - difficulty[items]
+            p = _sigmoid(a_k * distance)
+            gradient = (a * np.bincount(items, weights=distance * (y - p), minlength=num_items)
+                        - log_discrimination / LOG_DISCRIMINATION_PRIOR_VAR)
+            curvature = (a * a * np.bincount(items, weights=distance * distance * p * (1.0 - p), minlength=num_items)
+                         + 1.0 / LOG_DISCRIMINATION_PRIOR_VAR)
+            discrimination_step = _newton_step(gradient, curvature)
+            log_discrimination += discrimination_step
+            largest_step = max(largest_step, np.abs(discrimination_step).max(initial=0.0))
+
+        if largest_step < tolerance:
+            break
+
+    return CalibrationResult(data.item_ids, difficulty, np.exp(log_discrimination), point_biserial(data),
+                             responses, theta, iteration)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.irt_calibration",
+                                     description="Calibrate question difficulty and discrimination from recorded attempts.")
+    parser.add_argument("--question-bank", metavar="PATH", help="bank to calibrate (default: built-in pool)")
+    parser.add_argument("--journal", metavar="DIR", help="attempt journal directory (default: the bank's journal)")
+    parser.add_argument("--model", choices=("1pl", "2pl"), default="2pl")
+    parser.add_argument("--max-iterations", type=int, default=50)
+    parser.add_argument("--min-responses", type=int, default=30, help="responses needed before a question can be flagged")
+    parser.add_argument("--output", metavar="JSON", help="also write the parameters to this file")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        parser.error("IRT calibration requires NumPy (pip install numpy).")
+    try:
+        store = open_question_store(args.question_bank)
+    except FileNotFoundError as error:
+        parser.error(str(error))
+    try:
+        # Only the bank's own attempts, and only questions it still contains, are calibrated.
+        journal = AttemptJournal(args.journal or default_journal_dir(store.path))
+        data = load_responses(journal.iter_records(), set(store.question_ids()))
+        journal.close()
+        if data.skipped:
+            print(f"Skipped {data.skipped} recorded answers to questions that are not in the bank.", file=sys.stderr)
+        if not len(data):
+            print("No recorded attempts to calibrate.", file=sys.stderr)
+            return
+        result = calibrate(data, args.model, args.max_iterations)
+        parameters = result.item_parameters(args.min_responses)
+        store.set_item_parameters(parameters)
+    finally:
+        store.close()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({str(k): v for k, v in parameters.items()}, f, indent=1)
+
+    print(f"Calibrated {len(parameters)} questions from {len(data)} responses by {data.num_persons} examinees "
+          f"({args.model.upper()}, {result.iterations} iterations).", file=sys.stderr)
+    ordered = sorted(parameters.items(), key=lambda item: item[1]["difficulty"])
+    print("  Easiest: " + ", ".join(str(question_id) for question_id, _ in ordered[:5]), file=sys.stderr)
+    print("  Hardest: " + ", ".join(str(question_id) for question_id, _ in ordered[-5:]), file=sys.stderr)
+    flagged = [question_id for question_id, record in ordered if record["flagged"]]
+    print(f"  Flagged (negative point-biserial): {', '.join(map(str, flagged)) or 'none'}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
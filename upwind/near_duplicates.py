@@ -0,0 +1,370 @@
+"""
+upwind/near_duplicates.py
+
+Near-duplicate question detection with MinHash and LSH.
+
+Each question becomes a set of shingles: the search tokens (see search_index.tokenize) of
+its text and of its correct answer, each answer token counted ANSWER_WEIGHT times. The
+wrong options are left out, since questions that ask different things over the same
+options ("What does a solid magenta line depict?" / "... a solid blue line ...") share
+all of them. Two questions are near-duplicates when their weighted shingle sets have a
+Jaccard similarity of at least the threshold (0.3 by default). That catches repeated
+questions and paraphrases that state the same fact in other words (the 254-pound empty
+weight asked about directly or through a 260-pound vehicle).
+
+Wording alone can't tell a paraphrase from a question about the neighbouring fact, so
+the correct answers have the last word: two similar questions are only joined when their
+correct answers share a token ("Fatigue" vs. "Stress" for two letters of IMSAFE), and
+never, not even through a chain of others, when one's correct answer is a wrong option
+of the other or when both correct answers state numbers and share none (254 vs. 155
+pounds). BUILTIN_NEAR_DUPLICATES and BUILTIN_DISTINCT pin examples from the built-in
+pool; --check verifies them.
+
+Comparing every pair is quadratic, so instead:
+    1. every shingle set gets a MinHash signature of NUM_PERMUTATIONS values
+       min((a_i * h(s) + b_i) mod p), one per random hash function i; two signatures
+       agree in a fraction of places that estimates the Jaccard similarity,
+    2. the signatures are cut into bands of a few rows, and questions whose signatures
+       agree on a whole band land in the same bucket. Band sizes are chosen so a pair at
+       the threshold shares a bucket with near certainty while dissimilar pairs rarely do.
+       Every pair in a bucket is a candidate, except in buckets of more than
+       BUCKET_PAIR_LIMIT questions (mostly copies of one question), where each question
+       is only paired with the one before it,
+    3. only those candidate pairs are checked: first by their signature agreement, then
+       by their exact similarity. The pairs that pass (and whose answers overlap) are
+       joined into clusters with union-find, most similar first, unless the two
+       clusters' answers conflict.
+Everything is linear in the bank size apart from the candidate checks. With NumPy
+installed, signatures and bucketing are vectorized, and a 100k-question bank takes
+about 20 seconds. Without it, pure Python handles the built-in pool instantly but is slow for
+very large banks.
+
+Clusters are stored in the question bank as {question_id: cluster_id} for every question
+that has a near-duplicate (see QuestionStore.set_duplicate_clusters). The cluster ID is
+the cluster's smallest question ID. ExamComposer then never draws two questions of one
+cluster into the same quiz. Rerun this tool after changing the bank.
+
+Usage:
+python -m upwind.near_duplicates [--question-bank bank.db] [--threshold 0.3] [--show 10] [--dry-run]
+python -m upwind.near_duplicates --check                (verify the pinned pairs of the built-in pool)
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+import zlib
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from upwind.question_store import open_question_store
+from upwind.search_index import tokenize
+
+DEFAULT_THRESHOLD = 0.3
+ANSWER_WEIGHT = 3               # Copies of each correct-answer shingle, against one per question-text shingle
+NUM_PERMUTATIONS = 128
+MERSENNE_PRIME = (1 << 31) - 1  # Keeps a * h + b below 2**63, so NumPy can use uint64
+CHUNK_SIZE = 5000               # Questions fetched, and signed, per batch
+DEFAULT_SEED = 103
+BUCKET_PAIR_LIMIT = 32          # Buckets up to this size yield all their pairs, larger ones a chain
+
+# Built-in pool question IDs that must share a cluster at the default settings: the
+# 254-pound and 5-gallon paraphrases (1 and 29 join through 7).
+BUILTIN_NEAR_DUPLICATES = ((0, 5), (1, 7), (7, 29))
+# ... and pairs that must not: the hazardous-attitude antidotes, solid magenta vs. solid
+# blue lines, and the pitch vs. roll control surfaces ask different things in like words.
+BUILTIN_DISTINCT = ((275, 280), (275, 285), (275, 294), (280, 285), (280, 294), (285, 294),
+                    (65, 69), (186, 69), (126, 127))
+
+_COPY_SALTS = [bytes([0, copy]) for copy in range(1, ANSWER_WEIGHT)]
+
+
+def shingles(question):
+    """
+    The question's shingle set: 31-bit hashes of the search tokens of its text, plus
+    ANSWER_WEIGHT salted copies of each token of its correct answer.
+    """
+    shingle_set = {zlib.crc32(token.encode("utf-8")) & MERSENNE_PRIME for token in tokenize(question['question_text'])}
+    for token in tokenize(question['correct_answer']):
+        crc = zlib.crc32(token.encode("utf-8"))
+        shingle_set.add(crc & MERSENNE_PRIME)  # The first copy matches the same token in the question text
+        shingle_set.update(zlib.crc32(salt, crc) & MERSENNE_PRIME for salt in _COPY_SALTS)
+    return shingle_set
+
+
+def answer_key(question):
+    """
+    (correct answer, wrong options, numbers in the correct answer) of question, the first
+    two as normalized token strings. Used to veto clustering questions that state different facts.
+    """
+    correct = question['correct_answer']
+    wrong = frozenset(" ".join(tokenize(option)) for option in question['options'] if option != correct)
+    tokens = tokenize(correct)
+    return " ".join(tokens), wrong, frozenset(token for token in tokens if token.isdigit())
+
+
+def jaccard(first, second):
+    """ Jaccard similarity of two shingle sets (two empty sets count as identical). """
+    union = len(first | second)
+    return len(first & second) / union if union else 1.0
+
+
+def lsh_bands(num_permutations, threshold):
+    """
+    Returns (bands, rows) for banding signatures of num_permutations values. Uses the most
+    rows per band whose S-curve midpoint (1 / bands) ** (1 / rows) is at most 0.8 x
+    threshold, so pairs at the threshold are almost never missed.
+    """
+    for rows in range(num_permutations, 0, -1):
+        bands = num_permutations // rows
+        if (1.0 / bands) ** (1.0 / rows) <= 0.8 * threshold:
+            return bands, rows
+    return num_permutations, 1
+
+
+class MinHasher:
+    """ MinHash signatures under NUM_PERMUTATIONS seeded universal hash functions. """
+
+    def __init__(self, num_permutations=NUM_PERMUTATIONS, seed=DEFAULT_SEED):
+        rng = random.Random(seed)
+        self.a = [rng.randrange(1, MERSENNE_PRIME) for _ in range(num_permutations)]
+        self.b = [rng.randrange(0, MERSENNE_PRIME) for _ in range(num_permutations)]
+
+    def signature(self, shingle_set):
+        """ Pure-Python signature of one shingle set, as a tuple. """
+        shingle_set = shingle_set or (MERSENNE_PRIME,)  # The same sentinel as signatures() uses
+        return tuple(min((a * shingle + b) % MERSENNE_PRIME for shingle in shingle_set)
+                     for a, b in zip(self.a, self.b))
+
+    def signatures(self, shingle_sets):
+        """ Signatures of many shingle sets as one (len(shingle_sets), NUM_PERMUTATIONS) uint64 array. """
+        lengths = np.fromiter((max(len(s), 1) for s in shingle_sets), dtype=np.int64, count=len(shingle_sets))
+        # An empty set gets a single sentinel shingle, so every segment for reduceat is non-empty.
+        values = np.fromiter((shingle for s in shingle_sets for shingle in (s or (MERSENNE_PRIME,))),
+                             dtype=np.uint64, count=int(lengths.sum()))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        result = np.empty((len(shingle_sets), len(self.a)), dtype=np.uint64)
+        for i, (a, b) in enumerate(zip(self.a, self.b)):
+            hashed = (values * np.uint64(a) + np.uint64(b)) % np.uint64(MERSENNE_PRIME)
+            result[:, i] = np.minimum.reduceat(hashed, starts)
+        return result
+
+
+def _answers_overlap(correct, other_correct):
+    return correct == other_correct or not set(correct.split()).isdisjoint(other_correct.split())
+
+
+class _DisjointSets:
+    def __init__(self, answer_keys=None):
+        self.parent = {}
+        self.answer_keys = answer_keys  # {item: answer_key()}, or None to join without checking answers
+        self.answers = {}  # root -> (correct answers, wrong options, non-empty number sets) of its set
+
+    def find(self, item):
+        parent = self.parent.setdefault(item, item)
+        while parent != item:
+            grandparent = self.parent.setdefault(parent, parent)
+            self.parent[item] = grandparent
+            item, parent = parent, grandparent
+        return item
+
+    def _answers(self, root):
+        if root not in self.answers:
+            correct, wrong, numbers = self.answer_keys[root]
+            self.answers[root] = ({correct}, set(wrong), {numbers} if numbers else set())
+        return self.answers[root]
+
+    def union(self, first, second):
+        """ Joins the sets of first and second unless their answers conflict. """
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.answer_keys is not None:
+            (correct, wrong, numbers), (other_correct, other_wrong, other_numbers) = \
+                self._answers(first), self._answers(second)
+            if (correct & other_wrong or other_correct & wrong or
+                    any(a.isdisjoint(b) for a in numbers for b in other_numbers)):
+                return
+            correct |= other_correct
+            wrong |= other_wrong
+            numbers |= other_numbers
+            self.answers[min(first, second)] = (correct, wrong, numbers)
+            self.answers.pop(max(first, second), None)
+        self.parent[max(first, second)] = min(first, second)
+
+
+def _candidate_pairs_python(signatures, bands, rows):
+    """ (earlier, later) position pairs sharing a band bucket: all pairs of a small bucket, a chain through a large one. """
+    for band in range(bands):
+        buckets = {}
+        for position, signature in enumerate(signatures):
+            buckets.setdefault(signature[band * rows:(band + 1) * rows], []).append(position)
+        for bucket in buckets.values():
+            if len(bucket) <= BUCKET_PAIR_LIMIT:
+                yield from itertools.combinations(bucket, 2)
+            else:
+                yield from zip(bucket, bucket[1:])
+
+
+def _candidate_pairs_numpy(signatures, bands, rows):
+    """ Unique (earlier, later) position pairs sharing a band bucket, as two int64 arrays (see _candidate_pairs_python). """
+    # Each band's rows are mixed into one 64-bit key; a collision only adds a candidate to check.
+    multipliers = np.array([0x9E3779B97F4A7C15 * (2 * j + 1) & 0xFFFFFFFFFFFFFFFF for j in range(rows)], dtype=np.uint64)
+    pairs = []  # earlier * count + later
+    for band in range(bands):
+        keys = (signatures[:, band * rows:(band + 1) * rows] * multipliers).sum(axis=1, dtype=np.uint64)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        run_start = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+        starts = np.flatnonzero(run_start)
+        run_length = np.diff(np.append(starts, len(order)))
+        in_run = np.arange(len(order)) - np.repeat(starts, run_length)  # Place of each member in its bucket
+        small = np.repeat(run_length <= BUCKET_PAIR_LIMIT, run_length)
+        # Pair each member with the one `distance` places before it: every distance in a small bucket, 1 in a large one.
+        for distance in range(1, min(BUCKET_PAIR_LIMIT, int(run_length.max()))):
+            paired = np.flatnonzero((in_run >= distance) & (small | (distance == 1)))
+            pairs.append(order[paired - distance].astype(np.int64) * len(order) + order[paired])
+    if not pairs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.unique(np.concatenate(pairs))  # One int64 per pair sorts much faster than rows
+    return pairs // len(order), pairs % len(order)
+
+
+def find_clusters(question_ids, shingle_sets, threshold=DEFAULT_THRESHOLD, num_permutations=NUM_PERMUTATIONS,
+                  seed=DEFAULT_SEED, use_numpy=None, answer_keys=None):
+    """
+    Returns {question_id: cluster_id} for every question with a Jaccard similarity of at
+    least threshold to another question (directly or through a chain of such questions).
+    cluster_id is the smallest question ID in the cluster. With answer_keys (answer_key()
+    of each question), questions whose correct answers share no token are not joined, and
+    clusters whose answers conflict are kept apart.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    hasher = MinHasher(num_permutations, seed)
+    bands, rows = lsh_bands(num_permutations, threshold)
+    # Signature agreement below half the threshold rules a candidate out cheaply (a pair at
+    # the threshold lands there less than once in 10,000); the rest get their exact
+    # similarity, so the clusters don't depend on the seed near the threshold.
+    needed = 0.5 * threshold * num_permutations - 1e-9
+    candidates = []
+    if use_numpy and len(shingle_sets):
+        signatures = np.concatenate([hasher.signatures(shingle_sets[start:start + CHUNK_SIZE])
+                                     for start in range(0, len(shingle_sets), CHUNK_SIZE)])
+        firsts, others = _candidate_pairs_numpy(signatures, bands, rows)
+        for start in range(0, len(firsts), CHUNK_SIZE):
+            first, other = firsts[start:start + CHUNK_SIZE], others[start:start + CHUNK_SIZE]
+            agreements = (signatures[first] == signatures[other]).sum(axis=1)
+            passed = agreements >= needed
+            candidates.extend(zip(first[passed].tolist(), other[passed].tolist()))
+    else:
+        signatures = [hasher.signature(shingle_set) for shingle_set in shingle_sets]
+        checked = set()
+        for i, j in _candidate_pairs_python(signatures, bands, rows):
+            if (i, j) in checked:
+                continue
+            checked.add((i, j))
+            if sum(x == y for x, y in zip(signatures[i], signatures[j])) >= needed:
+                candidates.append((i, j))
+    pairs = []  # (-similarity, i, j)
+    for i, j in candidates:
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity >= threshold - 1e-9:
+            pairs.append((-similarity, i, j))
+    # Most similar pairs first, so a vetoed join can't keep out a closer paraphrase.
+    pairs.sort()
+    keys = None if answer_keys is None else dict(zip(question_ids, answer_keys))
+    clusters = _DisjointSets(keys)
+    for _, i, j in pairs:
+        if answer_keys is not None and not _answers_overlap(answer_keys[i][0], answer_keys[j][0]):
+            continue
+        clusters.union(question_ids[i], question_ids[j])
+    found = {question_id: clusters.find(question_id) for question_id in clusters.parent}
+    sizes = Counter(found.values())  # A vetoed join leaves singletons behind
+    return {question_id: cluster_id for question_id, cluster_id in found.items() if sizes[cluster_id] > 1}
+
+
+def find_store_clusters(question_store, threshold=DEFAULT_THRESHOLD, **options):
+    """ Shingles every question of question_store (in chunks) and returns its clusters. """
+    question_ids = list(question_store.question_ids())
+    shingle_sets, answer_keys = [], []
+    for start in range(0, len(question_ids), CHUNK_SIZE):
+        chunk = question_ids[start:start + CHUNK_SIZE]
+        for question in question_store.get_questions(chunk):
+            shingle_sets.append(shingles(question))
+            answer_keys.append(answer_key(question))
+    return find_clusters(question_ids, shingle_sets, threshold, answer_keys=answer_keys, **options)
+
+
+def check_builtin_clusters(clusters):
+    """ Returns a message for every pinned pair of the built-in pool that clusters wrongly; empty if all pass. """
+    problems = []
+    for first, second in BUILTIN_NEAR_DUPLICATES:
+        if first not in clusters or clusters.get(first) != clusters.get(second):
+            problems.append(f"Questions {first} and {second} should be near-duplicates but are not clustered.")
+    for first, second in BUILTIN_DISTINCT:
+        if first in clusters and clusters.get(first) == clusters.get(second):
+            problems.append(f"Questions {first} and {second} ask different things but share cluster {clusters[first]}.")
+    return problems
+
+
+def group_clusters(clusters):
+    """ {cluster_id: [question_id, ...]} from a {question_id: cluster_id} map, largest clusters first. """
+    groups = {}
+    for question_id, cluster_id in clusters.items():
+        groups.setdefault(cluster_id, []).append(question_id)
+    return dict(sorted(groups.items(), key=lambda item: (-len(item[1]), item[0])))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.near_duplicates",
+                                     description="Find near-duplicate questions and store them as clusters for the quiz sampler.")
+    parser.add_argument("--question-bank", metavar="PATH", help="SQLite (.db) or JSON question bank (default: built-in pool)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Jaccard similarity of near-duplicates, 0-1 (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--show", type=int, default=10, metavar="N", help="print the N largest clusters (default: 10)")
+    parser.add_argument("--dry-run", action="store_true", help="report the clusters without storing them")
+    parser.add_argument("--check", action="store_true",
+                        help="verify the pinned pairs of the built-in pool (nothing is stored); exit status 1 on a mismatch")
+    args = parser.parse_args(argv)
+
+    if not 0.0 < args.threshold <= 1.0:
+        parser.error("--threshold must be between 0 and 1")
+    if args.check and args.question_bank:
+        parser.error("--check only applies to the built-in pool")
+    start = time.perf_counter()
+    try:
+        store = open_question_store(args.question_bank)
+    except FileNotFoundError as error:
+        parser.error(str(error))
+    try:
+        clusters = find_store_clusters(store, args.threshold, seed=args.seed)
+        groups = group_clusters(clusters)
+        stored = not (args.dry_run or args.check)
+        if stored:
+            store.set_duplicate_clusters(clusters)
+        print(f"Found {len(groups)} clusters covering {len(clusters)} of {len(store)} questions "
+              f"in {time.perf_counter() - start:.2f} s{'' if stored else ' (not stored)'}.", file=sys.stderr)
+        for cluster_id, members in list(groups.items())[:args.show]:
+            print(f"  Cluster {cluster_id} ({len(members)} questions):")
+            for question in store.get_questions(members):
+                print(f"    {question['question_text'][:100]}")
+        if args.check:
+            problems = check_builtin_clusters(clusters)
+            for problem in problems:
+                print(problem, file=sys.stderr)
+            if problems:
+                raise SystemExit(1)
+            print(f"All {len(BUILTIN_NEAR_DUPLICATES) + len(BUILTIN_DISTINCT)} pinned pairs pass.", file=sys.stderr)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
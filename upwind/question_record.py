@@ -0,0 +1,86 @@
+"""
+upwind/question_record.py
+
+Compact, immutable question records.
+
+A Question is a named tuple (category, question_text, options, correct_index,
+explanation, tags). The options are a tuple stored once, and the correct answer is an
+index into them rather than another copy of the string. The short strings that repeat
+across a bank (category names, options, tags) are interned, so each distinct one is
+stored once however many questions use it. A record has no per-instance dict, and nothing can change it after it
+is built, so one pool can be shared by any number of sessions and threads. Sessions
+shuffle options through their own permutation arrays (see QuizSession) and grade by
+comparing option indices.
+
+Records still answer the dict-style lookups the rest of the code uses
+(question['question_text'], question['correct_answer'], question.get('tags', ())), so
+they can stand in for the question dicts of the bank files.
+"""
+
+import sys
+from collections import namedtuple
+
+NO_OPTION = -1  # correct_index-style value for an answer that is not one of the options
+
+_QuestionFields = namedtuple("_QuestionFields", "category question_text options correct_index explanation tags")
+
+
+class Question(_QuestionFields):
+    __slots__ = ()
+
+    KEYS = ("category", "question_text", "options", "correct_answer", "explanation", "tags")
+
+    @property
+    def correct_answer(self):
+        return self.options[self.correct_index]
+
+    def option_index(self, option):
+        """ Index of option text among the options, or NO_OPTION. """
+        try:
+            return self.options.index(option)
+        except ValueError:
+            return NO_OPTION
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in Question.KEYS:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in Question.KEYS else None
+        return default if value is None else value
+
+    def to_dict(self):
+        """ The question in the dict format of the bank files. """
+        question = {key: self[key] for key in Question.KEYS if self[key] is not None}
+        question["options"] = list(self.options)
+        question["tags"] = list(self.tags)
+        return question
+
+
+def _intern(text):
+    return sys.intern(text) if type(text) is str else text
+
+
+def make_question(category, question_text, options, correct_answer, explanation="", tags=()):
+    """
+    Builds a Question, interning its category, options and tags. Raises ValueError when
+    correct_answer is not one of the options.
+    """
+    options = tuple(_intern(option) for option in options)
+    try:
+        correct_index = options.index(correct_answer)
+    except ValueError:
+        raise ValueError(f"The correct answer of {question_text!r} is not one of its options.") from None
+    return Question(_intern(category) if category else None, question_text, options, correct_index,
+                    explanation or "", tuple(_intern(tag) for tag in tags))
+
+
+def as_question(question):
+    """ Returns question (a bank-file dict or a Question) as a Question. """
+    if isinstance(question, Question):
+        return question
+    return make_question(question.get("category"), question["question_text"], question["options"],
+                         question["correct_answer"], question.get("explanation", ""), question.get("tags", ()))
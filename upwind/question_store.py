@@ -0,0 +1,500 @@
+"""
+upwind/question_store.py
+
+Pluggable storage for the quiz question bank.
+
+A question store hands out integer question IDs and only materializes the questions a
+quiz actually samples. ListQuestionStore wraps the built-in in-memory list (the default
+backend); SQLiteQuestionStore serves large regional or instructor-authored banks from
+disk, indexed by category, tag and content hash, and keeps explanations in a separate
+table so they are only read when the results page asks for them.
+
+A broken question (no options list, or a correct answer that is not one of its options)
+is reported on stderr and left out: a JSON bank skips it when loaded, an SQLite bank
+refuses it on import and never hands out the ID of a broken row already on disk.
+
+Usage:
+python -m upwind.question_store build bank.db                  (imports the built-in pool)
+python -m upwind.question_store build bank.db --from extra.json (imports a JSON/JSONL bank)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+
+from upwind import question_bank
+from upwind.question_record import Question, as_question, make_question
+
+# SQLite limits the number of bound parameters per statement, so IN (...) lookups are chunked.
+_SQL_CHUNK_SIZE = 500
+
+# Fields of the per-question calibration record written by upwind.irt_calibration.
+ITEM_PARAMETER_FIELDS = ("difficulty", "discrimination", "point_biserial", "responses", "flagged")
+
+
+def default_item_parameters_path():
+    """ Where calibration results for the built-in pool are kept. """
+    return os.path.join(os.path.expanduser("~"), ".upwind", "item_parameters.json")
+
+
+def default_duplicate_clusters_path():
+    """ Where the near-duplicate clusters of the built-in pool are kept. """
+    return os.path.join(os.path.expanduser("~"), ".upwind", "duplicate_clusters.json")
+
+
+def question_content_hash(question):
+    """ Returns a stable SHA-1 hex digest of a question's content, ignoring option order. """
+    payload = json.dumps([question["question_text"], sorted(question["options"]),
+                          question["correct_answer"], question.get("explanation", "")],
+                         ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def question_problem(question):
+    """ Returns why question (a bank-file dict) can't be served, or None when it is usable. """
+    if not isinstance(question, dict):
+        return f"expected a question object, got {type(question).__name__}"
+    missing = [key for key in ("question_text", "options", "correct_answer") if key not in question]
+    if missing:
+        return f"missing {', '.join(missing)}"
+    if not isinstance(question["options"], (list, tuple)):
+        return "options is not a list"
+    if question["correct_answer"] not in question["options"]:
+        return f"the correct answer {question['correct_answer']!r} is not one of its options"
+    return None
+
+
+def _report_broken(position, source, problem):
+    print(f"Skipped question {position} of {source}: {problem}.", file=sys.stderr)
+
+
+class QuestionStore:
+    """
+    Interface shared by all question bank backends.
+    Questions are addressed by integer ID and returned as immutable Question records
+    (see upwind/question_record.py), which also answer the dict-style lookups of the
+    bank files ('question_text', 'options', 'correct_answer' and, when loaded, 'explanation').
+    path is the bank's file, or None for the built-in pool; question IDs only mean
+    something within one bank, so per-learner history is kept per path.
+    """
+
+    path = None
+
+    def __len__(self):
+        return len(self.question_ids())
+
+    def question_ids(self):
+        """ Returns a sequence of every question ID in the bank. """
+        raise NotImplementedError
+
+    def categories(self):
+        """ Returns the distinct category names in the bank. """
+        return list(self.category_index())
+
+    def category_index(self):
+        """ Returns the precomputed {category: [question_id, ...]} map. Callers must not modify it. """
+        raise NotImplementedError
+
+    def ids_for_category(self, category):
+        return self.category_index().get(category, [])
+
+    def ids_for_tag(self, tag):
+        raise NotImplementedError
+
+    def id_for_hash(self, content_hash):
+        """ Returns the ID of the question with the given content hash, or None. """
+        raise NotImplementedError
+
+    def get_questions(self, question_ids):
+        """ Returns the questions for question_ids, in the same order. Explanations may be omitted. """
+        raise NotImplementedError
+
+    def get_explanations(self, question_ids):
+        """ Returns a {question_id: explanation} dict for question_ids. """
+        raise NotImplementedError
+
+    def get_item_parameters(self):
+        """ Returns {question_id: {field: value}} calibration records (see ITEM_PARAMETER_FIELDS). """
+        raise NotImplementedError
+
+    def set_item_parameters(self, parameters):
+        """ Stores calibration records, replacing any earlier ones for the same questions. """
+        raise NotImplementedError
+
+    def get_duplicate_clusters(self):
+        """ Returns {question_id: cluster_id} for the questions that have near-duplicates (see upwind.near_duplicates). """
+        return {}
+
+    def set_duplicate_clusters(self, clusters):
+        """ Replaces all stored near-duplicate clusters with clusters. """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class ListQuestionStore(QuestionStore):
+    """
+    Default backend: serves an in-memory list of questions, addressed by list position.
+    Question dicts are converted to shared Question records once, when the store is built;
+    broken ones are skipped, keeping the positions (and so the IDs) of the rest.
+    Calibration records and near-duplicate clusters are kept in JSON sidecar files when
+    item_parameters_path and clusters_path are given. Both are stored by content hash, so
+    they still apply after questions are added, removed or reordered in the bank, and a
+    question whose content changed loses its calibration.
+    """
+
+    def __init__(self, questions, item_parameters_path=None, clusters_path=None, path=None):
+        self.path = path
+        self._questions = []  # None in place of a broken question
+        for position, question in enumerate(questions):
+            problem = None if isinstance(question, Question) else question_problem(question)
+            if problem:
+                _report_broken(position, path or "the question list", problem)
+            self._questions.append(None if problem else as_question(question))
+        self._ids = [question_id for question_id, question in enumerate(self._questions) if question is not None]
+        self.item_parameters_path = item_parameters_path
+        self._item_parameters = None
+        self.clusters_path = clusters_path
+        self._clusters = None
+        self._category_index, self._tag_index = {}, {}
+        for question_id in self._ids:
+            question = self._questions[question_id]
+            category = question.get("category")
+            if category:
+                self._category_index.setdefault(category, []).append(question_id)
+            for tag in question.get("tags", ()):
+                self._tag_index.setdefault(tag, []).append(question_id)
+        self._hashes = None
+        self._hash_index = None
+
+    def __len__(self):
+        return len(self._ids)
+
+    def question_ids(self):
+        return self._ids
+
+    def category_index(self):
+        return self._category_index
+
+    def ids_for_tag(self, tag):
+        return self._tag_index.get(tag, [])
+
+    def _content_hashes(self):
+        """ {question_id: question_content_hash}; identical questions share a hash. """
+        # Hashing the whole pool is only worth doing once somebody actually needs a hash.
+        if self._hashes is None:
+            self._hashes = {i: question_content_hash(self._questions[i]) for i in self._ids}
+        return self._hashes
+
+    def id_for_hash(self, content_hash):
+        if self._hash_index is None:
+            self._hash_index = {content_hash: i for i, content_hash in self._content_hashes().items()}
+        return self._hash_index.get(content_hash)
+
+    def get_questions(self, question_ids):
+        return [self._questions[question_id] for question_id in question_ids]
+
+    def get_explanations(self, question_ids):
+        return {question_id: self._questions[question_id].get("explanation", "") for question_id in question_ids}
+
+    def get_item_parameters(self):
+        if self._item_parameters is None:
+            self._item_parameters = {}
+            if self.item_parameters_path:
+                try:
+                    with open(self.item_parameters_path, encoding="utf-8") as f:
+                        stored = json.load(f)  # {content_hash: parameters}
+                except FileNotFoundError:
+                    stored = {}
+                for question_id, content_hash in self._content_hashes().items():
+                    if content_hash in stored:
+                        self._item_parameters[question_id] = stored[content_hash]
+        return self._item_parameters
+
+    def set_item_parameters(self, parameters):
+        self.get_item_parameters().update(parameters)
+        if self.item_parameters_path:
+            hashes = self._content_hashes()
+            os.makedirs(os.path.dirname(os.path.abspath(self.item_parameters_path)), exist_ok=True)
+            with open(self.item_parameters_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({hashes[k]: v for k, v in self._item_parameters.items() if k in hashes}, f)
+            os.replace(self.item_parameters_path + ".tmp", self.item_parameters_path)
+
+    def get_duplicate_clusters(self):
+        if self._clusters is None:
+            self._clusters = {}
+            if self.clusters_path:
+                try:
+                    with open(self.clusters_path, encoding="utf-8") as f:
+                        stored = json.load(f)  # {content_hash: content hash of the cluster's first question}
+                except FileNotFoundError:
+                    stored = {}
+                # Every question is hashed, not looked up by hash, since identical questions share one.
+                members = {}
+                for question_id, content_hash in self._content_hashes().items():
+                    cluster = stored.get(content_hash)
+                    if cluster is not None:
+                        members.setdefault(cluster, []).append(question_id)
+                for question_ids in members.values():
+                    if len(question_ids) > 1:
+                        self._clusters.update(dict.fromkeys(question_ids, min(question_ids)))
+        return self._clusters
+
+    def set_duplicate_clusters(self, clusters):
+        self._clusters = dict(clusters)
+        if self.clusters_path:
+            hashes = self._content_hashes()
+            os.makedirs(os.path.dirname(os.path.abspath(self.clusters_path)), exist_ok=True)
+            with open(self.clusters_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({hashes[k]: hashes[v] for k, v in self._clusters.items()}, f)
+            os.replace(self.clusters_path + ".tmp", self.clusters_path)
+
+
+class SQLiteQuestionStore(QuestionStore):
+    """
+    Disk-backed bank for large question sets. Rows are fetched only when sampled.
+    Rows whose correct answer is not among their options (imported by an older build, or
+    edited by hand) are left out of every ID lookup, so no quiz ever samples them.
+    """
+
+    # SQL condition that is true for the rows get_questions() can serve.
+    VALID_ROW = ("CASE WHEN json_valid(options) AND json_type(options) = 'array' "
+                 "THEN EXISTS (SELECT 1 FROM json_each(options) WHERE json_each.value = correct_answer) "
+                 "ELSE 0 END")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY,
+            category TEXT,
+            content_hash TEXT NOT NULL UNIQUE,
+            question_text TEXT NOT NULL,
+            options TEXT NOT NULL,
+            correct_answer TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_questions_category ON questions(category);
+        CREATE TABLE IF NOT EXISTS explanations (
+            question_id INTEGER PRIMARY KEY REFERENCES questions(id),
+            explanation TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS question_tags (
+            tag TEXT NOT NULL,
+            question_id INTEGER NOT NULL REFERENCES questions(id),
+            PRIMARY KEY (tag, question_id)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS item_parameters (
+            question_id INTEGER PRIMARY KEY REFERENCES questions(id),
+            difficulty REAL,
+            discrimination REAL,
+            point_biserial REAL,
+            responses INTEGER,
+            flagged INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS duplicate_clusters (
+            question_id INTEGER PRIMARY KEY REFERENCES questions(id),
+            cluster_id INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # The app opens the bank on its loader thread and then reads it on the Tk thread; the
+        # two never use it at the same time, so the connection may change threads.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+        self._ids = None
+        self._category_index = None
+
+    def __len__(self):
+        return len(self.question_ids())
+
+    def question_ids(self):
+        # Only the integer IDs are cached; question rows stay on disk until sampled.
+        if self._ids is None:
+            self._ids = [row[0] for row in self._conn.execute(
+                f"SELECT id FROM questions WHERE {self.VALID_ROW} ORDER BY id")]
+        return self._ids
+
+    def category_index(self):
+        # One indexed scan of (category, id) pairs; the map is then reused for every quiz.
+        if self._category_index is None:
+            self._category_index = {}
+            for category, question_id in self._conn.execute(
+                    f"SELECT category, id FROM questions WHERE category IS NOT NULL AND {self.VALID_ROW} "
+                    "ORDER BY category, id"):
+                self._category_index.setdefault(category, []).append(question_id)
+        return self._category_index
+
+    def ids_for_tag(self, tag):
+        return [row[0] for row in self._conn.execute(
+            f"SELECT t.question_id FROM question_tags t JOIN questions ON questions.id = t.question_id "
+            f"WHERE t.tag = ? AND {self.VALID_ROW} ORDER BY t.question_id", (tag,))]
+
+    def id_for_hash(self, content_hash):
+        row = self._conn.execute(f"SELECT id FROM questions WHERE content_hash = ? AND {self.VALID_ROW}",
+                                 (content_hash,)).fetchone()
+        return row[0] if row else None
+
+    def _fetch_rows(self, query, question_ids):
+        rows = {}
+        question_ids = list(question_ids)
+        for start in range(0, len(question_ids), _SQL_CHUNK_SIZE):
+            chunk = question_ids[start:start + _SQL_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self._conn.execute(query.format(placeholders), chunk):
+                rows[row[0]] = row[1:]
+        return rows
+
+    def get_questions(self, question_ids):
+        rows = self._fetch_rows(
+            "SELECT id, category, question_text, options, correct_answer FROM questions WHERE id IN ({})",
+            question_ids)
+        questions = []
+        for question_id in question_ids:
+            category, question_text, options, correct_answer = rows[question_id]
+            questions.append(make_question(category, question_text, json.loads(options), correct_answer))
+        return questions
+
+    def get_explanations(self, question_ids):
+        rows = self._fetch_rows("SELECT question_id, explanation FROM explanations WHERE question_id IN ({})",
+                                question_ids)
+        return {question_id: rows[question_id][0] if question_id in rows else "" for question_id in question_ids}
+
+    def get_item_parameters(self):
+        columns = ", ".join(ITEM_PARAMETER_FIELDS)
+        parameters = {}
+        for row in self._conn.execute(f"SELECT question_id, {columns} FROM item_parameters"):
+            record = dict(zip(ITEM_PARAMETER_FIELDS, row[1:]))
+            record["flagged"] = bool(record["flagged"])
+            parameters[row[0]] = record
+        return parameters
+
+    def set_item_parameters(self, parameters):
+        columns = ", ".join(ITEM_PARAMETER_FIELDS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO item_parameters (question_id, {columns}) VALUES (?, ?, ?, ?, ?, ?)",
+                [(question_id, *(record.get(field) for field in ITEM_PARAMETER_FIELDS))
+                 for question_id, record in parameters.items()])
+
+    def iter_stored_questions(self):
+        """
+        Yields (question_id, question dict) for every stored question, explanation and tags
+        included, exactly as stored: unlike get_questions() nothing is validated, so
+        content checks can see broken rows.
+        """
+        tags = {}
+        for tag, question_id in self._conn.execute("SELECT tag, question_id FROM question_tags"):
+            tags.setdefault(question_id, []).append(tag)
+        rows = self._conn.execute(
+            "SELECT q.id, q.category, q.question_text, q.options, q.correct_answer, e.explanation "
+            "FROM questions q LEFT JOIN explanations e ON e.question_id = q.id ORDER BY q.id")
+        for question_id, category, question_text, options, correct_answer, explanation in rows:
+            try:
+                options = json.loads(options)
+            except ValueError:
+                pass  # Left as the raw text for the caller to report
+            question = {"question_text": question_text, "options": options, "correct_answer": correct_answer,
+                        "explanation": explanation or ""}
+            if category is not None:
+                question["category"] = category
+            if question_id in tags:
+                question["tags"] = tags[question_id]
+            yield question_id, question
+
+    def get_duplicate_clusters(self):
+        return dict(self._conn.execute("SELECT question_id, cluster_id FROM duplicate_clusters"))
+
+    def set_duplicate_clusters(self, clusters):
+        with self._conn:
+            self._conn.execute("DELETE FROM duplicate_clusters")
+            self._conn.executemany("INSERT INTO duplicate_clusters (question_id, cluster_id) VALUES (?, ?)",
+                                   clusters.items())
+
+    def add_questions(self, questions):
+        """
+        Imports question dicts, skipping any whose content hash is already stored and
+        reporting (and skipping) broken ones. Returns the number added.
+        """
+        added = 0
+        with self._conn:
+            for position, question in enumerate(questions):
+                problem = question_problem(question)
+                if problem:
+                    _report_broken(position, "the import", problem)
+                    continue
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO questions (category, content_hash, question_text, options, correct_answer) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (question.get("category"), question_content_hash(question), question["question_text"],
+                     json.dumps(question["options"], ensure_ascii=False), question["correct_answer"]))
+                if cursor.rowcount == 0:
+                    continue
+                question_id = cursor.lastrowid
+                self._conn.execute("INSERT INTO explanations (question_id, explanation) VALUES (?, ?)",
+                                   (question_id, question.get("explanation", "")))
+                self._conn.executemany("INSERT OR IGNORE INTO question_tags (tag, question_id) VALUES (?, ?)",
+                                       [(tag, question_id) for tag in question.get("tags", ())])
+                added += 1
+        self._ids = None
+        self._category_index = None
+        return added
+
+    def close(self):
+        self._conn.close()
+
+
+def load_question_file(path):
+    """ Reads question dicts from a JSON list or a JSONL file. """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def open_question_store(path=None):
+    """
+    Opens a question bank by path: None for the built-in pool, a .json/.jsonl file for an
+    in-memory bank, anything else is treated as an SQLite database.
+    """
+    if path is None:
+        return ListQuestionStore(question_bank.get_question_pool(), default_item_parameters_path(),
+                                 default_duplicate_clusters_path())
+    if path.endswith((".json", ".jsonl")):
+        base = os.path.splitext(path)[0]
+        return ListQuestionStore(load_question_file(path), base + ".params.json", base + ".clusters.json", path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Question bank not found: {path}")
+    return SQLiteQuestionStore(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.question_store",
+                                     description="Build and inspect SQLite question banks.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Import questions into an SQLite bank.")
+    build_parser.add_argument("database")
+    build_parser.add_argument("--from", dest="source", help="JSON or JSONL question file (default: built-in pool)")
+    info_parser = subparsers.add_parser("info", help="Show question counts per category.")
+    info_parser.add_argument("database")
+    args = parser.parse_args(argv)
+
+    store = SQLiteQuestionStore(args.database)
+    try:
+        if args.command == "build":
+            questions = load_question_file(args.source) if args.source else question_bank.get_question_pool()
+            added = store.add_questions(questions)
+            print(f"Added {added} of {len(questions)} questions to {args.database} ({len(store)} total).")
+        else:
+            print(f"{args.database}: {len(store)} questions")
+            for category in store.categories():
+                print(f"  {category}: {len(store.ids_for_category(category))}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
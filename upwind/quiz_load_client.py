@@ -0,0 +1,263 @@
+"""
+upwind/quiz_load_client.py
+
+Load client for the classroom quiz server: simulated students each take quizzes start to
+finish (start, answer every question, fetch the results, end) as fast as the server
+replies, over keep-alive HTTP or one WebSocket per student. Reports answer submissions
+and requests per second, request latency percentiles and errors.
+
+With --local a server is started in the same process on a free localhost port, so a
+single command measures the whole stack.
+
+Usage:
+python -m upwind.quiz_load_client --local [--students 200] [--quizzes 5] [--length 20] [--websocket]
+python -m upwind.quiz_load_client --url http://classroom-pc:8103 [--output load.json]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import time
+from urllib.parse import urlsplit
+
+from upwind.quiz_server import (OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG, OPCODE_TEXT, QuizServer, create_service,
+                                encode_websocket_frame, read_http_message, read_websocket_message)
+
+DEFAULT_URL = "http://localhost:8103"
+DEFAULT_STUDENTS = 200
+DEFAULT_QUIZZES = 5
+DEFAULT_LENGTH = 20
+
+
+class LoadStats:
+    """ Request latencies and counts gathered by every simulated student. """
+
+    def __init__(self):
+        self.latencies_ms = []
+        self.answers = 0
+        self.quizzes = 0
+        self.errors = 0
+        self.first_error = None
+
+    def request_done(self, start):
+        self.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    def error(self, message):
+        self.errors += 1
+        if self.first_error is None:
+            self.first_error = message
+
+    def percentile(self, fraction):
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def report(self, elapsed, students, transport):
+        return {"transport": transport, "students": students, "elapsed_seconds": round(elapsed, 3),
+                "quizzes": self.quizzes, "answers": self.answers, "requests": len(self.latencies_ms),
+                "answers_per_second": round(self.answers / elapsed, 1) if elapsed else 0.0,
+                "requests_per_second": round(len(self.latencies_ms) / elapsed, 1) if elapsed else 0.0,
+                "latency_ms": {"p50": round(self.percentile(0.5), 3), "p95": round(self.percentile(0.95), 3),
+                               "p99": round(self.percentile(0.99), 3),
+                               "max": round(max(self.latencies_ms, default=0.0), 3)},
+                "errors": self.errors, "first_error": self.first_error}
+
+
+class HttpConnection:
+    """ One keep-alive HTTP/1.1 connection making JSON requests. """
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write((f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                           f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode("latin-1") + body)
+        message = await read_http_message(self.reader)
+        if message is None:
+            raise ConnectionError("The server closed the connection.")
+        status_line, _, reply = message
+        status = int(status_line.split(" ", 2)[1])
+        data = json.loads(reply)
+        if status != 200:
+            raise RuntimeError(f"{method} {path}: {status} {data.get('error')}")
+        return data
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class WebSocketConnection:
+    """ One WebSocket connection sending a JSON message and waiting for its reply. """
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        self.writer.write((f"GET /ws HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nUpgrade: websocket\r\n"
+                           f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+                           ).encode("latin-1"))
+        status_line = (await read_http_message(self.reader) or ("",))[0]
+        if " 101 " not in status_line + " ":
+            raise ConnectionError(f"WebSocket upgrade refused: {status_line!r}")
+
+    async def send(self, message):
+        self.writer.write(encode_websocket_frame(OPCODE_TEXT, json.dumps(message).encode("utf-8"), mask=True))
+        while True:
+            opcode, payload = await read_websocket_message(self.reader)
+            if opcode == OPCODE_PING:
+                self.writer.write(encode_websocket_frame(OPCODE_PONG, payload, mask=True))
+            elif opcode == OPCODE_CLOSE:
+                raise ConnectionError("The server closed the WebSocket.")
+            elif opcode == OPCODE_TEXT:
+                reply = json.loads(payload)
+                if reply.get("type") == "error":
+                    raise RuntimeError(f"{message['type']}: {reply.get('status')} {reply.get('error')}")
+                return reply
+
+    async def close(self):
+        if self.writer is not None:
+            try:
+                self.writer.write(encode_websocket_frame(OPCODE_CLOSE, b"\x03\xe8", mask=True))
+            finally:
+                self.writer.close()
+
+
+async def _http_student(host, port, quizzes, length, rng, stats):
+    connection = HttpConnection(host, port)
+    await connection.open()
+    try:
+        for _ in range(quizzes):
+            start = time.perf_counter()
+            state = await connection.request("POST", "/api/sessions", {"length": length})
+            stats.request_done(start)
+            path = f"/api/sessions/{state['session_id']}"
+            while not state["finished"]:
+                start = time.perf_counter()
+                state = await connection.request("POST", path + "/answer",
+                                                 {"option": rng.randrange(len(state["question"]["options"])),
+                                                  "index": state["question"]["index"]})
+                stats.request_done(start)
+                stats.answers += 1
+            for method, suffix in (("GET", "/results"), ("DELETE", "")):
+                start = time.perf_counter()
+                await connection.request(method, path + suffix)
+                stats.request_done(start)
+            stats.quizzes += 1
+    finally:
+        await connection.close()
+
+
+async def _websocket_student(host, port, quizzes, length, rng, stats):
+    connection = WebSocketConnection(host, port)
+    await connection.open()
+    try:
+        for _ in range(quizzes):
+            start = time.perf_counter()
+            state = await connection.send({"type": "start", "length": length})
+            stats.request_done(start)
+            while not state["finished"]:
+                start = time.perf_counter()
+                state = await connection.send({"type": "answer", "option": rng.randrange(len(state["question"]["options"])),
+                                               "index": state["question"]["index"]})
+                stats.request_done(start)
+                stats.answers += 1
+            for kind in ("results", "end"):
+                start = time.perf_counter()
+                await connection.send({"type": kind})
+                stats.request_done(start)
+            stats.quizzes += 1
+    finally:
+        await connection.close()
+
+
+async def run_load(host, port, students=DEFAULT_STUDENTS, quizzes=DEFAULT_QUIZZES, length=DEFAULT_LENGTH,
+                   websocket=False, seed=None):
+    """ Runs every simulated student concurrently against host:port and returns the report dict. """
+    stats = LoadStats()
+    student = _websocket_student if websocket else _http_student
+    rng = random.Random(seed)
+
+    async def run_student(student_rng):
+        try:
+            await student(host, port, quizzes, length, student_rng, stats)
+        except (OSError, RuntimeError, ValueError, asyncio.IncompleteReadError) as error:
+            stats.error(str(error) or type(error).__name__)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_student(random.Random(rng.getrandbits(64))) for _ in range(students)))
+    return stats.report(time.perf_counter() - start, students, "websocket" if websocket else "http")
+
+
+async def run_local_load(question_bank=None, seed=None, **options):
+    """ Starts a server on a free localhost port, runs the load against it and stops it. """
+    server = QuizServer(create_service(question_bank, seed=seed))
+    await server.start("127.0.0.1", 0)
+    try:
+        report = await run_load("127.0.0.1", server.port, seed=seed, **options)
+    finally:
+        await server.close()
+    report["server"] = server.service.stats()
+    return report
+
+
+def format_report(report):
+    latency = report["latency_ms"]
+    lines = [f"{report['students']} students over {report['transport']}: {report['quizzes']} quizzes, "
+             f"{report['answers']} answers, {report['requests']} requests in {report['elapsed_seconds']:.2f} s",
+             f"  {report['answers_per_second']:.0f} answers/s, {report['requests_per_second']:.0f} requests/s",
+             f"  latency ms: p50 {latency['p50']:.2f}, p95 {latency['p95']:.2f}, p99 {latency['p99']:.2f}, "
+             f"max {latency['max']:.2f}",
+             f"  errors: {report['errors']}" + (f" (first: {report['first_error']})" if report["first_error"] else "")]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.quiz_load_client",
+                                     description="Simulate a classroom of students against the quiz server.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default=DEFAULT_URL, help=f"server to load (default: {DEFAULT_URL})")
+    target.add_argument("--local", action="store_true", help="start a server in this process on a free localhost port")
+    parser.add_argument("--question-bank", metavar="PATH", help="question bank for the --local server (default: built-in pool)")
+    parser.add_argument("--students", type=int, default=DEFAULT_STUDENTS, help=f"concurrent students (default: {DEFAULT_STUDENTS})")
+    parser.add_argument("--quizzes", type=int, default=DEFAULT_QUIZZES, help=f"quizzes per student (default: {DEFAULT_QUIZZES})")
+    parser.add_argument("--length", default=str(DEFAULT_LENGTH), metavar="N",
+                        help=f'questions per quiz, or "all" (default: {DEFAULT_LENGTH})')
+    parser.add_argument("--websocket", action="store_true", help="use one WebSocket per student instead of HTTP")
+    parser.add_argument("--seed", type=int, default=103)
+    parser.add_argument("--output", metavar="JSON", help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.students < 1 or args.quizzes < 1:
+        parser.error("--students and --quizzes must be at least 1")
+    options = {"students": args.students, "quizzes": args.quizzes, "length": args.length,
+               "websocket": args.websocket}
+    if args.local:
+        report = asyncio.run(run_local_load(args.question_bank, args.seed, **options))
+    else:
+        url = urlsplit(args.url if "//" in args.url else "http://" + args.url)
+        if url.scheme not in ("http", "ws") or not url.hostname:
+            parser.error(f"expected an http:// URL, not {args.url!r}")
+        report = asyncio.run(run_load(url.hostname, url.port or 80, seed=args.seed, **options))
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if report["errors"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
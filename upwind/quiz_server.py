@@ -0,0 +1,605 @@
+"""
+upwind/quiz_server.py
+
+Classroom quiz server: one asyncio process serves the question pool, the study topics
+and every student's quiz over local HTTP or WebSocket, so students only need a browser.
+
+Quizzes are ordinary QuizSessions sampled by the same ExamComposer as the app's
+start_quiz and graded by the same QuizSession.grade as show_results. The question bank
+is loaded once into read-only records that all sessions share; a session only holds its
+question IDs, option order and answers. The HTTP side is a small keep-alive HTTP/1.1
+handler and the WebSocket side a small RFC 6455 handler, both on asyncio streams, so the
+server has no dependencies beyond the standard library.
+
+HTTP API (JSON bodies and replies):
+    GET    /                             browser client
+    GET    /api/topics                   {"topics": [title, ...]}
+    GET    /api/topics/<title>           {"title": ..., "text": ...}
+    POST   /api/sessions                 {"length": 20 | "all"}        -> session state
+    GET    /api/sessions/<id>                                          -> session state
+    POST   /api/sessions/<id>/answer     {"option": i} or {"answer": text}, optional "index"
+    GET    /api/sessions/<id>/results                                  -> graded results
+    DELETE /api/sessions/<id>
+    GET    /api/stats
+Session state is {"session_id", "total", "answered", "finished", "question": {"index",
+"text", "options", "progress"}}; an answer replies with the next state.
+
+WebSocket (/ws): send {"type": "start" | "question" | "answer" | "results" | "end" |
+"topics" | "topic", ...} with the same fields as the HTTP bodies; each message gets one
+reply with the same type (or {"type": "error", "status", "error"}). A session started on
+a connection is used for its later messages unless one names another "session_id".
+
+Usage:
+python -m upwind.quiz_server [--host 0.0.0.0] [--port 8103] [--question-bank bank.db] [--quiz-length 20]
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import struct
+import sys
+import time
+from urllib.parse import unquote, urlsplit
+
+from upwind.content_pack import load_study_content
+from upwind.exam_composer import ExamComposer
+from upwind.question_store import ListQuestionStore, open_question_store
+from upwind.quiz_session import QuizSession
+
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 8103
+DEFAULT_QUIZ_LENGTH = 20
+MAX_SESSIONS = 10000
+SESSION_IDLE_SECONDS = 3 * 60 * 60
+EXPIRY_INTERVAL_SECONDS = 60
+MAX_HEADER_BYTES = 16384
+MAX_BODY_BYTES = 65536
+WRITE_BUFFER_LIMIT = 65536  # Only wait for the socket to drain once this much output is queued
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC11B85"
+
+_REASONS = {101: "Switching Protocols", 200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            409: "Conflict", 413: "Payload Too Large", 503: "Service Unavailable"}
+OPCODE_CONTINUATION, OPCODE_TEXT, OPCODE_BINARY, OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+class RequestError(Exception):
+    """ A request the service refuses; status is the HTTP status to reply with. """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def freeze_store(store):
+    """
+    Loads every question of store, explanation included, into an in-memory store of
+    immutable Question records that all sessions share. The near-duplicate clusters come
+    along, so server quizzes avoid near-duplicates as the app's do. A ListQuestionStore is
+    already in memory and is served as is, which keeps the IDs of a bank with skipped entries.
+    """
+    if isinstance(store, ListQuestionStore):
+        return store
+    question_ids = list(store.question_ids())
+    explanations = store.get_explanations(question_ids)
+    frozen = ListQuestionStore([question if question.explanation else question._replace(explanation=explanations[question_id])
+                                for question_id, question in zip(question_ids, store.get_questions(question_ids))])
+    # The frozen store numbers questions by list position, so the bank's clusters are renumbered to match.
+    position = {question_id: index for index, question_id in enumerate(question_ids)}
+    frozen.set_duplicate_clusters({position[question_id]: position[cluster_id]
+                                   for question_id, cluster_id in store.get_duplicate_clusters().items()
+                                   if question_id in position and cluster_id in position})
+    return frozen
+
+
+class QuizService:
+    """ Every live quiz session, over one shared read-only question store. Knows nothing about transports. """
+
+    def __init__(self, store, topics, quiz_length=DEFAULT_QUIZ_LENGTH, rng=None, max_sessions=MAX_SESSIONS,
+                 idle_seconds=SESSION_IDLE_SECONDS):
+        self.store = store
+        self.topics = topics
+        self.quiz_length = quiz_length
+        self.rng = rng if rng is not None else random.Random()
+        self.composer = ExamComposer(store, self.rng)
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self.sessions = {}   # session ID -> QuizSession
+        self.last_used = {}  # session ID -> time.monotonic() of its last request
+        self.started_at = time.monotonic()
+        self.sessions_started = 0
+        self.answers_received = 0
+
+    # --- Sessions ---
+    def start(self, length=None):
+        length = self._quiz_length(length)
+        if len(self.sessions) >= self.max_sessions:
+            self.expire_idle()
+            if len(self.sessions) >= self.max_sessions:
+                raise RequestError(503, "Too many quizzes are in progress; try again later.")
+        session = QuizSession.start(self.store, num_questions=length, composer=self.composer, rng=self.rng)
+        self.sessions[session.session_id] = session
+        self.last_used[session.session_id] = time.monotonic()
+        self.sessions_started += 1
+        return self.state(session)
+
+    def _quiz_length(self, length):
+        """ Questions in a new quiz: a number (capped at the pool size) or "all", as in the app's menu. """
+        if length is None:
+            length = self.quiz_length
+        capacity = self.composer.capacity()
+        if isinstance(length, str) and length.strip().lower() == "all":
+            return capacity
+        try:
+            return min(max(int(length), 1), capacity)
+        except (TypeError, ValueError):
+            raise RequestError(400, f"Quiz length must be a number or \"all\", not {length!r}.") from None
+
+    def session(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise RequestError(404, "No such quiz session (it may have expired).")
+        self.last_used[session_id] = time.monotonic()
+        return session
+
+    def state(self, session):
+        state = {"session_id": session.session_id, "total": len(session), "answered": len(session.answers),
+                 "finished": session.is_finished()}
+        question = session.current_question()
+        if question is not None:
+            state["question"] = {"index": session.current_index, "text": question['question_text'],
+                                 "options": session.current_options(), "progress": session.progress_text()}
+        return state
+
+    def answer(self, session_id, answer=None, option=None, index=None):
+        """
+        Records the answer to the current question and moves on. option is a position in the
+        options as they were sent; index, when given, must be the current question's index,
+        so a resent request can't answer the next question.
+        """
+        session = self.session(session_id)
+        if session.is_finished():
+            raise RequestError(409, "This quiz is already finished.")
+        if index is not None and index != session.current_index:
+            raise RequestError(409, f"Question {index} is not the current question ({session.current_index}).")
+        question = session.current_question()
+        if option is not None:
+            if not isinstance(option, int) or not 0 <= option < len(question.options):
+                raise RequestError(400, f"option must be between 0 and {len(question.options) - 1}.")
+            session.answer_position(option)
+        elif answer in question.options:
+            session.answer(answer)
+        else:
+            raise RequestError(400, "The answer must be one of the question's options.")
+        session.advance()
+        self.answers_received += 1
+        return self.state(session)
+
+    def results(self, session_id):
+        result = self.session(session_id).grade()
+        return {"session_id": session_id, "score": result.score, "total": result.total,
+                "percentage": round(result.percentage, 2), "all_correct": result.all_correct,
+                "wrong_items": result.wrong_items, "correct_items": result.correct_items}
+
+    def end(self, session_id):
+        self.session(session_id)
+        del self.sessions[session_id], self.last_used[session_id]
+        return {"session_id": session_id, "ended": True}
+
+    def expire_idle(self, now=None):
+        cutoff = (now if now is not None else time.monotonic()) - self.idle_seconds
+        expired = [session_id for session_id, used in self.last_used.items() if used < cutoff]
+        for session_id in expired:
+            del self.sessions[session_id], self.last_used[session_id]
+        return len(expired)
+
+    def stats(self):
+        uptime = time.monotonic() - self.started_at
+        return {"active_sessions": len(self.sessions), "sessions_started": self.sessions_started,
+                "answers_received": self.answers_received, "uptime_seconds": round(uptime, 1),
+                "answers_per_second": round(self.answers_received / uptime, 1) if uptime else 0.0,
+                "questions": len(self.store)}
+
+    # --- Study topics ---
+    def topic_titles(self):
+        return {"topics": list(self.topics)}
+
+    def topic(self, title):
+        if title not in self.topics:
+            raise RequestError(404, f"No study topic named {title!r}.")
+        return {"title": title, "text": self.topics[title]}
+
+
+# --- HTTP ---
+def _http_response(status, body, content_type="application/json", keep_alive=True):
+    head = (f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nCache-Control: no-store\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def _json_bytes(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def read_http_message(reader):
+    """
+    Reads one HTTP/1.1 message: returns (start line, {lower-case header: value}, body) or
+    None when the peer closed the connection between messages.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as error:
+        if not error.partial:
+            return None
+        raise
+    except asyncio.LimitOverrunError:
+        raise RequestError(413, "Request headers are too large.") from None
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, separator, value = line.partition(":")
+        if separator:
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY_BYTES:
+        raise RequestError(413, "Request body is too large.")
+    body = await reader.readexactly(length) if length else b""
+    return lines[0], headers, body
+
+
+class QuizServer:
+    """ Serves a QuizService over HTTP and WebSocket on one asyncio event loop. """
+
+    def __init__(self, service):
+        self.service = service
+        self.server = None
+        self._expiry_task = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        self._expiry_task = asyncio.ensure_future(self._expire_sessions())
+        return self.server
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _expire_sessions(self):
+        while True:
+            await asyncio.sleep(EXPIRY_INTERVAL_SECONDS)
+            self.service.expire_idle()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    message = await read_http_message(reader)
+                    if message is None:
+                        break
+                    start_line, headers, body = message
+                    method, _, rest = start_line.partition(" ")
+                    path = rest.rpartition(" ")[0] or rest
+                except (RequestError, ValueError) as error:
+                    status = error.status if isinstance(error, RequestError) else 400
+                    writer.write(_http_response(status, _json_bytes({"error": str(error)}), keep_alive=False))
+                    break
+                if headers.get("upgrade", "").lower() == "websocket" and urlsplit(path).path == "/ws":
+                    await self._serve_websocket(reader, writer, headers)
+                    break
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, content_type, payload = self.dispatch(method, path, body)
+                writer.write(_http_response(status, payload, content_type, keep_alive))
+                if not keep_alive:
+                    break
+                if writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                    await writer.drain()
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            pass  # The server is shutting down with the connection still open
+        finally:
+            writer.close()
+
+    def dispatch(self, method, path, body):
+        """ Routes one HTTP request; returns (status, content type, body bytes). """
+        try:
+            if path.split("?", 1)[0] in ("/", "/index.html"):
+                if method != "GET":
+                    raise RequestError(405, "Use GET.")
+                return 200, "text/html; charset=utf-8", CLIENT_PAGE.encode("utf-8")
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise RequestError(400, "The request body must be a JSON object.")
+            return 200, "application/json", _json_bytes(self.route(method, path, payload))
+        except RequestError as error:
+            return error.status, "application/json", _json_bytes({"error": str(error)})
+        except ValueError as error:
+            return 400, "application/json", _json_bytes({"error": f"Invalid JSON: {error}"})
+
+    def route(self, method, path, payload):
+        parts = [unquote(part) for part in urlsplit(path).path.split("/") if part]
+        if len(parts) < 2 or parts[0] != "api":
+            raise RequestError(404, "Not found.")
+        service = self.service
+        resource, arguments = parts[1], parts[2:]
+        routes = {
+            ("topics", 0, "GET"): lambda: service.topic_titles(),
+            ("topics", 1, "GET"): lambda: service.topic(arguments[0]),
+            ("sessions", 0, "POST"): lambda: service.start(payload.get("length")),
+            ("sessions", 1, "GET"): lambda: service.state(service.session(arguments[0])),
+            ("sessions", 1, "DELETE"): lambda: service.end(arguments[0]),
+            ("stats", 0, "GET"): lambda: service.stats(),
+        }
+        if resource == "sessions" and len(arguments) == 2:
+            session_id, action = arguments
+            if action == "answer" and method == "POST":
+                return service.answer(session_id, payload.get("answer"), payload.get("option"), payload.get("index"))
+            if action == "results" and method in ("GET", "POST"):
+                return service.results(session_id)
+            raise RequestError(404 if action not in ("answer", "results") else 405, "Not found.")
+        handler = routes.get((resource, len(arguments), method))
+        if handler is None:
+            if any(key[:2] == (resource, len(arguments)) for key in routes):
+                raise RequestError(405, f"{method} is not supported here.")
+            raise RequestError(404, "Not found.")
+        return handler()
+
+    # --- WebSocket ---
+    async def _serve_websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1(key.encode("ascii") + WEBSOCKET_GUID).digest()).decode("ascii")
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode("latin-1"))
+        session_id = None
+        while True:
+            opcode, payload = await read_websocket_message(reader)
+            if opcode == OPCODE_CLOSE:
+                writer.write(encode_websocket_frame(OPCODE_CLOSE, payload[:2]))
+                break
+            if opcode == OPCODE_PING:
+                writer.write(encode_websocket_frame(OPCODE_PONG, payload))
+                continue
+            if opcode != OPCODE_TEXT:
+                continue
+            reply, session_id = self.handle_websocket_message(payload, session_id)
+            writer.write(encode_websocket_frame(OPCODE_TEXT, _json_bytes(reply)))
+            if writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                await writer.drain()
+
+    def handle_websocket_message(self, payload, session_id):
+        """ Returns (reply, the connection's session ID after this message). """
+        service = self.service
+        try:
+            message = json.loads(payload)
+            if not isinstance(message, dict):
+                raise RequestError(400, "Messages must be JSON objects.")
+            kind = message.get("type")
+            target = message.get("session_id") or session_id
+            if kind == "start":
+                reply = service.start(message.get("length"))
+                session_id = reply["session_id"]
+            elif kind == "topics":
+                reply = service.topic_titles()
+            elif kind == "topic":
+                reply = service.topic(message.get("title"))
+            elif kind in ("question", "answer", "results", "end"):
+                if target is None:
+                    raise RequestError(400, "Start a quiz first.")
+                if kind == "question":
+                    reply = service.state(service.session(target))
+                elif kind == "answer":
+                    reply = service.answer(target, message.get("answer"), message.get("option"), message.get("index"))
+                elif kind == "results":
+                    reply = service.results(target)
+                else:
+                    reply = service.end(target)
+            else:
+                raise RequestError(400, f"Unknown message type {kind!r}.")
+            reply["type"] = kind
+        except RequestError as error:
+            reply = {"type": "error", "status": error.status, "error": str(error)}
+        except ValueError as error:
+            reply = {"type": "error", "status": 400, "error": f"Invalid JSON: {error}"}
+        return reply, session_id
+
+
+def encode_websocket_frame(opcode, payload, mask=False):
+    """ One final frame; clients must mask their frames (mask=True), servers must not. """
+    length = len(payload)
+    if length < 126:
+        head = struct.pack("!BB", 0x80 | opcode, (0x80 if mask else 0) | length)
+    elif length < 1 << 16:
+        head = struct.pack("!BBH", 0x80 | opcode, (0x80 if mask else 0) | 126, length)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, (0x80 if mask else 0) | 127, length)
+    if not mask:
+        return head + payload
+    key = random.getrandbits(32).to_bytes(4, "big")
+    return head + key + _apply_mask(payload, key)
+
+
+def _apply_mask(payload, key):
+    length = len(payload)
+    if not length:
+        return payload
+    stream = (key * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(stream, "big")).to_bytes(length, "big")
+
+
+async def read_websocket_message(reader):
+    """ Reads one whole message (joining fragments); returns (opcode, payload bytes). """
+    message_opcode, parts = None, []
+    while True:
+        head = await reader.readexactly(2)
+        final, opcode = head[0] & 0x80, head[0] & 0x0F
+        masked, length = head[1] & 0x80, head[1] & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await reader.readexactly(8))
+        if length > MAX_BODY_BYTES:
+            raise ConnectionError("WebSocket message too large")
+        key = await reader.readexactly(4) if masked else None
+        payload = await reader.readexactly(length)
+        if key is not None:
+            payload = _apply_mask(payload, key)
+        if opcode >= OPCODE_CLOSE:  # Control frames may arrive between fragments
+            return opcode, payload
+        if opcode != OPCODE_CONTINUATION:
+            message_opcode = opcode
+        parts.append(payload)
+        if final:
+            return message_opcode, b"".join(parts)
+
+
+def create_service(question_bank=None, quiz_length=DEFAULT_QUIZ_LENGTH, seed=None):
+    store = open_question_store(question_bank)
+    try:
+        frozen = freeze_store(store)
+    finally:
+        store.close()
+    return QuizService(frozen, load_study_content(), quiz_length, random.Random(seed))
+
+
+async def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = QuizServer(service)
+    await server.start(host, port)
+    shown_host = "localhost" if host in ("0.0.0.0", "::", "") else host
+    print(f"Serving {len(service.store)} questions at http://{shown_host}:{server.port}/ (Ctrl+C to stop)",
+          file=sys.stderr)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def _quiz_length_argument(value):
+    if value.strip().lower() == "all":
+        return "all"
+    try:
+        length = int(value)
+    except ValueError:
+        length = 0
+    if length < 1:
+        raise argparse.ArgumentTypeError(f'expected a positive number or "all", not {value!r}')
+    return length
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m upwind.quiz_server",
+                                     description="Serve quizzes and study topics to a classroom over HTTP/WebSocket.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default: {DEFAULT_HOST}, every interface)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--question-bank", metavar="PATH", help="SQLite (.db) or JSON question bank (default: built-in pool)")
+    parser.add_argument("--quiz-length", type=_quiz_length_argument, default=DEFAULT_QUIZ_LENGTH, metavar="N",
+                        help=f'default questions per quiz, or "all" (default: {DEFAULT_QUIZ_LENGTH})')
+    parser.add_argument("--seed", type=int, help="seed the question sampling, for repeatable load tests")
+    args = parser.parse_args(argv)
+
+    try:
+        service = create_service(args.question_bank, args.quiz_length, args.seed)
+    except OSError as error:
+        parser.error(str(error))
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+CLIENT_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Upwind: Part 103 Prep</title>
+<style>
+body { background: #1e2124; color: #fff; font: 16px Helvetica, Arial, sans-serif; max-width: 760px; margin: 0 auto; padding: 16px; }
+h1 { text-align: center; } button, select { font: bold 15px Helvetica, Arial, sans-serif; color: #fff; background: #424549; border: 0; padding: 10px 16px; margin: 4px; cursor: pointer; }
+button.primary { background: #7289da; } .option { display: block; width: 100%; text-align: left; }
+.muted { color: #808080; } .correct { color: #4CAF50; } .wrong { color: #F44336; } pre { white-space: pre-wrap; font: inherit; }
+.item { border-bottom: 1px solid #424549; padding: 8px 0; }
+</style>
+</head>
+<body>
+<h1>Upwind: Part 103 Prep</h1>
+<div id="app"></div>
+<script>
+const app = document.getElementById("app");
+let sessionId = null;
+
+function el(tag, text, cls) { const e = document.createElement(tag); if (text !== undefined) e.textContent = text; if (cls) e.className = cls; return e; }
+function button(text, onClick, cls) { const b = el("button", text, cls); b.onclick = onClick; return b; }
+async function api(method, path, body) {
+  const response = await fetch(path, {method, headers: {"Content-Type": "application/json"}, body: body ? JSON.stringify(body) : undefined});
+  const data = await response.json();
+  if (!response.ok) throw new Error(data.error);
+  return data;
+}
+
+async function showMenu() {
+  app.replaceChildren();
+  const length = el("select");
+  for (const n of ["10", "20", "50", "100", "all"]) { const o = el("option", n === "all" ? "All" : n); o.value = n; length.append(o); }
+  length.value = "20";
+  app.append(button("Start Quiz", () => startQuiz(length.value), "primary"), el("span", " Questions: "), length, el("h2", "Study Topics"));
+  const {topics} = await api("GET", "/api/topics");
+  for (const title of topics) app.append(button(title, () => showTopic(title), "option"));
+}
+
+async function showTopic(title) {
+  const topic = await api("GET", "/api/topics/" + encodeURIComponent(title));
+  app.replaceChildren(button("< Back", showMenu), el("h2", topic.title), el("pre", topic.text));
+}
+
+async function startQuiz(length) { showQuestion(await api("POST", "/api/sessions", {length})); }
+
+function showQuestion(state) {
+  sessionId = state.session_id;
+  if (state.finished) return showResults();
+  const q = state.question;
+  app.replaceChildren(el("p", q.progress, "muted"), el("h3", q.text));
+  q.options.forEach((text, option) => app.append(button(text, async () => {
+    showQuestion(await api("POST", `/api/sessions/${sessionId}/answer`, {option, index: q.index}));
+  }, "option")));
+}
+
+async function showResults() {
+  const r = await api("GET", `/api/sessions/${sessionId}/results`);
+  app.replaceChildren(el("h2", `You scored: ${r.score}/${r.total} (${r.percentage.toFixed(2)}%)`));
+  const review = (title, items, wrong) => {
+    if (!items.length) return;
+    app.append(el("h3", title));
+    for (const item of items) {
+      const div = el("div", undefined, "item");
+      div.append(el("b", "Q: " + item.question), el("div", "Your Answer: " + item.user_answer, wrong ? "wrong" : "correct"));
+      if (wrong) div.append(el("div", "Correct Answer: " + item.correct_answer, "correct"));
+      div.append(el("p", "Explanation: " + item.explanation, "muted"));
+      app.append(div);
+    }
+  };
+  review("Review of Incorrect Answers", r.wrong_items, true);
+  review("Review of Correctly Answered Questions", r.correct_items, false);
+  app.append(button("Return to Main Menu", showMenu, "primary"));
+  api("DELETE", `/api/sessions/${sessionId}`);
+}
+
+showMenu();
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    main()
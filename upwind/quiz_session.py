@@ -0,0 +1,163 @@
+"""
+upwind/quiz_session.py
+
+Headless quiz engine. QuizSession owns the state of one quiz (the sampled questions,
+the current position and the learner's answers) and grades it. It has no Tkinter
+dependency, so the GUI, batch graders, servers and simulations all drive the same code.
+
+The questions are shared, immutable Question records. A session shows each question's
+options through its own permutation of the option indices and records answers as
+option indices, so it never modifies the records and grading compares integers.
+"""
+
+import random
+import uuid
+
+from upwind.exam_composer import ExamComposer
+from upwind.question_record import NO_OPTION, as_question
+
+NO_ANSWER = "No answer"
+
+
+class QuizResult:
+    """ Graded outcome of a quiz session. """
+
+    def __init__(self, score, total, correct_items, wrong_items):
+        self.score = score
+        self.total = total
+        self.correct_items = correct_items
+        self.wrong_items = wrong_items
+
+    @property
+    def percentage(self):
+        return (self.score / self.total) * 100 if self.total > 0 else 0.0
+
+    @property
+    def all_correct(self):
+        return self.total > 0 and not self.wrong_items
+
+
+class QuizSession:
+    """
+    State machine for one quiz. Typical use:
+
+        session = QuizSession.start(store)
+        while not session.is_finished():
+            question = session.current_question()
+            session.answer(chosen_option)
+            session.advance()
+        result = session.grade()
+    """
+
+    def __init__(self, question_ids, questions, question_store=None, rng=None):
+        self.session_id = uuid.uuid4().hex
+        self.question_ids = list(question_ids)
+        self.questions = [as_question(question) for question in questions]
+        self.question_store = question_store
+        self.rng = rng if rng is not None else random
+        self.current_index = 0
+        self.answers = {}        # question position -> index of the chosen option (NO_OPTION when blank)
+        self._option_orders = {}  # question position -> permutation of option indices, as displayed
+
+    @classmethod
+    def start(cls, question_store, num_questions=20, blueprint=None, composer=None, rng=None):
+        """ Samples a new quiz from question_store, balanced over categories unless a blueprint is given. """
+        if composer is None:
+            composer = ExamComposer(question_store, rng)
+        question_ids = composer.compose(blueprint) if blueprint else composer.compose_balanced(num_questions)
+        return cls(question_ids, question_store.get_questions(question_ids), question_store, rng)
+
+    def __len__(self):
+        return len(self.questions)
+
+    # --- Navigation ---
+    def current_question(self):
+        if self.is_finished():
+            return None
+        return self.questions[self.current_index]
+
+    def option_order(self, index):
+        """ The permutation of option indices in which question index is shown in this session. """
+        order = self._option_orders.get(index)
+        if order is None:
+            order = list(range(len(self.questions[index].options)))
+            self.rng.shuffle(order)
+            order = self._option_orders[index] = bytes(order)
+        return order
+
+    def current_options(self):
+        """ Returns the current question's options in this session's shuffled order. """
+        options = self.questions[self.current_index].options
+        return [options[i] for i in self.option_order(self.current_index)]
+
+    def progress_text(self):
+        return f"Question {self.current_index + 1} of {len(self.questions)}"
+
+    def is_last_question(self):
+        return self.current_index == len(self.questions) - 1
+
+    def is_finished(self):
+        return self.current_index >= len(self.questions)
+
+    def advance(self):
+        if not self.is_finished():
+            self.current_index += 1
+
+    # --- Answering ---
+    def answer(self, option):
+        """ Records option (the text of one of the options) as the answer to the current question. """
+        if self.is_finished():
+            raise IndexError("The quiz has no current question to answer.")
+        self.answers[self.current_index] = self.questions[self.current_index].option_index(option)
+
+    def answer_position(self, position):
+        """ Records the option shown at position (see current_options) as the answer to the current question. """
+        if self.is_finished():
+            raise IndexError("The quiz has no current question to answer.")
+        self.answers[self.current_index] = self.option_order(self.current_index)[position]
+
+    def chosen_option(self, index):
+        """ Text of the option chosen for question index, or None if it was not answered. """
+        chosen = self.answers.get(index, NO_OPTION)
+        return self.questions[index].options[chosen] if chosen != NO_OPTION else None
+
+    # --- Grading ---
+    def is_correct(self, index):
+        return self.answers.get(index, NO_OPTION) == self.questions[index].correct_index
+
+    def score(self):
+        """ Returns the number of correct answers without building the review lists. """
+        return sum(1 for i in range(len(self.questions)) if self.is_correct(i))
+
+    def grade(self, explanations=None):
+        """
+        Grades the session. explanations ({question_id: text}) is loaded from the question
+        store when not supplied, so the text is only read once results are needed.
+        """
+        if explanations is None:
+            if self.question_store is not None:
+                explanations = self.question_store.get_explanations(self.question_ids)
+            else:
+                explanations = {}
+        score = 0
+        correct_items, wrong_items = [], []
+        answers = self.answers
+        for i, question in enumerate(self.questions):
+            chosen = answers.get(i, NO_OPTION)
+            question_id = self.question_ids[i]
+            explanation = explanations.get(question_id, question.explanation)
+            if chosen == question.correct_index:
+                score += 1
+                correct_items.append({
+                    "question": question.question_text,
+                    "user_answer": question.options[chosen],
+                    "explanation": explanation
+                })
+            else:
+                wrong_items.append({
+                    "question": question.question_text,
+                    "user_answer": question.options[chosen] if chosen != NO_OPTION else NO_ANSWER,
+                    "correct_answer": question.correct_answer,
+                    "explanation": explanation
+                })
+        return QuizResult(score, len(self.questions), correct_items, wrong_items)
@@ -0,0 +1,105 @@
+"""
+upwind/results_review.py
+
+Answer review for the quiz results screen.
+
+build_review() turns a graded QuizResult into sections, one per reviewed question plus
+the headings. A section is a flat tuple of alternating text and tag arguments, so a whole
+page of sections goes into the Text widget with one insert(index, text, tags, text,
+tags, ...) call instead of four or five calls per question. Explanations are wrapped
+through an LRU cache, so reviewing the same questions again skips textwrap.
+
+ReviewRenderer puts the sections into a Text widget lazily. The first page is inserted
+straight away, and another page is appended whenever the view is scrolled near the end.
+A review of the whole pool therefore opens as quickly as a 20-question one, and only
+the part that has been scrolled into view is ever laid out.
+"""
+
+import functools
+import textwrap
+import tkinter as tk
+
+WRAP_WIDTH = 80
+EXPLANATION_CACHE_SIZE = 1024  # Room for every explanation in a full-pool review
+PAGE_SIZE = 25                 # Sections inserted per batch
+PREFETCH_FRACTION = 0.1        # Append the next page once the view is this close to the end
+SEPARATOR = "-" * WRAP_WIDTH
+
+
+@functools.lru_cache(maxsize=EXPLANATION_CACHE_SIZE)
+def wrap_explanation(explanation, width=WRAP_WIDTH):
+    return '\n'.join(textwrap.wrap(f"Explanation: {explanation}", width=width))
+
+
+def _explanation_runs(item):
+    return (f"{wrap_explanation(item['explanation'])}\n\n{SEPARATOR}\n\n", "")
+
+
+def build_review(result):
+    """ Returns the review of result as a list of sections of (text, tags, text, tags, ...) arguments. """
+    if result.total == 0:
+        return [("There were no questions in this quiz.\n", "")]
+    sections = []
+    if result.all_correct:
+        sections.append(("Excellent! You got all questions correct.\n\n", "section_title_style",
+                         "Review of Your Answers:\n\n", "section_title_style"))
+        for item in result.correct_items:
+            sections.append((f"Q: {item['question']}\n\n", "question_text_style",
+                             f"  Your Answer: {item['user_answer']}\n", "correct_answered_text") + _explanation_runs(item))
+        return sections
+    if result.wrong_items:
+        sections.append(("Review of Incorrect Answers:\n\n", "section_title_style"))
+        for item in result.wrong_items:
+            sections.append((f"Q: {item['question']}\n\n", "question_text_style",
+                             f"  Your Answer: {item['user_answer']}\n", "wrong",
+                             f"  Correct Answer: {item['correct_answer']}\n\n", "correct") + _explanation_runs(item))
+    if result.correct_items:
+        sections.append(("\n\nReview of Correctly Answered Questions:\n\n", "section_title_style"))
+        for item in result.correct_items:
+            sections.append((f"Q: {item['question']}\n\n", "question_text_style",
+                             f"  Your Answer: {item['user_answer']}\n\n", "correct_answered_text") + _explanation_runs(item))
+    return sections
+
+
+class ReviewRenderer:
+    """
+    Fills a (disabled) Text widget with review sections a page at a time. The widget's
+    yscrollcommand is taken over to watch the scroll position; pass the scrollbar's set
+    method as scrollbar_set to keep the scrollbar working.
+    """
+
+    def __init__(self, text_widget, sections, page_size=PAGE_SIZE, scrollbar_set=None):
+        self.text = text_widget
+        self.sections = sections
+        self.page_size = max(page_size, 1)
+        self.rendered = 0
+        self._scrollbar_set = scrollbar_set
+        self._page_pending = False
+        text_widget.configure(yscrollcommand=self._on_scroll)
+        self.render_page()
+
+    @property
+    def complete(self):
+        return self.rendered >= len(self.sections)
+
+    def render_page(self):
+        """ Appends the next page of sections in a single insert call. """
+        self._page_pending = False
+        if self.complete:
+            return
+        page = self.sections[self.rendered:self.rendered + self.page_size]
+        self.text.configure(state=tk.NORMAL)
+        self.text.insert(tk.END, *[argument for section in page for argument in section])
+        self.text.configure(state=tk.DISABLED)
+        self.rendered += len(page)
+
+    def render_all(self):
+        while not self.complete:
+            self.render_page()
+
+    def _on_scroll(self, first, last):
+        if self._scrollbar_set is not None:
+            self._scrollbar_set(first, last)
+        if not self.complete and not self._page_pending and float(last) >= 1.0 - PREFETCH_FRACTION:
+            self._page_pending = True  # Insert outside the scroll callback, once per page
+            self.text.after_idle(self.render_page)
@@ -0,0 +1,355 @@
+"""
+upwind/search_index.py
+
+Full-text search over the study topics and the question bank.
+
+SearchIndex is an inverted index ranked with Okapi BM25. Every term has a posting list of
+(document number, term frequency) pairs held in two compact arrays, and a query only
+walks the posting lists of its own terms. Terms are scored rarest first; once the
+k-th best score can no longer be beaten by a document that only matches the remaining
+(common) terms, those terms just top up the documents already in the running
+("MaxScore" pruning). With NumPy installed each posting list is instead scored in one
+vectorized pass into a dense score array. Either way a query stays in the low
+milliseconds on a 50k-question bank.
+
+The index is cached to disk (a small JSON header followed by the raw arrays, so loading
+is a few large reads rather than parsing millions of numbers) and kept up to date
+incrementally: sync() compares a fingerprint of every document and only re-indexes the
+ones that were added, changed or removed.
+
+Document keys are "topic:<title>" for study topics and "question:<id>" for questions.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INDEX_VERSION = 1
+INDEX_MAGIC = b"UPWNDIDX"
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Removed and re-indexed documents leave holes in the document numbering; renumber on
+# save once this fraction of the slots is dead.
+COMPACT_DEAD_FRACTION = 0.25
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Deliberately short: single letters stay searchable because "Class E" and "Class G" matter here.
+_STOP_WORDS = frozenset("""
+    a an and are as at be by for from has have how if in into is it its of on or that the their this
+    to was what when which while who why will with you your
+""".split()) - {"a", "e", "g"}
+
+
+def tokenize(text):
+    """ Lower-cases, splits on non-alphanumerics, drops stop words and folds simple plurals. """
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if token in _STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def default_index_path():
+    return os.path.join(os.path.expanduser("~"), ".upwind", "cache", "search_index.idx")
+
+
+def iter_documents(question_store, study_topics_content):
+    """ Yields (key, title, text) for every study topic and question. """
+    for title, content in study_topics_content.items():
+        yield f"topic:{title}", title, f"{title}\n{content}"
+    question_ids = list(question_store.question_ids())
+    for start in range(0, len(question_ids), 1000):
+        chunk = question_ids[start:start + 1000]
+        explanations = question_store.get_explanations(chunk)
+        for question_id, question in zip(chunk, question_store.get_questions(chunk)):
+            text = "\n".join([question['question_text'], *question['options'], explanations[question_id]])
+            yield f"question:{question_id}", question['question_text'], text
+
+
+class SearchHit:
+    def __init__(self, key, title, score):
+        self.key = key
+        self.title = title
+        self.score = score
+
+    @property
+    def kind(self):
+        return self.key.split(":", 1)[0]
+
+    @property
+    def target(self):
+        """ The topic title or the integer question ID the hit points at. """
+        kind, target = self.key.split(":", 1)
+        return int(target) if kind == "question" else target
+
+
+class SearchIndex:
+    def __init__(self):
+        # Terms
+        self.term_ids = {}          # term -> term number
+        self.terms = []
+        self.posting_docs = []      # term number -> array('I') of document numbers, ascending
+        self.posting_freqs = []     # term number -> array('H') of term frequencies, parallel to posting_docs
+        # Documents; a removed document leaves a None key until the index is compacted
+        self.doc_numbers = {}       # key -> document number
+        self.keys = []
+        self.titles = []
+        self.fingerprints = []
+        self.lengths = array('I')
+        self.doc_terms = []         # document number -> array('I') of term numbers
+        self.total_length = 0
+        self._length_norms = None
+        self._posting_views = {}
+
+    def __len__(self):
+        return len(self.doc_numbers)
+
+    # --- Maintenance ---
+    def add(self, key, title, text, fingerprint=None):
+        if key in self.doc_numbers:
+            self.remove(key)
+        tokens = tokenize(text)
+        frequencies = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        doc = len(self.keys)
+        term_numbers = array('I')
+        for term, frequency in frequencies.items():
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                term_id = self.term_ids[term] = len(self.terms)
+                self.terms.append(term)
+                self.posting_docs.append(array('I'))
+                self.posting_freqs.append(array('H'))
+            # New documents get the highest number, so appending keeps the posting lists sorted.
+            self.posting_docs[term_id].append(doc)
+            self.posting_freqs[term_id].append(min(frequency, 0xFFFF))
+            term_numbers.append(term_id)
+        self.doc_numbers[key] = doc
+        self.keys.append(key)
+        self.titles.append(title)
+        self.fingerprints.append(fingerprint or _fingerprint(text))
+        self.lengths.append(len(tokens))
+        self.doc_terms.append(term_numbers)
+        self.total_length += len(tokens)
+        self._length_norms = None
+
+    def remove(self, key):
+        doc = self.doc_numbers.pop(key, None)
+        if doc is None:
+            return
+        for term_id in self.doc_terms[doc]:
+            docs = self.posting_docs[term_id]
+            position = bisect_left(docs, doc)
+            del docs[position]
+            del self.posting_freqs[term_id][position]
+        self.total_length -= self.lengths[doc]
+        self.keys[doc] = self.titles[doc] = self.fingerprints[doc] = None
+        self.lengths[doc] = 0
+        self.doc_terms[doc] = array('I')
+        self._length_norms = None
+
+    def sync(self, documents):
+        """
+        Brings the index in line with documents ((key, title, text) tuples), re-indexing only
+        what changed. Returns the number of documents added, updated or removed.
+        """
+        changes = 0
+        seen = set()
+        for key, title, text in documents:
+            seen.add(key)
+            fingerprint = _fingerprint(text)
+            doc = self.doc_numbers.get(key)
+            if doc is None or self.fingerprints[doc] != fingerprint or self.titles[doc] != title:
+                self.add(key, title, text, fingerprint)
+                changes += 1
+        for key in [key for key in self.doc_numbers if key not in seen]:
+            self.remove(key)
+            changes += 1
+        return changes
+
+    def compact(self):
+        """ Renumbers the live documents densely, dropping the slots left by removals. """
+        renumber = {}
+        for doc, key in enumerate(self.keys):
+            if key is not None:
+                renumber[doc] = len(renumber)
+        if len(renumber) == len(self.keys):
+            return
+        self.posting_docs = [array('I', [renumber[doc] for doc in docs]) for docs in self.posting_docs]
+        live = list(renumber)
+        self.keys = [self.keys[doc] for doc in live]
+        self.titles = [self.titles[doc] for doc in live]
+        self.fingerprints = [self.fingerprints[doc] for doc in live]
+        self.lengths = array('I', [self.lengths[doc] for doc in live])
+        self.doc_terms = [self.doc_terms[doc] for doc in live]
+        self.doc_numbers = {key: doc for doc, key in enumerate(self.keys)}
+        self._length_norms = None
+
+    # --- Querying ---
+    def _get_length_norms(self):
+        if self._length_norms is None:
+            average_length = self.total_length / max(len(self.doc_numbers), 1) or 1.0
+            norms = [BM25_K1 * (1.0 - BM25_B + BM25_B * length / average_length) for length in self.lengths]
+            self._length_norms = np.asarray(norms) if np is not None else norms
+            self._posting_views = {}
+        return self._length_norms
+
+    def search(self, query, limit=20):
+        """ Returns up to limit SearchHits ranked by BM25. """
+        count = len(self.doc_numbers)
+        term_ids = {self.term_ids[term] for term in tokenize(query) if term in self.term_ids}
+        term_ids = [term_id for term_id in term_ids if self.posting_docs[term_id]]
+        if not term_ids or not count:
+            return []
+        norms = self._get_length_norms()
+
+        weights = {}
+        for term_id in term_ids:
+            df = len(self.posting_docs[term_id])
+            weights[term_id] = math.log(1.0 + (count - df + 0.5) / (df + 0.5))
+        term_ids.sort(key=weights.__getitem__, reverse=True)
+        # A term contributes at most idf * (k1 + 1); bounds[i] is the most terms i.. can add together.
+        bounds = [0.0] * (len(term_ids) + 1)
+        for i in range(len(term_ids) - 1, -1, -1):
+            bounds[i] = bounds[i + 1] + weights[term_ids[i]] * (BM25_K1 + 1.0)
+
+        if np is not None:
+            return self._search_vectorized(term_ids, weights, norms, limit)
+
+        scores = {}
+        for i, term_id in enumerate(term_ids):
+            idf_k1 = weights[term_id] * (BM25_K1 + 1.0)
+            docs, freqs = self.posting_docs[term_id], self.posting_freqs[term_id]
+            if len(scores) >= limit and heapq.nlargest(limit, scores.values())[-1] >= bounds[i]:
+                # No document outside the running top can catch up; only top up the candidates.
+                for doc in scores:
+                    position = bisect_left(docs, doc)
+                    if position < len(docs) and docs[position] == doc:
+                        frequency = freqs[position]
+                        scores[doc] += idf_k1 * frequency / (frequency + norms[doc])
+                continue
+            for doc, frequency in zip(docs, freqs):
+                scores[doc] = scores.get(doc, 0.0) + idf_k1 * frequency / (frequency + norms[doc])
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [SearchHit(self.keys[doc], self.titles[doc], score) for doc, score in best]
+
+    def _search_vectorized(self, term_ids, weights, norms, limit):
+        scores = np.zeros(len(self.keys))
+        for term_id in term_ids:
+            view = self._posting_views.get(term_id)
+            if view is None:
+                docs = np.frombuffer(self.posting_docs[term_id], dtype=np.uint32).astype(np.intp)
+                freqs = np.frombuffer(self.posting_freqs[term_id], dtype=np.uint16).astype(np.float64)
+                view = self._posting_views[term_id] = (docs, freqs)
+            docs, freqs = view
+            # Document numbers are unique within a posting list, so a fancy-indexed add is safe.
+            scores[docs] += weights[term_id] * (BM25_K1 + 1.0) * freqs / (freqs + norms[docs])
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+        best = matched[np.argsort(-scores[matched], kind="stable")]
+        return [SearchHit(self.keys[doc], self.titles[doc], float(scores[doc])) for doc in best.tolist()]
+
+    # --- Persistence ---
+    def save(self, path):
+        if len(self.keys) - len(self.doc_numbers) > COMPACT_DEAD_FRACTION * len(self.keys):
+            self.compact()
+        header = json.dumps({"version": INDEX_VERSION, "byteorder": sys.byteorder, "terms": self.terms,
+                             "keys": self.keys, "titles": self.titles, "fingerprints": self.fingerprints},
+                            ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        arrays = [self.lengths,
+                  array('I', map(len, self.posting_docs)), array('I', map(len, self.doc_terms)),
+                  *self.posting_docs, *self.posting_freqs, *self.doc_terms]
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(INDEX_MAGIC + struct.pack("<Q", len(header)) + header)
+            for values in arrays:
+                values.tofile(f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path):
+        """ Loads a cached index, or returns an empty one if the cache is missing or outdated. """
+        index = cls()
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return index
+        if not data.startswith(INDEX_MAGIC):
+            return index
+        try:
+            offset = len(INDEX_MAGIC) + 8
+            (header_length,) = struct.unpack_from("<Q", data, len(INDEX_MAGIC))
+            header = json.loads(data[offset:offset + header_length])
+            if header.get("version") != INDEX_VERSION or header.get("byteorder") != sys.byteorder:
+                return index
+            body = memoryview(data)[offset + header_length:]
+            num_docs, num_terms = len(header["keys"]), len(header["terms"])
+
+            def take(typecode, length):
+                nonlocal body
+                values = array(typecode)
+                size = length * values.itemsize
+                values.frombytes(body[:size])
+                body = body[size:]
+                return values
+
+            lengths = take('I', num_docs)
+            posting_sizes = take('I', num_terms)
+            doc_term_sizes = take('I', num_docs)
+
+            def split(values, sizes):
+                parts, start = [], 0
+                for size in sizes:
+                    parts.append(values[start:start + size])
+                    start += size
+                return parts
+
+            posting_total = sum(posting_sizes)
+            posting_docs = split(take('I', posting_total), posting_sizes)
+            posting_freqs = split(take('H', posting_total), posting_sizes)
+            doc_terms = split(take('I', sum(doc_term_sizes)), doc_term_sizes)
+        except (ValueError, KeyError, struct.error):
+            return index
+
+        index.terms = header["terms"]
+        index.term_ids = {term: term_id for term_id, term in enumerate(index.terms)}
+        index.posting_docs, index.posting_freqs = posting_docs, posting_freqs
+        index.keys, index.titles, index.fingerprints = header["keys"], header["titles"], header["fingerprints"]
+        index.doc_numbers = {key: doc for doc, key in enumerate(index.keys) if key is not None}
+        index.lengths, index.doc_terms = lengths, doc_terms
+        index.total_length = sum(lengths)
+        return index
+
+
+def _fingerprint(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def open_search_index(question_store, study_topics_content, path=None):
+    """ Loads the cached index, syncs it with the current content and saves it back if anything changed. """
+    path = path or default_index_path()
+    index = SearchIndex.load(path)
+    if index.sync(iter_documents(question_store, study_topics_content)):
+        try:
+            index.save(path)
+        except OSError:
+            pass
+    return index
@@ -0,0 +1,199 @@
+"""
+upwind/spaced_repetition.py
+
+Spaced-repetition review (SM-2) for the question bank.
+
+Every learner has a per-question card holding its ease factor, interval and due time.
+The scheduler keeps the cards in a heap keyed on due time, so picking the next card and
+recording an answer are both O(log n) even for 50k-question banks with years of
+history. Rescheduled cards are pushed again and their old heap entries are skipped
+lazily; the heap is rebuilt once stale entries outnumber live ones.
+
+Cards the learner has never seen are due immediately, so review sessions keep
+introducing new questions once the missed ones are caught up.
+
+Cards are keyed by question ID, so every question bank keeps its own review state (see
+default_review_dir).
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import random
+import time
+
+SECONDS_PER_DAY = 86400
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+# SM-2 answer quality for a correct and an incorrect quiz answer (0-5 scale).
+QUALITY_CORRECT = 4
+QUALITY_WRONG = 1
+
+
+class Card:
+    """ SM-2 state for one learner/question pair. """
+    __slots__ = ("question_id", "ease", "interval", "repetitions", "lapses", "due")
+
+    def __init__(self, question_id, ease=DEFAULT_EASE, interval=0.0, repetitions=0, lapses=0, due=0.0):
+        self.question_id = question_id
+        self.ease = ease
+        self.interval = interval
+        self.repetitions = repetitions
+        self.lapses = lapses
+        self.due = due
+
+    def review(self, quality, now):
+        """ Applies one SM-2 review of the given quality (0-5) at time now. """
+        if quality < 3:
+            self.repetitions = 0
+            self.lapses += 1
+            self.interval = 1.0
+        else:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval = 1.0
+            elif self.repetitions == 2:
+                self.interval = 6.0
+            else:
+                self.interval = round(self.interval * self.ease, 2)
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.due = now + self.interval * SECONDS_PER_DAY
+
+    def to_list(self):
+        return [round(self.ease, 4), self.interval, self.repetitions, self.lapses, self.due]
+
+
+class ReviewScheduler:
+    """ Priority-queue review engine for one learner. """
+
+    def __init__(self, question_ids, cards=None):
+        self.cards = {}
+        self._heap = []
+        self._sequence = 0
+        self._live = {}
+        self._drawn = set()
+        cards = cards or {}
+        for question_id in question_ids:
+            card = cards.get(question_id) or Card(question_id)
+            self.cards[question_id] = card
+            self._heap.append(self._entry(card))
+        heapq.heapify(self._heap)
+
+    def _entry(self, card):
+        self._sequence += 1
+        self._live[card.question_id] = self._sequence
+        return (card.due, self._sequence, card.question_id)
+
+    def _push(self, card):
+        heapq.heappush(self._heap, self._entry(card))
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = [entry for entry in self._heap if self._live.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
+
+    def _discard_stale(self):
+        heap = self._heap
+        while heap and self._live.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+
+    def __len__(self):
+        return len(self._live)
+
+    def next_card(self, now=None, due_only=True):
+        """ Returns the question ID due soonest (None if nothing is due and due_only is set). """
+        now = time.time() if now is None else now
+        self._discard_stale()
+        if not self._heap or (due_only and self._heap[0][0] > now):
+            return None
+        return self._heap[0][2]
+
+    def next_due(self):
+        """ Returns the due time of the card due soonest, or None if every card is drawn. """
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def draw_due(self, limit, now=None):
+        """
+        Removes and returns up to limit due question IDs, soonest first. Each drawn card
+        goes back into the queue via record_answer() or return_cards().
+        """
+        now = time.time() if now is None else now
+        drawn = []
+        while len(drawn) < limit:
+            question_id = self.next_card(now)
+            if question_id is None:
+                break
+            heapq.heappop(self._heap)
+            del self._live[question_id]
+            self._drawn.add(question_id)
+            drawn.append(question_id)
+        return drawn
+
+    def return_cards(self, question_ids):
+        """ Puts drawn cards back unchanged (e.g. when a review session is abandoned). """
+        for question_id in question_ids:
+            if question_id in self._drawn:
+                self._drawn.discard(question_id)
+                self._push(self.cards[question_id])
+
+    def record_answer(self, question_id, correct, now=None):
+        """ Reschedules a card after an answer. """
+        now = time.time() if now is None else now
+        card = self.cards.get(question_id)
+        if card is None:
+            card = self.cards[question_id] = Card(question_id)
+        card.review(QUALITY_CORRECT if correct else QUALITY_WRONG, now)
+        self._drawn.discard(question_id)
+        self._push(card)
+        return card
+
+    def due_count(self, now=None):
+        now = time.time() if now is None else now
+        return sum(1 for question_id in self._live if self.cards[question_id].due <= now)
+
+    # --- Persistence ---
+    def to_dict(self):
+        """ Only cards with review history are saved; unseen cards are recreated from the bank. """
+        return {str(question_id): card.to_list() for question_id, card in self.cards.items()
+                if card.repetitions or card.lapses}
+
+    @classmethod
+    def from_dict(cls, question_ids, data):
+        cards = {}
+        for key, (ease, interval, repetitions, lapses, due) in data.items():
+            question_id = int(key)
+            cards[question_id] = Card(question_id, ease, interval, repetitions, lapses, due)
+        return cls(question_ids, cards)
+
+
+def default_review_dir(bank_path=None):
+    """ The review state directory of the built-in pool (bank_path None) or of the bank file at bank_path. """
+    directory = os.path.join(os.path.expanduser("~"), ".upwind", "review")
+    if bank_path is None:
+        return directory
+    digest = hashlib.sha1(os.path.abspath(bank_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(directory, "banks", digest)
+
+
+def load_scheduler(question_ids, learner_id="default", directory=None):
+    """ Loads a learner's review state, or starts fresh if none is saved yet. """
+    path = os.path.join(directory or default_review_dir(), f"{learner_id}.json")
+    # Unseen cards are all due at once; shuffling the bank order interleaves new questions across categories.
+    question_ids = list(question_ids)
+    random.shuffle(question_ids)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return ReviewScheduler.from_dict(question_ids, json.load(f))
+    except FileNotFoundError:
+        return ReviewScheduler(question_ids)
+
+
+def save_scheduler(scheduler, learner_id="default", directory=None):
+    directory = directory or default_review_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{learner_id}.json")
+    # Write to a temporary file first so a crash never leaves a half-written state file.
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(scheduler.to_dict(), f)
+    os.replace(path + ".tmp", path)
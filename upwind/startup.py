@@ -0,0 +1,99 @@
+"""
+upwind/startup.py
+
+Startup timing and background loading for the Tkinter app.
+
+StartupTimer starts counting when this module is first imported (the app imports it
+before its other modules) and records named marks, in particular time-to-first-frame
+(the splash screen is on screen) and time-to-interactive (the main menu is ready), and
+checks them against a startup budget. A startup that fails (the loader raised) is
+recorded too, so --exit-after-startup can report it.
+
+run_in_background() runs a loader on a worker thread and hands its result (or its
+error) to the Tk thread by polling with after(), so Tk is only ever touched from the
+main thread.
+"""
+
+import json
+import queue
+import sys
+import threading
+import time
+
+_IMPORTED_AT = time.perf_counter()
+
+FIRST_FRAME = "first_frame"
+INTERACTIVE = "interactive"
+DEFAULT_POLL_MS = 15
+
+
+class StartupTimer:
+    def __init__(self, budget_ms=None, started_at=None):
+        self.budget_ms = budget_ms
+        self.started_at = _IMPORTED_AT if started_at is None else started_at
+        self.marks = {}  # name -> milliseconds since start
+        self.error = None  # Set by fail() when loading failed
+
+    def mark(self, name):
+        """ Records the first time name is reached; later calls keep the first value. """
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.started_at) * 1000
+        return self.marks[name]
+
+    def fail(self, error):
+        """ Records that startup failed with error; the app never becomes interactive. """
+        self.error = f"{type(error).__name__}: {error}"
+
+    def over_budget(self):
+        interactive = self.marks.get(INTERACTIVE)
+        return self.budget_ms is not None and (interactive is None or interactive > self.budget_ms)
+
+    def summary(self):
+        parts = [f"{name.replace('_', ' ')} {value:.0f} ms" for name, value in self.marks.items()]
+        text = "Startup: " + ", ".join(parts)
+        if self.budget_ms is not None:
+            text += f" (budget {self.budget_ms:.0f} ms{', EXCEEDED' if self.over_budget() else ''})"
+        if self.error is not None:
+            text += f" FAILED: {self.error}"
+        return text
+
+    def to_dict(self):
+        return {"marks_ms": {name: round(value, 2) for name, value in self.marks.items()},
+                "budget_ms": self.budget_ms, "over_budget": self.over_budget(), "error": self.error}
+
+    def report(self, stream=None, json_path=None):
+        print(self.summary(), file=stream or sys.stderr)
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=1)
+
+
+def run_in_background(master, work, on_done, on_error=None, poll_ms=DEFAULT_POLL_MS):
+    """
+    Calls work() on a daemon thread and then on_done(result) on the Tk thread. An exception
+    raised by work() is passed to on_error(error) on the Tk thread; without on_error it is
+    re-raised there, where Tk reports it like any callback error.
+    """
+    results = queue.Queue(maxsize=1)
+
+    def target():
+        try:
+            results.put((True, work()))
+        except BaseException as error:
+            results.put((False, error))
+
+    def poll():
+        try:
+            succeeded, value = results.get_nowait()
+        except queue.Empty:
+            master.after(poll_ms, poll)
+            return
+        if not succeeded:
+            if on_error is None:
+                raise value
+            on_error(value)
+            return
+        on_done(value)
+
+    threading.Thread(target=target, name="upwind-loader", daemon=True).start()
+    master.after(poll_ms, poll)
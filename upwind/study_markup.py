@@ -0,0 +1,187 @@
+"""
+upwind/study_markup.py
+
+Lightweight markup for the study topics, and streaming display in a Tk Text widget.
+
+The markup follows how the topics are already written, so existing text needs no
+changes:
+    - a top-level line ending in ":" (or starting with "# ") is a heading,
+    - a line indented by four spaces is a bullet, eight spaces a sub-bullet
+      ("- " or "* " at the start of a line also makes a bullet),
+    - "1. text" is a numbered item,
+    - **bold** and *italic* mark emphasis, and the short "Term:" that opens a list
+      item is shown in bold,
+    - any other line is a paragraph, and blank lines are kept as spacing.
+
+parse_study_markup() returns Blocks, and study_text_sections() turns them into sections
+of alternating text and tag arguments for Text.insert(). Both are cached by the topic
+text, so a topic is parsed once per session however often it is opened.
+
+stream_sections() inserts the first screenful at once and the rest in chunks through
+after(), so the page appears immediately and the event loop never blocks on a long
+topic.
+"""
+
+import functools
+import re
+import tkinter as tk
+
+INDENT_WIDTH = 4
+MAX_BULLET_LEVEL = 3
+HEADING_MAX_LENGTH = 100
+LEAD_IN_MAX_LENGTH = 40
+PARSE_CACHE_SIZE = 64
+FIRST_CHUNK_CHARS = 3000  # About a screenful of body text
+CHUNK_CHARS = 6000
+CHUNK_DELAY_MS = 1
+BULLET = "•"
+
+_NUMBERED_PATTERN = re.compile(r"(\d+)\.\s+(.*)")
+_BULLET_MARKER_PATTERN = re.compile(r"[-*]\s+(.*)")
+_EMPHASIS_PATTERN = re.compile(r"\*\*(.+?)\*\*|\*(?!\s)(.+?)(?<!\s)\*")
+_LEAD_IN_PATTERN = re.compile(r"([^:.()\"]{1,%d}:)(\s+.*)" % LEAD_IN_MAX_LENGTH)
+
+
+class Block:
+    """
+    One line of a topic. kind is heading, paragraph, bullet, numbered or blank; runs are
+    (text, emphasis) pairs; level is the indent level of a list item.
+    """
+
+    __slots__ = ("kind", "level", "label", "runs")
+
+    def __init__(self, kind, runs=(), level=0, label=""):
+        self.kind = kind
+        self.runs = tuple(runs)
+        self.level = level
+        self.label = label
+
+    @property
+    def text(self):
+        return "".join(text for text, _ in self.runs)
+
+
+def parse_inline(text):
+    """ Splits text into (text, emphasis) runs, emphasis being "", "bold" or "italic". """
+    runs = []
+    position = 0
+    for match in _EMPHASIS_PATTERN.finditer(text):
+        if match.start() > position:
+            runs.append((text[position:match.start()], ""))
+        if match.group(1) is not None:
+            runs.append((match.group(1), "bold"))
+        else:
+            runs.append((match.group(2), "italic"))
+        position = match.end()
+    if position < len(text):
+        runs.append((text[position:], ""))
+    return runs
+
+
+def _list_item_runs(text):
+    """ Inline runs for a list item, with a short leading "Term:" in bold. """
+    match = _LEAD_IN_PATTERN.fullmatch(text)
+    if match is None or "*" in match.group(1):
+        return parse_inline(text)
+    return [(match.group(1), "bold")] + parse_inline(match.group(2))
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_study_markup(text):
+    """ Parses a study topic into a tuple of Blocks. """
+    blocks = []
+    for line in text.strip("\n").split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            if blocks and blocks[-1].kind != "blank":
+                blocks.append(Block("blank"))
+            continue
+        indent = len(line) - len(line.lstrip(" "))
+        level = min(indent // INDENT_WIDTH, MAX_BULLET_LEVEL)
+        numbered = _NUMBERED_PATTERN.fullmatch(stripped)
+        marker = _BULLET_MARKER_PATTERN.fullmatch(stripped)
+        if stripped.startswith("# "):
+            blocks.append(Block("heading", parse_inline(stripped[2:])))
+        elif numbered:
+            blocks.append(Block("numbered", _list_item_runs(numbered.group(2)), level, numbered.group(1) + "."))
+        elif marker:
+            blocks.append(Block("bullet", _list_item_runs(marker.group(1)), min(level + 1, MAX_BULLET_LEVEL)))
+        elif level:
+            blocks.append(Block("bullet", _list_item_runs(stripped), level))
+        elif stripped.endswith(":") and len(stripped) <= HEADING_MAX_LENGTH:
+            blocks.append(Block("heading", parse_inline(stripped)))
+        else:
+            blocks.append(Block("paragraph", parse_inline(stripped)))
+    while blocks and blocks[-1].kind == "blank":
+        blocks.pop()
+    return tuple(blocks)
+
+
+def _block_arguments(block):
+    if block.kind == "blank":
+        return ("\n", "")
+    if block.kind == "heading":
+        line_tag = "heading"
+        arguments = []
+    elif block.kind == "paragraph":
+        line_tag = "paragraph"
+        arguments = []
+    else:
+        line_tag = f"bullet{block.level}"
+        arguments = [f"{block.label or BULLET}\t", line_tag]
+    for text, emphasis in block.runs:
+        arguments += [text, (line_tag, emphasis) if emphasis else line_tag]
+    arguments += ["\n", line_tag]
+    return tuple(arguments)
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def study_text_sections(text):
+    """
+    The topic as a tuple of sections, one per block, each a tuple of (text, tags, ...)
+    arguments for Text.insert(). Tags: heading, paragraph, bullet0..bullet3 (list
+    items by indent level), bold, italic.
+    """
+    return tuple(_block_arguments(block) for block in parse_study_markup(text))
+
+
+def stream_sections(text_widget, sections, on_done=None, first_chars=FIRST_CHUNK_CHARS, chunk_chars=CHUNK_CHARS,
+                    delay_ms=CHUNK_DELAY_MS):
+    """
+    Appends sections to a Text widget: about first_chars of text right away, the rest in
+    chunks of about chunk_chars scheduled with after(). The widget is left disabled
+    between chunks. Calls on_done() after the last chunk; stops quietly if the widget is
+    destroyed first.
+    """
+    position = 0
+
+    def insert_chunk(limit):
+        nonlocal position
+        arguments, size = [], 0
+        while position < len(sections) and (size < limit or not arguments):
+            section = sections[position]
+            arguments.extend(section)
+            size += sum(len(text) for text in section[0::2])
+            position += 1
+        text_widget.configure(state=tk.NORMAL)
+        if arguments:
+            text_widget.insert(tk.END, *arguments)
+        text_widget.configure(state=tk.DISABLED)
+
+    def next_chunk():
+        try:
+            if not text_widget.winfo_exists():
+                return
+            insert_chunk(chunk_chars)
+        except tk.TclError:
+            return  # The page was closed while streaming
+        schedule()
+
+    def schedule():
+        if position < len(sections):
+            text_widget.after(delay_ms, next_chunk)
+        elif on_done is not None:
+            on_done()
+
+    insert_chunk(first_chars)
+    schedule()
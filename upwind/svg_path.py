@@ -0,0 +1,216 @@
+"""
+upwind/svg_path.py
+
+SVG path data ("d" attribute) parser and flattener.
+
+Supports every path command (M, L, H, V, C, S, Q, T, A, Z, absolute and relative, with
+implicit repeats) and turns each subpath into a polyline. Curves are flattened to a
+tolerance instead of a fixed step count: a Bezier curve drawn as n equal parameter steps
+deviates from the curve by at most M / (8 n^2), where M bounds the length of its second
+derivative, so n is solved for directly and never overshoots on short or flat curves.
+Elliptical arcs use the same chord-error rule as the ellipses in geometry.
+
+The command and number patterns are compiled once and the path is scanned in a single
+pass, so multi-thousand-command exports parse in linear time.
+"""
+
+import math
+import re
+
+from upwind.geometry import DEFAULT_TOLERANCE, segments_for_radius
+
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_SEPARATOR = r"[\s,]*"
+_COMMAND_PATTERN = re.compile(r"([MmLlHhVvCcSsQqTtAaZz])([^MmLlHhVvCcSsQqTtAaZz]*)")
+_NUMBER_PATTERN = re.compile(_NUMBER)
+# Arc flags are single digits and may be written without separators ("a5 5 0 0010 10").
+_ARC_PATTERN = re.compile(_SEPARATOR.join([f"({_NUMBER})"] * 3 + ["([01])"] * 2 + [f"({_NUMBER})"] * 2))
+
+_ARGUMENT_COUNTS = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+MAX_CURVE_SEGMENTS = 256
+
+
+class Subpath:
+    """ One flattened subpath: a flat coordinate list and whether it was closed with Z. """
+
+    __slots__ = ("coords", "closed")
+
+    def __init__(self, x, y):
+        self.coords = [x, y]
+        self.closed = False
+
+    def __len__(self):
+        return len(self.coords) // 2
+
+
+def _curve_segments(second_derivative_bound, tolerance):
+    if second_derivative_bound <= 8.0 * tolerance:
+        return 1
+    return min(math.ceil(math.sqrt(second_derivative_bound / (8.0 * tolerance))), MAX_CURVE_SEGMENTS)
+
+
+def _flatten_cubic(coords, x0, y0, x1, y1, x2, y2, x3, y3, tolerance):
+    bound = 6.0 * max(math.hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2), math.hypot(x1 - 2 * x2 + x3, y1 - 2 * y2 + y3))
+    segments = _curve_segments(bound, tolerance)
+    for i in range(1, segments + 1):
+        t = i / segments
+        u = 1.0 - t
+        a, b, c, d = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+        coords += (a * x0 + b * x1 + c * x2 + d * x3, a * y0 + b * y1 + c * y2 + d * y3)
+
+
+def _flatten_quadratic(coords, x0, y0, x1, y1, x2, y2, tolerance):
+    segments = _curve_segments(2.0 * math.hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2), tolerance)
+    for i in range(1, segments + 1):
+        t = i / segments
+        u = 1.0 - t
+        a, b, c = u * u, 2 * u * t, t * t
+        coords += (a * x0 + b * x1 + c * x2, a * y0 + b * y1 + c * y2)
+
+
+def _flatten_arc(coords, x0, y0, rx, ry, rotation, large_arc, sweep, x, y, tolerance):
+    """ Endpoint-to-center conversion from the SVG spec (appendix F.6), then even angular steps. """
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or (x0 == x and y0 == y):
+        if x0 != x or y0 != y:
+            coords += (x, y)
+        return
+    phi = math.radians(rotation % 360.0)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x0 - x) / 2.0, (y0 - y) / 2.0
+    x1p, y1p = cos_phi * dx + sin_phi * dy, -sin_phi * dx + cos_phi * dy
+    # Radii too small to span the endpoints are scaled up just enough.
+    radii_check = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if radii_check > 1.0:
+        rx, ry = rx * math.sqrt(radii_check), ry * math.sqrt(radii_check)
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    factor = math.sqrt(max(numerator, 0.0) / denominator) if denominator else 0.0
+    if large_arc == sweep:
+        factor = -factor
+    cxp, cyp = factor * rx * y1p / ry, -factor * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x0 + x) / 2.0
+    cy = sin_phi * cxp + cos_phi * cyp + (y0 + y) / 2.0
+    start = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    sweep_angle = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx) - start
+    if sweep and sweep_angle < 0:
+        sweep_angle += 2 * math.pi
+    elif not sweep and sweep_angle > 0:
+        sweep_angle -= 2 * math.pi
+    full_circle = segments_for_radius(max(rx, ry), tolerance)
+    segments = max(1, math.ceil(full_circle * abs(sweep_angle) / (2 * math.pi)))
+    for i in range(1, segments):
+        angle = start + sweep_angle * i / segments
+        ex, ey = rx * math.cos(angle), ry * math.sin(angle)
+        coords += (cos_phi * ex - sin_phi * ey + cx, sin_phi * ex + cos_phi * ey + cy)
+    coords += (x, y)  # Land exactly on the endpoint
+
+
+def _arguments(command, args_str):
+    if command in "Aa":
+        values = []
+        for match in _ARC_PATTERN.finditer(args_str):
+            values.extend(float(value) for value in match.groups())
+        return values
+    return [float(value) for value in _NUMBER_PATTERN.findall(args_str)]
+
+
+def flatten_path(d_string, tolerance=DEFAULT_TOLERANCE):
+    """
+    Parses SVG path data into a list of Subpaths. tolerance is the largest allowed distance
+    between a curve and its polyline, in path units (divide a pixel tolerance by the
+    drawing scale).
+    """
+    subpaths = []
+    subpath = None
+    x = y = start_x = start_y = 0.0
+    control_x = control_y = None  # Last control point, for S/T reflection
+    previous = ""
+    for match in _COMMAND_PATTERN.finditer(d_string):
+        command = match.group(1)
+        upper = command.upper()
+        relative = command != upper
+        values = _arguments(command, match.group(2))
+        count = _ARGUMENT_COUNTS[upper]
+
+        if upper == "Z":
+            if subpath is not None:
+                subpath.closed = True
+                x, y = start_x, start_y
+                subpath = None
+            previous, control_x = "Z", None
+            continue
+
+        for offset in range(0, len(values) - count + 1, count):
+            args = values[offset:offset + count]
+            if upper == "M" and offset > 0:
+                upper = "L"  # Extra pairs after a moveto are implicit linetos
+            if subpath is None and upper != "M":
+                subpath = Subpath(x, y)
+                subpaths.append(subpath)
+            coords = subpath.coords if subpath is not None else None
+            dx, dy = (x, y) if relative else (0.0, 0.0)
+
+            if upper == "M":
+                x, y = args[0] + dx, args[1] + dy
+                start_x, start_y = x, y
+                subpath = Subpath(x, y)
+                subpaths.append(subpath)
+                control_x = None
+            elif upper == "L":
+                x, y = args[0] + dx, args[1] + dy
+                coords += (x, y)
+                control_x = None
+            elif upper == "H":
+                x = args[0] + dx
+                coords += (x, y)
+                control_x = None
+            elif upper == "V":
+                y = args[0] + dy
+                coords += (x, y)
+                control_x = None
+            elif upper in "CS":
+                if upper == "C":
+                    x1, y1 = args[0] + dx, args[1] + dy
+                    rest = args[2:]
+                elif previous in ("C", "S") and control_x is not None:
+                    x1, y1 = 2 * x - control_x, 2 * y - control_y
+                    rest = args
+                else:
+                    x1, y1 = x, y
+                    rest = args
+                x2, y2, x3, y3 = rest[0] + dx, rest[1] + dy, rest[2] + dx, rest[3] + dy
+                _flatten_cubic(coords, x, y, x1, y1, x2, y2, x3, y3, tolerance)
+                control_x, control_y = x2, y2
+                x, y = x3, y3
+            elif upper in "QT":
+                if upper == "Q":
+                    x1, y1 = args[0] + dx, args[1] + dy
+                    x2, y2 = args[2] + dx, args[3] + dy
+                else:
+                    if previous in ("Q", "T") and control_x is not None:
+                        x1, y1 = 2 * x - control_x, 2 * y - control_y
+                    else:
+                        x1, y1 = x, y
+                    x2, y2 = args[0] + dx, args[1] + dy
+                _flatten_quadratic(coords, x, y, x1, y1, x2, y2, tolerance)
+                control_x, control_y = x1, y1
+                x, y = x2, y2
+            elif upper == "A":
+                end_x, end_y = args[5] + dx, args[6] + dy
+                _flatten_arc(coords, x, y, args[0], args[1], args[2], args[3] != 0, args[4] != 0, end_x, end_y, tolerance)
+                x, y = end_x, end_y
+                control_x = None
+            previous = upper
+    return subpaths
+
+
+def parse_svg_path_d(d_string, tolerance=DEFAULT_TOLERANCE):
+    """ Returns every point of the flattened path as (x, y) tuples, subpaths concatenated. """
+    points = []
+    for subpath in flatten_path(d_string, tolerance):
+        coords = subpath.coords
+        points.extend(zip(coords[0::2], coords[1::2]))
+        if subpath.closed:
+            points.append((coords[0], coords[1]))
+    return points
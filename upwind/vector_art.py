@@ -0,0 +1,192 @@
+"""
+upwind/vector_art.py
+
+Static vector art (simplified SVG element data) for Tkinter canvases.
+
+Element data is compiled once into a display list: styles resolved, transforms applied
+and every shape reduced to a flat coordinate tuple plus canvas options. Display lists
+are cached by content, offset and scale, so redrawing a piece of art (e.g. the logo on
+every trip back to the main menu) only issues the canvas create_* calls.
+
+Usage:
+    art = VectorArt(elements)               # elements: [{'type': 'path', 'd': ..., 'style': ...}, ...]
+    art.draw(canvas, x_offset=6, y_offset=6)
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+
+from upwind import geometry
+from upwind.svg_path import flatten_path
+
+DISPLAY_LIST_CACHE_SIZE = 64
+
+_display_lists = OrderedDict()  # (content key, x_offset, y_offset, scale) -> DisplayList
+
+
+def hex_to_rgb(hex_color):
+    return hex_color
+
+
+def parse_style_string(style_str):
+    styles = {}
+    if style_str:
+        for part in style_str.split(';'):
+            if ':' in part:
+                key, value = part.split(':', 1)
+                styles[key.strip()] = value.strip()
+    return styles
+
+
+def parse_transform_matrix(transform_str):
+    match = re.match(r'matrix\(([^)]*)\)', transform_str)
+    if match:
+        values = [float(x) for x in re.split(r'[,\s]+', match.group(1).strip())]
+        if len(values) == 6:
+            return values
+    return [1.0, 0.0, 0.0, 1.0, 0.0, 0.0]
+
+
+class DisplayList:
+    """ Ready-to-draw canvas items: (create method name, flat coordinates, options) tuples. """
+
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = tuple(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def draw(self, canvas, **extra_options):
+        """ Issues one canvas call per item; extra_options (e.g. tags) are added to every item. """
+        for method, coords, options in self.items:
+            getattr(canvas, method)(coords, **options, **extra_options)
+
+    def fingerprint(self):
+        return hashlib.blake2b(repr(self.items).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RecordingCanvas:
+    """
+    Stands in for a Canvas and records every create_* call, so existing drawing code can be
+    compiled into a DisplayList (and replayed, rasterized or exported) without changes.
+    """
+
+    def __init__(self):
+        self.items = []
+
+    def __getattr__(self, name):
+        if not name.startswith("create_"):
+            raise AttributeError(name)
+
+        def record(*coords, **options):
+            flat = []
+            for value in coords:
+                if isinstance(value, (list, tuple)):
+                    flat.extend(value)
+                else:
+                    flat.append(value)
+            self.items.append((name, tuple(flat), options))
+        return record
+
+    def display_list(self):
+        return DisplayList(self.items)
+
+
+def _resolve_style(style_str):
+    styles = parse_style_string(style_str)
+    fill_color = hex_to_rgb(styles.get('fill', ''))
+    stroke_color = hex_to_rgb(styles.get('stroke', ''))
+    stroke_width = float(styles.get('stroke-width', 1.0))
+    if styles.get('stroke') == 'none': stroke_color = ''
+    if styles.get('fill') == 'none': fill_color = ''
+    return fill_color, stroke_color, stroke_width
+
+
+def compile_svg_elements(svg_elements_data, x_offset=0, y_offset=0, scale=1.0, tolerance=geometry.DEFAULT_TOLERANCE):
+    """
+    Compiles simplified SVG elements into a DisplayList placed at (x_offset, y_offset) and
+    scaled by scale. Curves are tessellated to within tolerance pixels at that scale.
+    """
+    place = geometry.placement(x_offset, y_offset, scale)
+    items = []
+    for element in svg_elements_data:
+        element_type = element['type']
+        fill_color, stroke_color, stroke_width = _resolve_style(element['style'])
+        width = stroke_width * scale
+
+        if element_type == 'circle':
+            cx, cy, r = float(element['cx']), float(element['cy']), float(element['r'])
+            coords = geometry.transform_coords((cx - r, cy - r, cx + r, cy + r), place)
+            items.append(("create_oval", coords, {"fill": fill_color, "outline": stroke_color, "width": width}))
+
+        elif element_type == 'ellipse':
+            cx, cy, rx, ry = float(element['cx']), float(element['cy']), float(element['rx']), float(element['ry'])
+            matrix = geometry.compose(place, parse_transform_matrix(element.get('transform', '')))
+            coords = geometry.ellipse_coords(cx, cy, rx, ry, matrix, tolerance)
+            items.append(("create_polygon", coords,
+                          {"fill": fill_color, "outline": stroke_color, "width": width, "smooth": False}))
+
+        elif element_type == 'path':
+            path_tolerance = tolerance / scale if scale else tolerance
+            for subpath in flatten_path(element['d'], path_tolerance):
+                coords = geometry.transform_coords(subpath.coords, place)
+                if fill_color and len(subpath) >= 3:
+                    items.append(("create_polygon", coords,
+                                  {"fill": fill_color, "outline": stroke_color, "width": width, "joinstyle": "round"}))
+                elif len(subpath) >= 2 and stroke_color:
+                    if subpath.closed:
+                        coords += coords[:2]
+                    items.append(("create_line", coords,
+                                  {"fill": stroke_color, "width": width, "joinstyle": "round", "capstyle": "round"}))
+    return DisplayList(items)
+
+
+def content_key(svg_elements_data):
+    """ Fingerprint of element data; equal content gives equal keys however the data was built. """
+    canonical = repr([sorted(element.items()) for element in svg_elements_data])
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_display_list(svg_elements_data, x_offset=0, y_offset=0, scale=1.0, key=None):
+    """ Returns the cached DisplayList for this content and placement, compiling it on first use. """
+    cache_key = (key or content_key(svg_elements_data), x_offset, y_offset, scale)
+    display_list = _display_lists.get(cache_key)
+    if display_list is None:
+        display_list = _display_lists[cache_key] = compile_svg_elements(svg_elements_data, x_offset, y_offset, scale)
+        if len(_display_lists) > DISPLAY_LIST_CACHE_SIZE:
+            _display_lists.popitem(last=False)
+    else:
+        _display_lists.move_to_end(cache_key)
+    return display_list
+
+
+def clear_display_list_cache():
+    _display_lists.clear()
+
+
+def draw_svg_elements_on_tkinter(canvas, svg_elements_data, x_offset=0, y_offset=0, scale=1.0):
+    """
+    Draws a list of simplified SVG elements onto a Tkinter Canvas,
+    applying an offset to all coordinates.
+    """
+    get_display_list(svg_elements_data, x_offset, y_offset, scale).draw(canvas)
+
+
+class VectorArt:
+    """
+    A piece of static vector art. The element data is copied and fingerprinted once, so
+    drawing never re-hashes or re-parses it.
+    """
+
+    def __init__(self, svg_elements_data):
+        self.elements = tuple(dict(element) for element in svg_elements_data)
+        self.key = content_key(self.elements)
+
+    def display_list(self, x_offset=0, y_offset=0, scale=1.0):
+        return get_display_list(self.elements, x_offset, y_offset, scale, key=self.key)
+
+    def draw(self, canvas, x_offset=0, y_offset=0, scale=1.0, **extra_options):
+        self.display_list(x_offset, y_offset, scale).draw(canvas, **extra_options)
@@ -0,0 +1,91 @@
+"""
+upwind/view_manager.py
+
+Retained screens for the Tkinter app. Each screen is built once into its own frame and
+later visits just swap frames with pack_forget()/pack(), which costs a fraction of a
+millisecond instead of destroying and recreating every widget (and redrawing every
+canvas). The number of retained screens is bounded; the least recently shown one is
+destroyed first.
+
+Screens whose content depends on changing state (quiz questions, results, search hits)
+are shown with show_transient(): they are built fresh every time and destroyed as soon
+as another screen is shown. Retained screens that go stale are dropped with invalidate().
+"""
+
+import tkinter as tk
+from collections import OrderedDict
+
+DEFAULT_MAX_VIEWS = 12
+
+
+class ViewManager:
+    def __init__(self, container, max_views=DEFAULT_MAX_VIEWS, **frame_options):
+        self.container = container
+        self.max_views = max(max_views, 1)
+        self.frame_options = frame_options
+        self.views = OrderedDict()  # key -> frame, least recently shown first
+        self.current_key = None
+        self.current_frame = None
+
+    def _new_frame(self, build):
+        frame = tk.Frame(self.container, **self.frame_options)
+        if build is not None:
+            build(frame)
+        return frame
+
+    def _hide_current(self):
+        if self.current_frame is None:
+            return
+        if self.current_key is None:
+            self.current_frame.destroy()  # Transient screens are never reused
+        else:
+            self.current_frame.pack_forget()
+        self.current_key = self.current_frame = None
+
+    def show(self, key, build):
+        """ Shows the screen for key, calling build(frame) to create it only if it is not retained. """
+        if key == self.current_key and self.current_frame is not None:
+            return self.current_frame
+        self._hide_current()
+        frame = self.views.get(key)
+        if frame is None:
+            frame = self.views[key] = self._new_frame(build)
+            self._evict()
+        else:
+            self.views.move_to_end(key)
+        frame.pack(fill="both", expand=True)
+        self.current_key, self.current_frame = key, frame
+        return frame
+
+    def show_transient(self, build=None):
+        """
+        Shows a screen that is destroyed when the next screen is shown. Without build, the
+        empty frame is returned for the caller to fill.
+        """
+        self._hide_current()
+        frame = self._new_frame(build)
+        frame.pack(fill="both", expand=True)
+        self.current_frame = frame
+        return frame
+
+    def _evict(self):
+        while len(self.views) > self.max_views:
+            key, frame = next(iter(self.views.items()))
+            if key == self.current_key:
+                self.views.move_to_end(key)
+                continue
+            del self.views[key]
+            frame.destroy()
+
+    def invalidate(self, predicate=None):
+        """
+        Drops retained screens so they are rebuilt on their next visit: all of them, or
+        those whose key satisfies predicate. A dropped screen that is showing stays up
+        until the next navigation.
+        """
+        for key in [key for key in self.views if predicate is None or predicate(key)]:
+            frame = self.views.pop(key)
+            if key == self.current_key:
+                self.current_key = None  # Destroyed when hidden, like a transient screen
+            else:
+                frame.destroy()